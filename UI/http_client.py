@@ -0,0 +1,64 @@
+"""
+HTTP client for talking to the MTG Tournament Tracker API.
+
+One ``requests.Session`` is shared by every fetch so TCP (and TLS)
+connections to the API are kept alive and reused instead of being opened
+per request. Kept free of Streamlit so scripts can build the same client.
+"""
+
+import os
+from typing import Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds
+HTTP_TIMEOUT: Tuple[float, float] = (
+    float(os.getenv("API_CONNECT_TIMEOUT", "3.05")),
+    float(os.getenv("API_READ_TIMEOUT", "30")),
+)
+HTTP_RETRIES = int(os.getenv("API_RETRIES", "3"))
+HTTP_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "10"))
+HTTP_GZIP = os.getenv("API_GZIP", "true").lower() in ("1", "true", "yes")
+
+
+class TimeoutSession(requests.Session):
+    """Session that applies a default timeout to every request."""
+
+    def __init__(self, timeout: Tuple[float, float] = HTTP_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(
+    pool_size: int = HTTP_POOL_SIZE,
+    retries: int = HTTP_RETRIES,
+    gzip: bool = HTTP_GZIP,
+    timeout: Tuple[float, float] = HTTP_TIMEOUT,
+) -> requests.Session:
+    """
+    Build a pooled keep-alive session.
+
+    Idempotent requests are retried with exponential backoff (0.3s, 0.6s,
+    1.2s, ...) on connection errors and 502/503/504 responses; once retries
+    run out the last response is returned so ``raise_for_status`` reports it.
+    With ``gzip`` the API is asked for compressed bodies (decoded
+    transparently), otherwise responses are requested uncompressed.
+    """
+    session = TimeoutSession(timeout)
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate" if gzip else "identity"
+    return session
@@ -4,16 +4,21 @@
 """
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import requests
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from typing import List, Dict, Optional
 from translations import t, TRANSLATIONS
+from http_client import create_session
 
 # Configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "6"))
 
 # Initialize session state for language
 if 'language' not in st.session_state:
@@ -51,15 +56,66 @@
 
 
 # API Functions
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Pooled keep-alive session with retries and timeouts, shared across sessions and reruns."""
+    return create_session()
+
+
+@st.cache_resource
+def _etag_store() -> Dict[str, tuple]:
+    """Last ETag and body per URL, shared across sessions and reruns."""
+    return {}
+
+
+def fetch_json(path: str, params: Optional[Dict] = None):
+    """
+    GET an API resource, revalidating with If-None-Match.
+
+    When the API answers 304 Not Modified the previously received body is
+    reused instead of downloading and parsing it again.
+    """
+    url = f"{API_BASE_URL}{path}"
+    key = url if not params else f"{url}?{sorted(params.items())}"
+    store = _etag_store()
+    cached = store.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    
+    response = get_http_session().get(url, params=params, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached[1]
+    response.raise_for_status()
+    data = response.json()
+    
+    etag = response.headers.get("ETag")
+    if etag:
+        store[key] = (etag, data)
+    return data
+
+
+_prefetch = threading.local()
+
+
+def report_error(message: str, error: Exception):
+    """
+    Show a fetch error in the page.
+
+    During ``prefetch_season`` the error is raised instead, so the failed
+    call is not cached as an empty result and the tab that needs the data
+    retries it and shows the error itself.
+    """
+    if getattr(_prefetch, "active", False):
+        raise error
+    st.error(f"{message}: {error}")
+
+
 @st.cache_data(ttl=60)
 def get_seasons() -> List[Dict]:
     """Fetch all seasons from API."""
     try:
-        response = requests.get(f"{API_BASE_URL}/seasons")
-        response.raise_for_status()
-        return response.json()
+        return fetch_json("/seasons")
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching seasons: {e}")
+        report_error("Error fetching seasons", e)
         return []
 
 
@@ -68,13 +124,10 @@ def get_season_standings(season_id: Optional[int] = None) -> List[Dict]:
     """Fetch season standings from API."""
     try:
         if season_id:
-            response = requests.get(f"{API_BASE_URL}/stats/season-standings/{season_id}")
-        else:
-            response = requests.get(f"{API_BASE_URL}/stats/season-standings")
-        response.raise_for_status()
-        return response.json()
+            return fetch_json(f"/stats/season-standings/{season_id}")
+        return fetch_json("/stats/season-standings")
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching season standings: {e}")
+        report_error("Error fetching season standings", e)
         return []
 
 
@@ -82,11 +135,9 @@ def get_season_standings(season_id: Optional[int] = None) -> List[Dict]:
 def get_deck_statistics() -> List[Dict]:
     """Fetch deck statistics from API."""
     try:
-        response = requests.get(f"{API_BASE_URL}/stats/decks")
-        response.raise_for_status()
-        return response.json()
+        return fetch_json("/stats/decks")
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching deck statistics: {e}")
+        report_error("Error fetching deck statistics", e)
         return []
 
 
@@ -95,13 +146,10 @@ def get_tournaments(season_id: Optional[int] = None) -> List[Dict]:
     """Fetch tournaments from API."""
     try:
         if season_id:
-            response = requests.get(f"{API_BASE_URL}/tournaments?season_id={season_id}")
-        else:
-            response = requests.get(f"{API_BASE_URL}/tournaments")
-        response.raise_for_status()
-        return response.json()
+            return fetch_json("/tournaments", params={"season_id": season_id})
+        return fetch_json("/tournaments")
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching tournaments: {e}")
+        report_error("Error fetching tournaments", e)
         return []
 
 
@@ -109,38 +157,22 @@ def get_tournaments(season_id: Optional[int] = None) -> List[Dict]:
 def get_match_details(match_id: int) -> Dict:
     """Fetch detailed match information including games."""
     try:
-        response = requests.get(f"{API_BASE_URL}/matches/{match_id}")
-        response.raise_for_status()
-        return response.json()
+        return fetch_json(f"/matches/{match_id}")
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching match details: {e}")
+        report_error("Error fetching match details", e)
         return {}
 
 
 @st.cache_data(ttl=60)
 def get_tournament_matches(tournament_id: int) -> List[Dict]:
-    """Fetch matches for a specific tournament with game details."""
+    """Fetch all matches for a tournament with games and winners in a single request."""
     try:
-        response = requests.get(f"{API_BASE_URL}/matches?tournament_id={tournament_id}")
-        response.raise_for_status()
-        matches = response.json()
-        
-        # Fetch detailed info for each match to get games
-        detailed_matches = []
-        for match in matches:
-            match_id = match.get('id')
-            if match_id:
-                detailed_match = get_match_details(match_id)
-                if detailed_match:
-                    detailed_matches.append(detailed_match)
-                else:
-                    detailed_matches.append(match)
-            else:
-                detailed_matches.append(match)
+        results = fetch_json(f"/tournaments/{tournament_id}/results")
         
-        return detailed_matches
+        # Flatten rounds into a single match list
+        return [match for round_data in results.get('rounds', []) for match in round_data.get('matches', [])]
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching tournament matches: {e}")
+        report_error("Error fetching tournament matches", e)
         return []
 
 
@@ -148,14 +180,53 @@ def get_tournament_matches(tournament_id: int) -> List[Dict]:
 def get_deck_matchups() -> List[Dict]:
     """Fetch all deck matchup statistics."""
     try:
-        response = requests.get(f"{API_BASE_URL}/stats/matchups")
-        response.raise_for_status()
-        return response.json()
+        return fetch_json("/stats/matchups")
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching deck matchups: {e}")
+        report_error("Error fetching deck matchups", e)
         return []
 
 
+@st.cache_resource
+def get_prefetch_pool() -> ThreadPoolExecutor:
+    """Worker threads for ``prefetch_season``, shared across sessions and reruns."""
+    return ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="prefetch")
+
+
+def prefetch_season(season_id: int):
+    """
+    Warm the ``st.cache_data`` entries of every tab for a season in the background.
+
+    Standings, deck statistics, matchups, the season's tournaments and the
+    results of the preselected (first) tournament are fetched in parallel
+    through the shared HTTP session. Nothing is waited for: the active tab
+    renders as soon as its own data is ready, because ``st.cache_data`` makes
+    a call for an entry that is still being fetched wait for that fetch
+    instead of starting another. Switching tabs is then served from cache.
+    Entries that are already cached return immediately. Failures are left for
+    the tab that needs the data to report.
+    """
+    pool = get_prefetch_pool()
+    ctx = get_script_run_ctx()
+    
+    def run(fn, *args):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        _prefetch.active = True
+        try:
+            return fn(*args)
+        finally:
+            _prefetch.active = False
+    
+    def tournament_results():
+        tournaments = get_tournaments(season_id)
+        if tournaments:
+            get_tournament_matches(tournaments[0]['id'])
+    
+    pool.submit(run, get_season_standings, season_id)
+    pool.submit(run, get_deck_statistics)
+    pool.submit(run, get_deck_matchups)
+    pool.submit(run, tournament_results)
+
+
 def display_season_standings(standings: List[Dict], season_name: str):
     """Display season standings as a formatted table."""
     lang = st.session_state.language
@@ -469,45 +540,35 @@ def display_tournament_results(matches: List[Dict], tournament_name: str, lang:
                     with col3:
                         st.markdown(f"**{t('player_2', lang)}** {p2_name}\n\n*Deck: {p2_deck}*")
                     
-                    # Display games and determine match winner
-                    match_winner = None
+                    # Display games
                     games_list = match.get('games', [])
                     
                     if games_list and len(games_list) > 0:
                         st.markdown(f"**Games:**")
                         
-                        p1_wins = 0
-                        p2_wins = 0
-                        
                         for game in games_list:
                             winner_id = game.get('winner_id')
                             game_num = game.get('game_number')
                             duration = game.get('duration_minutes', 'N/A')
                             
-                            # Map winner_id to player name and track wins
+                            # Map winner_id to player name
                             if winner_id == p1_id:
                                 winner_name = p1_name
-                                p1_wins += 1
                             elif winner_id == p2_id:
                                 winner_name = p2_name
-                                p2_wins += 1
                             else:
                                 winner_name = f"Player {winner_id}"
                             
                             # Display each game with winner in green
                             st.success(f"Game {game_num}: Winner - {winner_name} ({duration} min)")
-                        
-                        # Determine overall match winner
-                        if p1_wins > p2_wins:
-                            match_winner = p1_name
-                        elif p2_wins > p1_wins:
-                            match_winner = p2_name
                     else:
                         st.info("No game data available for this match")
                     
-                    # Display match winner
-                    if match_winner:
-                        st.markdown(f"### **{t('match_winner', lang)}** {match_winner}")
+                    # Match result as derived by the API (no winner: a draw once completed)
+                    if match.get('match_winner_id') is not None:
+                        st.markdown(f"### **{t('match_winner', lang)}** {match.get('match_winner_name')}")
+                    elif match.get('match_status') == 'COMPLETED':
+                        st.markdown(f"### **{t('match_draw', lang)}**")
                     
                     st.markdown(f"**{t('status', lang)}** {match.get('match_status', 'Unknown')}")
                     
@@ -596,6 +657,9 @@ def main():
         st.cache_data.clear()
         st.rerun()
     
+    # Start loading every tab's data for the season; the active tab renders first
+    prefetch_season(selected_season_id)
+    
     # Initialize active tab in session state
     if 'active_tab' not in st.session_state:
         st.session_state.active_tab = 0
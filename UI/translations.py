@@ -104,6 +104,7 @@
         'deck_label': 'Deck: {deck}',
         'status': 'Status',
         'match_winner': 'Match Winner',
+        'match_draw': 'Match Drawn',
         'game': 'Game',
         'winner': 'Winner',
         'duration': 'Duration (min)',
@@ -222,6 +223,7 @@
         'deck_label': 'Deck: {deck}',
         'status': 'Estado',
         'match_winner': 'Ganador del Match',
+        'match_draw': 'Match Empatado',
         'game': 'Juego',
         'winner': 'Ganador',
         'duration': 'Duración (min)',
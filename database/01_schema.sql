@@ -8,6 +8,16 @@
 -- ============================================================================
 
 -- Drop existing tables if they exist (in reverse dependency order)
+DROP TABLE IF EXISTS import_jobs CASCADE;
+DROP TABLE IF EXISTS data_version_pending CASCADE;
+DROP TABLE IF EXISTS data_version CASCADE;
+DROP TABLE IF EXISTS player_stat_totals CASCADE;
+DROP TABLE IF EXISTS deck_stat_totals CASCADE;
+DROP TABLE IF EXISTS player_deck_stat_totals CASCADE;
+DROP TABLE IF EXISTS deck_matchup_totals CASCADE;
+DROP TABLE IF EXISTS player_tournament_totals CASCADE;
+DROP TABLE IF EXISTS deck_tournament_totals CASCADE;
+DROP TABLE IF EXISTS match_outcomes CASCADE;
 DROP TABLE IF EXISTS games CASCADE;
 DROP TABLE IF EXISTS matches CASCADE;
 DROP TABLE IF EXISTS deck_archetypes CASCADE;
@@ -77,6 +87,8 @@ CREATE TABLE tournaments (
     location VARCHAR(200),
     format VARCHAR(50), -- e.g., "Standard", "Modern", "Pioneer"
     description TEXT,
+    source_id VARCHAR(100), -- e.g. "melee:396052"
+    content_hash CHAR(64),
     created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP--,
     
@@ -86,6 +98,8 @@ CREATE TABLE tournaments (
 
 COMMENT ON TABLE tournaments IS 'Individual tournaments within a season';
 COMMENT ON COLUMN tournaments.format IS 'MTG format: Standard, Modern, Pioneer, etc.';
+COMMENT ON COLUMN tournaments.source_id IS 'Identifier of the imported export (unique when set)';
+COMMENT ON COLUMN tournaments.content_hash IS 'SHA-256 of the last imported payload, used to skip unchanged re-imports';
 
 -- ============================================================================
 -- PLAYERS TABLE
@@ -179,6 +193,35 @@ COMMENT ON COLUMN games.game_number IS 'Game number within the match (1, 2, or 3
 COMMENT ON COLUMN games.game_result IS 'WIN (winner_id won) or DRAW (tied game)';
 COMMENT ON COLUMN games.winner_id IS 'Player who won this game (or either player if DRAW)';
 
+-- ============================================================================
+-- MATCH_OUTCOMES TABLE
+-- ============================================================================
+-- Persisted match outcomes (one row per match), maintained by the triggers
+-- below so statistics views read precomputed winners instead of
+-- re-aggregating every game on every request
+CREATE TABLE match_outcomes (
+    match_id INTEGER PRIMARY KEY REFERENCES matches(id) ON DELETE CASCADE,
+    -- Copied from matches so outcome changes carry everything needed to
+    -- apply statistic deltas (see 07_stat_totals.sql)
+    tournament_id INTEGER NOT NULL,
+    player1_id INTEGER NOT NULL,
+    player2_id INTEGER NOT NULL,
+    player1_deck_id INTEGER NOT NULL,
+    player2_deck_id INTEGER NOT NULL,
+    match_status VARCHAR(20) NOT NULL,
+    player1_game_wins INTEGER NOT NULL DEFAULT 0,
+    player2_game_wins INTEGER NOT NULL DEFAULT 0,
+    total_games INTEGER NOT NULL DEFAULT 0,
+    match_winner_id INTEGER REFERENCES players(id) ON DELETE RESTRICT,
+    player1_result VARCHAR(10) NOT NULL,
+    player2_result VARCHAR(10) NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE match_outcomes IS 'Precomputed best-of-3 match outcomes, maintained by triggers on games and matches';
+COMMENT ON COLUMN match_outcomes.player1_result IS 'WIN, LOSS, DRAW or INCOMPLETE from player 1 perspective';
+COMMENT ON COLUMN match_outcomes.player2_result IS 'WIN, LOSS, DRAW or INCOMPLETE from player 2 perspective';
+
 -- ============================================================================
 -- HELPER FUNCTION: Update timestamp on row modification
 -- ============================================================================
@@ -223,6 +266,143 @@ CREATE TRIGGER update_matches_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- ============================================================================
+-- MATCH OUTCOME MAINTENANCE
+-- ============================================================================
+-- Recompute outcomes for a set of matches (first player to 2 game wins)
+CREATE OR REPLACE FUNCTION refresh_match_outcomes(p_match_ids INTEGER[])
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO match_outcomes (
+        match_id, tournament_id, player1_id, player2_id, player1_deck_id,
+        player2_deck_id, match_status, player1_game_wins, player2_game_wins,
+        total_games, match_winner_id, player1_result, player2_result, updated_at
+    )
+    SELECT 
+        m.id,
+        m.tournament_id,
+        m.player1_id,
+        m.player2_id,
+        m.player1_deck_id,
+        m.player2_deck_id,
+        m.match_status,
+        w.p1_wins,
+        w.p2_wins,
+        w.total_games,
+        CASE 
+            WHEN w.p1_wins >= 2 THEN m.player1_id
+            WHEN w.p2_wins >= 2 THEN m.player2_id
+        END,
+        CASE 
+            WHEN w.p1_wins >= 2 THEN 'WIN'
+            WHEN w.p2_wins >= 2 THEN 'LOSS'
+            WHEN m.match_status = 'COMPLETED' THEN 'DRAW'
+            ELSE 'INCOMPLETE'
+        END,
+        CASE 
+            WHEN w.p2_wins >= 2 THEN 'WIN'
+            WHEN w.p1_wins >= 2 THEN 'LOSS'
+            WHEN m.match_status = 'COMPLETED' THEN 'DRAW'
+            ELSE 'INCOMPLETE'
+        END,
+        CURRENT_TIMESTAMP
+    FROM matches m
+    CROSS JOIN LATERAL (
+        SELECT 
+            COUNT(*) FILTER (WHERE g.game_result = 'WIN' AND g.winner_id = m.player1_id) as p1_wins,
+            COUNT(*) FILTER (WHERE g.game_result = 'WIN' AND g.winner_id = m.player2_id) as p2_wins,
+            COUNT(*) as total_games
+        FROM games g
+        WHERE g.match_id = m.id
+    ) w
+    WHERE m.id = ANY(p_match_ids)
+    ON CONFLICT (match_id) DO UPDATE SET
+        tournament_id = EXCLUDED.tournament_id,
+        player1_id = EXCLUDED.player1_id,
+        player2_id = EXCLUDED.player2_id,
+        player1_deck_id = EXCLUDED.player1_deck_id,
+        player2_deck_id = EXCLUDED.player2_deck_id,
+        match_status = EXCLUDED.match_status,
+        player1_game_wins = EXCLUDED.player1_game_wins,
+        player2_game_wins = EXCLUDED.player2_game_wins,
+        total_games = EXCLUDED.total_games,
+        match_winner_id = EXCLUDED.match_winner_id,
+        player1_result = EXCLUDED.player1_result,
+        player2_result = EXCLUDED.player2_result,
+        updated_at = EXCLUDED.updated_at
+    -- Skip no-op rewrites so unchanged outcomes do not produce stat deltas
+    WHERE (
+        match_outcomes.tournament_id, match_outcomes.player1_id, match_outcomes.player2_id,
+        match_outcomes.player1_deck_id, match_outcomes.player2_deck_id, match_outcomes.match_status,
+        match_outcomes.player1_game_wins, match_outcomes.player2_game_wins, match_outcomes.total_games,
+        match_outcomes.player1_result, match_outcomes.player2_result
+    ) IS DISTINCT FROM (
+        EXCLUDED.tournament_id, EXCLUDED.player1_id, EXCLUDED.player2_id,
+        EXCLUDED.player1_deck_id, EXCLUDED.player2_deck_id, EXCLUDED.match_status,
+        EXCLUDED.player1_game_wins, EXCLUDED.player2_game_wins, EXCLUDED.total_games,
+        EXCLUDED.player1_result, EXCLUDED.player2_result
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level trigger functions: one refresh per statement, so bulk
+-- inserts (e.g. tournament imports) recompute each touched match once
+CREATE OR REPLACE FUNCTION games_refresh_match_outcomes()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_match_outcomes(ARRAY(SELECT DISTINCT match_id FROM new_games));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_match_outcomes(ARRAY(
+            SELECT match_id FROM new_games UNION SELECT match_id FROM old_games
+        ));
+    ELSE
+        PERFORM refresh_match_outcomes(ARRAY(SELECT DISTINCT match_id FROM old_games));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION matches_refresh_match_outcomes()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_match_outcomes(ARRAY(SELECT id FROM new_matches));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER games_outcome_insert
+    AFTER INSERT ON games
+    REFERENCING NEW TABLE AS new_games
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION games_refresh_match_outcomes();
+
+CREATE TRIGGER games_outcome_update
+    AFTER UPDATE ON games
+    REFERENCING OLD TABLE AS old_games NEW TABLE AS new_games
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION games_refresh_match_outcomes();
+
+CREATE TRIGGER games_outcome_delete
+    AFTER DELETE ON games
+    REFERENCING OLD TABLE AS old_games
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION games_refresh_match_outcomes();
+
+CREATE TRIGGER matches_outcome_insert
+    AFTER INSERT ON matches
+    REFERENCING NEW TABLE AS new_matches
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION matches_refresh_match_outcomes();
+
+-- Player swaps and status changes alter the outcome; column lists are not
+-- allowed with transition tables, so every match update is re-evaluated
+CREATE TRIGGER matches_outcome_update
+    AFTER UPDATE ON matches
+    REFERENCING NEW TABLE AS new_matches
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION matches_refresh_match_outcomes();
+
 -- ============================================================================
 -- END OF SCHEMA
 -- ============================================================================
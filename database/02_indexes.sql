@@ -7,6 +7,7 @@
 --              - Deck statistics (wins/draws/losses by deck archetype)
 --              - Deck matchup analysis (Deck X vs Deck Y win rates)
 --              - Tournament lookups and date-range queries
+--              - Fuzzy name search (pg_trgm) for GET /api/v1/search
 -- ============================================================================
 
 -- ============================================================================
@@ -22,10 +23,14 @@ COMMENT ON INDEX idx_seasons_dates IS 'Optimize date range queries for active se
 CREATE INDEX idx_tournaments_season ON tournaments(season_id);
 CREATE INDEX idx_tournaments_date ON tournaments(tournament_date DESC);
 CREATE INDEX idx_tournaments_season_date ON tournaments(season_id, tournament_date DESC);
+CREATE UNIQUE INDEX idx_tournaments_source ON tournaments(source_id) WHERE source_id IS NOT NULL;
+CREATE INDEX idx_tournaments_content_hash ON tournaments(content_hash);
 
 COMMENT ON INDEX idx_tournaments_season IS 'Lookup tournaments by season';
 COMMENT ON INDEX idx_tournaments_date IS 'Date-ordered tournament queries';
 COMMENT ON INDEX idx_tournaments_season_date IS 'Season-specific date range queries';
+COMMENT ON INDEX idx_tournaments_source IS 'One tournament per imported export';
+COMMENT ON INDEX idx_tournaments_content_hash IS 'Find a tournament by imported payload hash';
 
 -- ============================================================================
 -- PLAYERS INDEXES
@@ -107,6 +112,26 @@ CREATE INDEX idx_games_wins_only ON games(winner_id, match_id)
 
 COMMENT ON INDEX idx_games_wins_only IS 'Partial index optimized for win-only queries';
 
+-- ============================================================================
+-- NAME SEARCH INDEXES (pg_trgm)
+-- ============================================================================
+
+-- Trigram GIN indexes serve both substring (ILIKE '%text%') and fuzzy
+-- (word similarity, <%) matching for GET /api/v1/search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX idx_players_name_trgm ON players USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_deck_archetypes_name_trgm ON deck_archetypes USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_tournaments_name_trgm ON tournaments USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_tournaments_location_trgm ON tournaments USING GIN (location gin_trgm_ops);
+CREATE INDEX idx_seasons_name_trgm ON seasons USING GIN (name gin_trgm_ops);
+
+COMMENT ON INDEX idx_players_name_trgm IS 'Substring and fuzzy player name search';
+COMMENT ON INDEX idx_deck_archetypes_name_trgm IS 'Substring and fuzzy deck name search';
+COMMENT ON INDEX idx_tournaments_name_trgm IS 'Substring and fuzzy tournament name search';
+COMMENT ON INDEX idx_tournaments_location_trgm IS 'Substring and fuzzy tournament location search';
+COMMENT ON INDEX idx_seasons_name_trgm IS 'Substring and fuzzy season name search';
+
 -- ============================================================================
 -- PERFORMANCE NOTES
 -- ============================================================================
@@ -3,7 +3,7 @@
 -- PostgreSQL Implementation
 -- ============================================================================
 -- Description: Views for common queries and reporting:
---              - Match results (aggregating best-of-3 games)
+--              - Match results (precomputed best-of-3 outcomes)
 --              - Player statistics (wins/draws/losses by player)
 --              - Deck statistics (wins/draws/losses by deck archetype)
 --              - Deck matchup analysis (head-to-head performance)
@@ -12,28 +12,12 @@
 -- ============================================================================
 -- VIEW: match_results
 -- ============================================================================
--- Aggregates individual games to determine match winners and outcomes
--- for best-of-3 matches
+-- Match winners and outcomes for best-of-3 matches. Outcomes are read from
+-- the match_outcomes table (maintained by triggers on games and matches),
+-- so this view no longer aggregates games on every query.
 DROP VIEW IF EXISTS match_results CASCADE;
 
 CREATE VIEW match_results AS
-WITH game_summary AS (
-    SELECT 
-        g.match_id,
-        g.winner_id,
-        g.game_result,
-        COUNT(*) as games_count
-    FROM games g
-    GROUP BY g.match_id, g.winner_id, g.game_result
-),
-player_wins AS (
-    SELECT 
-        match_id,
-        winner_id,
-        SUM(CASE WHEN game_result = 'WIN' THEN games_count ELSE 0 END) as wins
-    FROM game_summary
-    GROUP BY match_id, winner_id
-)
 SELECT 
     m.id as match_id,
     m.tournament_id,
@@ -44,34 +28,25 @@ SELECT
     m.round_number,
     m.match_date,
     m.match_status,
-    -- Determine match winner (first to 2 wins)
-    CASE 
-        WHEN COALESCE(pw1.wins, 0) >= 2 THEN m.player1_id
-        WHEN COALESCE(pw2.wins, 0) >= 2 THEN m.player2_id
-        ELSE NULL
-    END as match_winner_id,
-    -- Match result from player1's perspective
-    CASE 
-        WHEN COALESCE(pw1.wins, 0) >= 2 THEN 'WIN'
-        WHEN COALESCE(pw2.wins, 0) >= 2 THEN 'LOSS'
-        WHEN m.match_status = 'COMPLETED' THEN 'DRAW'
-        ELSE 'INCOMPLETE'
-    END as player1_result,
-    -- Match result from player2's perspective
-    CASE 
-        WHEN COALESCE(pw2.wins, 0) >= 2 THEN 'WIN'
-        WHEN COALESCE(pw1.wins, 0) >= 2 THEN 'LOSS'
-        WHEN m.match_status = 'COMPLETED' THEN 'DRAW'
-        ELSE 'INCOMPLETE'
-    END as player2_result,
+    -- Match winner (first to 2 wins)
+    mo.match_winner_id,
+    -- Match result from each player's perspective (matches without an
+    -- outcome row yet fall back to the status-based default)
+    COALESCE(
+        mo.player1_result,
+        CASE WHEN m.match_status = 'COMPLETED' THEN 'DRAW' ELSE 'INCOMPLETE' END
+    ) as player1_result,
+    COALESCE(
+        mo.player2_result,
+        CASE WHEN m.match_status = 'COMPLETED' THEN 'DRAW' ELSE 'INCOMPLETE' END
+    ) as player2_result,
     -- Game wins for each player
-    COALESCE(pw1.wins, 0) as player1_game_wins,
-    COALESCE(pw2.wins, 0) as player2_game_wins,
+    COALESCE(mo.player1_game_wins, 0) as player1_game_wins,
+    COALESCE(mo.player2_game_wins, 0) as player2_game_wins,
     -- Total games played in the match
-    (SELECT COUNT(*) FROM games WHERE match_id = m.id) as total_games
+    COALESCE(mo.total_games, 0) as total_games
 FROM matches m
-LEFT JOIN player_wins pw1 ON m.id = pw1.match_id AND m.player1_id = pw1.winner_id
-LEFT JOIN player_wins pw2 ON m.id = pw2.match_id AND m.player2_id = pw2.winner_id;
+LEFT JOIN match_outcomes mo ON mo.match_id = m.id;
 
 COMMENT ON VIEW match_results IS 'Match outcomes derived from best-of-3 game results';
 
@@ -385,6 +360,72 @@ ORDER BY season_id, points DESC, wins DESC, player_name;
 
 COMMENT ON VIEW season_standings IS 'Player standings by season with tournament-type points (win/draw), ordered by points descending';
 
+-- ============================================================================
+-- FUNCTION: season_standings_for
+-- ============================================================================
+-- season_standings for a single season. The season's tournaments are resolved
+-- first (idx_tournaments_season), then only their matches are read
+-- (idx_matches_tournament) together with their precomputed outcomes (same
+-- DRAW fallback as match_results for matches without one), so other
+-- seasons' matches are never scanned. Same columns and ordering as the view.
+CREATE OR REPLACE FUNCTION season_standings_for(p_season_id INTEGER)
+RETURNS TABLE (
+    season_id INTEGER,
+    season_name VARCHAR,
+    player_id INTEGER,
+    player_name VARCHAR,
+    matches_played BIGINT,
+    wins BIGINT,
+    draws BIGINT,
+    losses BIGINT,
+    points BIGINT
+) AS $$
+    WITH season_tournaments AS (
+        SELECT 
+            t.id as tournament_id,
+            COALESCE(tt.points_win, 3) as points_win,
+            COALESCE(tt.points_draw, 1) as points_draw
+        FROM tournaments t
+        LEFT JOIN tournament_types tt ON t.tournament_type_id = tt.id
+        WHERE t.season_id = p_season_id
+    ),
+    player_matches AS (
+        -- Player 1 perspective
+        SELECT m.player1_id as player_id, COALESCE(mo.player1_result, 'DRAW') as result, st.points_win, st.points_draw
+        FROM season_tournaments st
+        JOIN matches m ON m.tournament_id = st.tournament_id
+        LEFT JOIN match_outcomes mo ON mo.match_id = m.id
+        WHERE m.match_status = 'COMPLETED'
+
+        UNION ALL
+
+        -- Player 2 perspective
+        SELECT m.player2_id as player_id, COALESCE(mo.player2_result, 'DRAW') as result, st.points_win, st.points_draw
+        FROM season_tournaments st
+        JOIN matches m ON m.tournament_id = st.tournament_id
+        LEFT JOIN match_outcomes mo ON mo.match_id = m.id
+        WHERE m.match_status = 'COMPLETED'
+    )
+    SELECT 
+        s.id,
+        s.name,
+        p.id,
+        p.name,
+        COUNT(*),
+        SUM(CASE WHEN pm.result = 'WIN' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN pm.result = 'DRAW' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN pm.result = 'LOSS' THEN 1 ELSE 0 END),
+        (SUM(CASE WHEN pm.result = 'WIN' THEN pm.points_win ELSE 0 END) + 
+         SUM(CASE WHEN pm.result = 'DRAW' THEN pm.points_draw ELSE 0 END))
+    FROM player_matches pm
+    JOIN players p ON pm.player_id = p.id
+    JOIN seasons s ON s.id = p_season_id
+    GROUP BY s.id, s.name, p.id, p.name
+    ORDER BY 9 DESC, 6 DESC, p.name;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION season_standings_for(INTEGER) IS 'season_standings restricted to one season before aggregation';
+
 -- ============================================================================
 -- END OF VIEWS
 -- ============================================================================
@@ -70,6 +70,72 @@ ORDER BY season_id, points DESC, wins DESC, player_name;
 
 COMMENT ON VIEW season_standings IS 'Player standings by season with tournament-type points (win/draw), ordered by points descending';
 
+-- ============================================================================
+-- FUNCTION: season_standings_for
+-- ============================================================================
+-- season_standings for a single season. The season's tournaments are resolved
+-- first (idx_tournaments_season), then only their matches are read
+-- (idx_matches_tournament) together with their precomputed outcomes (same
+-- DRAW fallback as match_results for matches without one), so other
+-- seasons' matches are never scanned. Same columns and ordering as the view.
+CREATE OR REPLACE FUNCTION season_standings_for(p_season_id INTEGER)
+RETURNS TABLE (
+    season_id INTEGER,
+    season_name VARCHAR,
+    player_id INTEGER,
+    player_name VARCHAR,
+    matches_played BIGINT,
+    wins BIGINT,
+    draws BIGINT,
+    losses BIGINT,
+    points BIGINT
+) AS $$
+    WITH season_tournaments AS (
+        SELECT 
+            t.id as tournament_id,
+            COALESCE(tt.points_win, 3) as points_win,
+            COALESCE(tt.points_draw, 1) as points_draw
+        FROM tournaments t
+        LEFT JOIN tournament_types tt ON t.tournament_type_id = tt.id
+        WHERE t.season_id = p_season_id
+    ),
+    player_matches AS (
+        -- Player 1 perspective
+        SELECT m.player1_id as player_id, COALESCE(mo.player1_result, 'DRAW') as result, st.points_win, st.points_draw
+        FROM season_tournaments st
+        JOIN matches m ON m.tournament_id = st.tournament_id
+        LEFT JOIN match_outcomes mo ON mo.match_id = m.id
+        WHERE m.match_status = 'COMPLETED'
+
+        UNION ALL
+
+        -- Player 2 perspective
+        SELECT m.player2_id as player_id, COALESCE(mo.player2_result, 'DRAW') as result, st.points_win, st.points_draw
+        FROM season_tournaments st
+        JOIN matches m ON m.tournament_id = st.tournament_id
+        LEFT JOIN match_outcomes mo ON mo.match_id = m.id
+        WHERE m.match_status = 'COMPLETED'
+    )
+    SELECT 
+        s.id,
+        s.name,
+        p.id,
+        p.name,
+        COUNT(*),
+        SUM(CASE WHEN pm.result = 'WIN' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN pm.result = 'DRAW' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN pm.result = 'LOSS' THEN 1 ELSE 0 END),
+        (SUM(CASE WHEN pm.result = 'WIN' THEN pm.points_win ELSE 0 END) + 
+         SUM(CASE WHEN pm.result = 'DRAW' THEN pm.points_draw ELSE 0 END))
+    FROM player_matches pm
+    JOIN players p ON pm.player_id = p.id
+    JOIN seasons s ON s.id = p_season_id
+    GROUP BY s.id, s.name, p.id, p.name
+    ORDER BY 9 DESC, 6 DESC, p.name;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION season_standings_for(INTEGER) IS 'season_standings restricted to one season before aggregation';
+
 -- ============================================================================
 -- END OF VIEW
 -- ============================================================================
@@ -0,0 +1,197 @@
+-- ============================================================================
+-- Migration: persisted match outcomes
+-- ============================================================================
+-- Description: Adds the match_outcomes table and the triggers that keep it
+--              up to date, backfills it from existing games, and recreates
+--              the views so match_results reads precomputed outcomes.
+--              Fresh installs get all of this from 01_schema.sql and
+--              03_views.sql; run this file only on existing databases.
+--              Safe to run multiple times.
+--
+-- Usage (from the database directory):
+--   psql -d mtg_tournaments -f 06_match_outcomes.sql
+-- ============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS match_outcomes (
+    match_id INTEGER PRIMARY KEY REFERENCES matches(id) ON DELETE CASCADE,
+    tournament_id INTEGER NOT NULL,
+    player1_id INTEGER NOT NULL,
+    player2_id INTEGER NOT NULL,
+    player1_deck_id INTEGER NOT NULL,
+    player2_deck_id INTEGER NOT NULL,
+    match_status VARCHAR(20) NOT NULL,
+    player1_game_wins INTEGER NOT NULL DEFAULT 0,
+    player2_game_wins INTEGER NOT NULL DEFAULT 0,
+    total_games INTEGER NOT NULL DEFAULT 0,
+    match_winner_id INTEGER REFERENCES players(id) ON DELETE RESTRICT,
+    player1_result VARCHAR(10) NOT NULL,
+    player2_result VARCHAR(10) NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Databases migrated before the match columns were copied into match_outcomes
+ALTER TABLE match_outcomes
+    ADD COLUMN IF NOT EXISTS tournament_id INTEGER,
+    ADD COLUMN IF NOT EXISTS player1_id INTEGER,
+    ADD COLUMN IF NOT EXISTS player2_id INTEGER,
+    ADD COLUMN IF NOT EXISTS player1_deck_id INTEGER,
+    ADD COLUMN IF NOT EXISTS player2_deck_id INTEGER,
+    ADD COLUMN IF NOT EXISTS match_status VARCHAR(20);
+
+-- Recompute outcomes for a set of matches (first player to 2 game wins)
+CREATE OR REPLACE FUNCTION refresh_match_outcomes(p_match_ids INTEGER[])
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO match_outcomes (
+        match_id, tournament_id, player1_id, player2_id, player1_deck_id,
+        player2_deck_id, match_status, player1_game_wins, player2_game_wins,
+        total_games, match_winner_id, player1_result, player2_result, updated_at
+    )
+    SELECT 
+        m.id,
+        m.tournament_id,
+        m.player1_id,
+        m.player2_id,
+        m.player1_deck_id,
+        m.player2_deck_id,
+        m.match_status,
+        w.p1_wins,
+        w.p2_wins,
+        w.total_games,
+        CASE 
+            WHEN w.p1_wins >= 2 THEN m.player1_id
+            WHEN w.p2_wins >= 2 THEN m.player2_id
+        END,
+        CASE 
+            WHEN w.p1_wins >= 2 THEN 'WIN'
+            WHEN w.p2_wins >= 2 THEN 'LOSS'
+            WHEN m.match_status = 'COMPLETED' THEN 'DRAW'
+            ELSE 'INCOMPLETE'
+        END,
+        CASE 
+            WHEN w.p2_wins >= 2 THEN 'WIN'
+            WHEN w.p1_wins >= 2 THEN 'LOSS'
+            WHEN m.match_status = 'COMPLETED' THEN 'DRAW'
+            ELSE 'INCOMPLETE'
+        END,
+        CURRENT_TIMESTAMP
+    FROM matches m
+    CROSS JOIN LATERAL (
+        SELECT 
+            COUNT(*) FILTER (WHERE g.game_result = 'WIN' AND g.winner_id = m.player1_id) as p1_wins,
+            COUNT(*) FILTER (WHERE g.game_result = 'WIN' AND g.winner_id = m.player2_id) as p2_wins,
+            COUNT(*) as total_games
+        FROM games g
+        WHERE g.match_id = m.id
+    ) w
+    WHERE m.id = ANY(p_match_ids)
+    ON CONFLICT (match_id) DO UPDATE SET
+        tournament_id = EXCLUDED.tournament_id,
+        player1_id = EXCLUDED.player1_id,
+        player2_id = EXCLUDED.player2_id,
+        player1_deck_id = EXCLUDED.player1_deck_id,
+        player2_deck_id = EXCLUDED.player2_deck_id,
+        match_status = EXCLUDED.match_status,
+        player1_game_wins = EXCLUDED.player1_game_wins,
+        player2_game_wins = EXCLUDED.player2_game_wins,
+        total_games = EXCLUDED.total_games,
+        match_winner_id = EXCLUDED.match_winner_id,
+        player1_result = EXCLUDED.player1_result,
+        player2_result = EXCLUDED.player2_result,
+        updated_at = EXCLUDED.updated_at
+    -- Skip no-op rewrites so unchanged outcomes do not produce stat deltas
+    WHERE (
+        match_outcomes.tournament_id, match_outcomes.player1_id, match_outcomes.player2_id,
+        match_outcomes.player1_deck_id, match_outcomes.player2_deck_id, match_outcomes.match_status,
+        match_outcomes.player1_game_wins, match_outcomes.player2_game_wins, match_outcomes.total_games,
+        match_outcomes.player1_result, match_outcomes.player2_result
+    ) IS DISTINCT FROM (
+        EXCLUDED.tournament_id, EXCLUDED.player1_id, EXCLUDED.player2_id,
+        EXCLUDED.player1_deck_id, EXCLUDED.player2_deck_id, EXCLUDED.match_status,
+        EXCLUDED.player1_game_wins, EXCLUDED.player2_game_wins, EXCLUDED.total_games,
+        EXCLUDED.player1_result, EXCLUDED.player2_result
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level trigger functions: one refresh per statement, so bulk
+-- inserts (e.g. tournament imports) recompute each touched match once
+CREATE OR REPLACE FUNCTION games_refresh_match_outcomes()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_match_outcomes(ARRAY(SELECT DISTINCT match_id FROM new_games));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_match_outcomes(ARRAY(
+            SELECT match_id FROM new_games UNION SELECT match_id FROM old_games
+        ));
+    ELSE
+        PERFORM refresh_match_outcomes(ARRAY(SELECT DISTINCT match_id FROM old_games));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION matches_refresh_match_outcomes()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_match_outcomes(ARRAY(SELECT id FROM new_matches));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS games_outcome_insert ON games;
+DROP TRIGGER IF EXISTS games_outcome_update ON games;
+DROP TRIGGER IF EXISTS games_outcome_delete ON games;
+DROP TRIGGER IF EXISTS matches_outcome_insert ON matches;
+DROP TRIGGER IF EXISTS matches_outcome_update ON matches;
+
+CREATE TRIGGER games_outcome_insert
+    AFTER INSERT ON games
+    REFERENCING NEW TABLE AS new_games
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION games_refresh_match_outcomes();
+
+CREATE TRIGGER games_outcome_update
+    AFTER UPDATE ON games
+    REFERENCING OLD TABLE AS old_games NEW TABLE AS new_games
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION games_refresh_match_outcomes();
+
+CREATE TRIGGER games_outcome_delete
+    AFTER DELETE ON games
+    REFERENCING OLD TABLE AS old_games
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION games_refresh_match_outcomes();
+
+CREATE TRIGGER matches_outcome_insert
+    AFTER INSERT ON matches
+    REFERENCING NEW TABLE AS new_matches
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION matches_refresh_match_outcomes();
+
+-- Player swaps and status changes alter the outcome; column lists are not
+-- allowed with transition tables, so every match update is re-evaluated
+CREATE TRIGGER matches_outcome_update
+    AFTER UPDATE ON matches
+    REFERENCING NEW TABLE AS new_matches
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION matches_refresh_match_outcomes();
+
+-- Backfill outcomes for every existing match
+SELECT refresh_match_outcomes(ARRAY(SELECT id FROM matches));
+
+ALTER TABLE match_outcomes
+    ALTER COLUMN tournament_id SET NOT NULL,
+    ALTER COLUMN player1_id SET NOT NULL,
+    ALTER COLUMN player2_id SET NOT NULL,
+    ALTER COLUMN player1_deck_id SET NOT NULL,
+    ALTER COLUMN player2_deck_id SET NOT NULL,
+    ALTER COLUMN match_status SET NOT NULL;
+
+COMMIT;
+
+-- Recreate views on top of match_outcomes
+\ir 03_views.sql
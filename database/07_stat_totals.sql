@@ -0,0 +1,388 @@
+-- ============================================================================
+-- MTG Tournament Tracking System - Incremental Statistic Totals
+-- PostgreSQL Implementation
+-- ============================================================================
+-- Description: Counter tables for player, deck and matchup statistics,
+--              updated in delta form whenever a row in match_outcomes
+--              changes, plus summary views with the same columns as
+--              player_statistics, deck_statistics and deck_matchups.
+--              The API statistics endpoints read the summary views, so
+--              they no longer aggregate every match on each request.
+--
+--              Requires match_outcomes (01_schema.sql or 06_match_outcomes.sql)
+--              and the views from 03_views.sql. Safe to run multiple times;
+--              every run finishes with a full rebuild of the counters.
+--
+-- Usage (from the database directory):
+--   psql -d mtg_tournaments -f 07_stat_totals.sql
+--
+-- Maintenance:
+--   SELECT rebuild_stat_totals();          -- recompute from match_outcomes
+--   SELECT * FROM check_stat_totals();     -- rows that differ from the views
+-- ============================================================================
+
+BEGIN;
+
+-- ============================================================================
+-- COUNTER TABLES
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS player_stat_totals (
+    player_id INTEGER PRIMARY KEY REFERENCES players(id) ON DELETE CASCADE,
+    matches_won INTEGER NOT NULL DEFAULT 0,
+    matches_drawn INTEGER NOT NULL DEFAULT 0,
+    matches_lost INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS deck_stat_totals (
+    deck_id INTEGER PRIMARY KEY REFERENCES deck_archetypes(id) ON DELETE CASCADE,
+    matches_won INTEGER NOT NULL DEFAULT 0,
+    matches_drawn INTEGER NOT NULL DEFAULT 0,
+    matches_lost INTEGER NOT NULL DEFAULT 0
+);
+
+-- One row per player/deck pair with at least one completed match; row counts
+-- give decks_played per player and unique_players per deck
+CREATE TABLE IF NOT EXISTS player_deck_stat_totals (
+    player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    deck_id INTEGER NOT NULL REFERENCES deck_archetypes(id) ON DELETE CASCADE,
+    matches_won INTEGER NOT NULL DEFAULT 0,
+    matches_drawn INTEGER NOT NULL DEFAULT 0,
+    matches_lost INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_id, deck_id)
+);
+
+-- Both directions are stored: (A, B) from A's perspective and (B, A) from B's
+CREATE TABLE IF NOT EXISTS deck_matchup_totals (
+    deck_a_id INTEGER NOT NULL REFERENCES deck_archetypes(id) ON DELETE CASCADE,
+    deck_b_id INTEGER NOT NULL REFERENCES deck_archetypes(id) ON DELETE CASCADE,
+    deck_a_wins INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    deck_a_losses INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (deck_a_id, deck_b_id)
+);
+
+-- Row counts give tournaments_played per player and per deck
+CREATE TABLE IF NOT EXISTS player_tournament_totals (
+    player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    tournament_id INTEGER NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    matches_played INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_id, tournament_id)
+);
+
+CREATE TABLE IF NOT EXISTS deck_tournament_totals (
+    deck_id INTEGER NOT NULL REFERENCES deck_archetypes(id) ON DELETE CASCADE,
+    tournament_id INTEGER NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    matches_played INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (deck_id, tournament_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_player_deck_stat_totals_deck ON player_deck_stat_totals(deck_id);
+
+COMMENT ON TABLE player_stat_totals IS 'Completed match W/D/L per player, maintained from match_outcomes';
+COMMENT ON TABLE deck_stat_totals IS 'Completed match W/D/L per deck archetype, maintained from match_outcomes';
+COMMENT ON TABLE player_deck_stat_totals IS 'Completed match W/D/L per player and deck, maintained from match_outcomes';
+COMMENT ON TABLE deck_matchup_totals IS 'Head-to-head W/D/L per ordered deck pair, maintained from match_outcomes';
+COMMENT ON TABLE player_tournament_totals IS 'Completed matches per player and tournament, maintained from match_outcomes';
+COMMENT ON TABLE deck_tournament_totals IS 'Completed matches per deck and tournament, maintained from match_outcomes';
+
+-- ============================================================================
+-- DELTA APPLICATION
+-- ============================================================================
+-- Both player perspectives of a set of outcomes, signed (+1 add, -1 remove).
+-- Matches that are not COMPLETED contribute nothing, as in the views.
+CREATE OR REPLACE FUNCTION match_outcome_perspectives(p_rows match_outcomes[], p_sign INTEGER)
+RETURNS TABLE (
+    tournament_id INTEGER,
+    player_id INTEGER,
+    deck_id INTEGER,
+    opponent_deck_id INTEGER,
+    won INTEGER,
+    drawn INTEGER,
+    lost INTEGER
+) AS $$
+    SELECT o.tournament_id, o.player1_id, o.player1_deck_id, o.player2_deck_id,
+           p_sign * (o.player1_result = 'WIN')::int,
+           p_sign * (o.player1_result = 'DRAW')::int,
+           p_sign * (o.player1_result = 'LOSS')::int
+    FROM unnest(p_rows) o
+    WHERE o.match_status = 'COMPLETED'
+    UNION ALL
+    SELECT o.tournament_id, o.player2_id, o.player2_deck_id, o.player1_deck_id,
+           p_sign * (o.player2_result = 'WIN')::int,
+           p_sign * (o.player2_result = 'DRAW')::int,
+           p_sign * (o.player2_result = 'LOSS')::int
+    FROM unnest(p_rows) o
+    WHERE o.match_status = 'COMPLETED';
+$$ LANGUAGE sql STABLE;
+
+-- Add (p_sign = 1) or remove (p_sign = -1) the contribution of a set of
+-- outcomes. Rows are grouped before each upsert because a mirror match
+-- touches the same deck key twice. Each upsert inserts its rows in conflict key
+-- order, so concurrent imports lock total rows in the same order and wait
+-- on each other instead of deadlocking.
+CREATE OR REPLACE FUNCTION apply_stat_deltas(p_rows match_outcomes[], p_sign INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    IF p_rows IS NULL OR cardinality(p_rows) = 0 THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO player_stat_totals AS t (player_id, matches_won, matches_drawn, matches_lost)
+    SELECT player_id, SUM(won), SUM(drawn), SUM(lost)
+    FROM match_outcome_perspectives(p_rows, p_sign)
+    GROUP BY player_id
+    ORDER BY player_id
+    ON CONFLICT (player_id) DO UPDATE SET
+        matches_won = t.matches_won + EXCLUDED.matches_won,
+        matches_drawn = t.matches_drawn + EXCLUDED.matches_drawn,
+        matches_lost = t.matches_lost + EXCLUDED.matches_lost;
+
+    INSERT INTO deck_stat_totals AS t (deck_id, matches_won, matches_drawn, matches_lost)
+    SELECT deck_id, SUM(won), SUM(drawn), SUM(lost)
+    FROM match_outcome_perspectives(p_rows, p_sign)
+    GROUP BY deck_id
+    ORDER BY deck_id
+    ON CONFLICT (deck_id) DO UPDATE SET
+        matches_won = t.matches_won + EXCLUDED.matches_won,
+        matches_drawn = t.matches_drawn + EXCLUDED.matches_drawn,
+        matches_lost = t.matches_lost + EXCLUDED.matches_lost;
+
+    INSERT INTO player_deck_stat_totals AS t (player_id, deck_id, matches_won, matches_drawn, matches_lost)
+    SELECT player_id, deck_id, SUM(won), SUM(drawn), SUM(lost)
+    FROM match_outcome_perspectives(p_rows, p_sign)
+    GROUP BY player_id, deck_id
+    ORDER BY player_id, deck_id
+    ON CONFLICT (player_id, deck_id) DO UPDATE SET
+        matches_won = t.matches_won + EXCLUDED.matches_won,
+        matches_drawn = t.matches_drawn + EXCLUDED.matches_drawn,
+        matches_lost = t.matches_lost + EXCLUDED.matches_lost;
+
+    INSERT INTO deck_matchup_totals AS t (deck_a_id, deck_b_id, deck_a_wins, draws, deck_a_losses)
+    SELECT deck_id, opponent_deck_id, SUM(won), SUM(drawn), SUM(lost)
+    FROM match_outcome_perspectives(p_rows, p_sign)
+    GROUP BY deck_id, opponent_deck_id
+    ORDER BY deck_id, opponent_deck_id
+    ON CONFLICT (deck_a_id, deck_b_id) DO UPDATE SET
+        deck_a_wins = t.deck_a_wins + EXCLUDED.deck_a_wins,
+        draws = t.draws + EXCLUDED.draws,
+        deck_a_losses = t.deck_a_losses + EXCLUDED.deck_a_losses;
+
+    INSERT INTO player_tournament_totals AS t (player_id, tournament_id, matches_played)
+    SELECT player_id, tournament_id, SUM(won + drawn + lost)
+    FROM match_outcome_perspectives(p_rows, p_sign)
+    GROUP BY player_id, tournament_id
+    ORDER BY player_id, tournament_id
+    ON CONFLICT (player_id, tournament_id) DO UPDATE SET
+        matches_played = t.matches_played + EXCLUDED.matches_played;
+
+    INSERT INTO deck_tournament_totals AS t (deck_id, tournament_id, matches_played)
+    SELECT deck_id, tournament_id, SUM(won + drawn + lost)
+    FROM match_outcome_perspectives(p_rows, p_sign)
+    GROUP BY deck_id, tournament_id
+    ORDER BY deck_id, tournament_id
+    ON CONFLICT (deck_id, tournament_id) DO UPDATE SET
+        matches_played = t.matches_played + EXCLUDED.matches_played;
+
+    -- Drop pair rows that no longer have any match so row counts stay exact
+    IF p_sign < 0 THEN
+        DELETE FROM player_deck_stat_totals t
+        USING match_outcome_perspectives(p_rows, p_sign) d
+        WHERE t.player_id = d.player_id AND t.deck_id = d.deck_id
+          AND t.matches_won + t.matches_drawn + t.matches_lost = 0;
+
+        DELETE FROM deck_matchup_totals t
+        USING match_outcome_perspectives(p_rows, p_sign) d
+        WHERE t.deck_a_id = d.deck_id AND t.deck_b_id = d.opponent_deck_id
+          AND t.deck_a_wins + t.draws + t.deck_a_losses = 0;
+
+        DELETE FROM player_tournament_totals t
+        USING match_outcome_perspectives(p_rows, p_sign) d
+        WHERE t.player_id = d.player_id AND t.tournament_id = d.tournament_id
+          AND t.matches_played = 0;
+
+        DELETE FROM deck_tournament_totals t
+        USING match_outcome_perspectives(p_rows, p_sign) d
+        WHERE t.deck_id = d.deck_id AND t.tournament_id = d.tournament_id
+          AND t.matches_played = 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level trigger: removes the old contribution and adds the new one
+CREATE OR REPLACE FUNCTION match_outcomes_apply_stat_deltas()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_stat_deltas(ARRAY(SELECT o::match_outcomes FROM old_outcomes o), -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_stat_deltas(ARRAY(SELECT o::match_outcomes FROM new_outcomes o), 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS match_outcomes_stats_insert ON match_outcomes;
+DROP TRIGGER IF EXISTS match_outcomes_stats_update ON match_outcomes;
+DROP TRIGGER IF EXISTS match_outcomes_stats_delete ON match_outcomes;
+
+CREATE TRIGGER match_outcomes_stats_insert
+    AFTER INSERT ON match_outcomes
+    REFERENCING NEW TABLE AS new_outcomes
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION match_outcomes_apply_stat_deltas();
+
+CREATE TRIGGER match_outcomes_stats_update
+    AFTER UPDATE ON match_outcomes
+    REFERENCING OLD TABLE AS old_outcomes NEW TABLE AS new_outcomes
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION match_outcomes_apply_stat_deltas();
+
+CREATE TRIGGER match_outcomes_stats_delete
+    AFTER DELETE ON match_outcomes
+    REFERENCING OLD TABLE AS old_outcomes
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION match_outcomes_apply_stat_deltas();
+
+-- ============================================================================
+-- REBUILD
+-- ============================================================================
+-- Recompute every counter from match_outcomes, one tournament at a time
+CREATE OR REPLACE FUNCTION rebuild_stat_totals()
+RETURNS VOID AS $$
+DECLARE
+    t_id INTEGER;
+BEGIN
+    TRUNCATE player_stat_totals, deck_stat_totals, player_deck_stat_totals,
+             deck_matchup_totals, player_tournament_totals, deck_tournament_totals;
+
+    FOR t_id IN SELECT id FROM tournaments ORDER BY id LOOP
+        PERFORM apply_stat_deltas(
+            ARRAY(SELECT mo FROM match_outcomes mo WHERE mo.tournament_id = t_id),
+            1
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- SUMMARY VIEWS (same columns as the aggregate views in 03_views.sql)
+-- ============================================================================
+DROP VIEW IF EXISTS player_stat_summary CASCADE;
+
+CREATE VIEW player_stat_summary AS
+SELECT
+    p.id as player_id,
+    p.name as player_name,
+    COALESCE(t.matches_won + t.matches_drawn + t.matches_lost, 0) as total_matches,
+    COALESCE(t.matches_won, 0) as matches_won,
+    COALESCE(t.matches_drawn, 0) as matches_drawn,
+    COALESCE(t.matches_lost, 0) as matches_lost,
+    ROUND(
+        100.0 * t.matches_won /
+        NULLIF(t.matches_won + t.matches_drawn + t.matches_lost, 0),
+        2
+    ) as win_rate_percentage,
+    (SELECT COUNT(*) FROM player_deck_stat_totals pd WHERE pd.player_id = p.id) as decks_played,
+    (SELECT COUNT(*) FROM player_tournament_totals pt WHERE pt.player_id = p.id) as tournaments_played
+FROM players p
+LEFT JOIN player_stat_totals t ON t.player_id = p.id
+WHERE p.active = TRUE;
+
+COMMENT ON VIEW player_stat_summary IS 'player_statistics served from player_stat_totals';
+
+DROP VIEW IF EXISTS deck_stat_summary CASCADE;
+
+CREATE VIEW deck_stat_summary AS
+SELECT
+    da.id as deck_id,
+    da.name as deck_name,
+    da.color_identity,
+    da.archetype_type,
+    COALESCE(t.matches_won + t.matches_drawn + t.matches_lost, 0) as total_matches,
+    COALESCE(t.matches_won, 0) as matches_won,
+    COALESCE(t.matches_drawn, 0) as matches_drawn,
+    COALESCE(t.matches_lost, 0) as matches_lost,
+    ROUND(
+        100.0 * t.matches_won /
+        NULLIF(t.matches_won + t.matches_drawn + t.matches_lost, 0),
+        2
+    ) as win_rate_percentage,
+    (SELECT COUNT(*) FROM player_deck_stat_totals pd WHERE pd.deck_id = da.id) as unique_players,
+    (SELECT COUNT(*) FROM deck_tournament_totals dt WHERE dt.deck_id = da.id) as tournaments_played
+FROM deck_archetypes da
+LEFT JOIN deck_stat_totals t ON t.deck_id = da.id;
+
+COMMENT ON VIEW deck_stat_summary IS 'deck_statistics served from deck_stat_totals';
+
+DROP VIEW IF EXISTS deck_matchup_summary CASCADE;
+
+CREATE VIEW deck_matchup_summary AS
+SELECT
+    t.deck_a_id,
+    da1.name as deck_a_name,
+    t.deck_b_id,
+    da2.name as deck_b_name,
+    t.deck_a_wins + t.draws + t.deck_a_losses as total_matches,
+    t.deck_a_wins,
+    t.draws,
+    t.deck_a_losses,
+    ROUND(100.0 * t.deck_a_wins / NULLIF(t.deck_a_wins + t.draws + t.deck_a_losses, 0), 2) as deck_a_win_rate_percentage,
+    ROUND(100.0 * t.deck_a_losses / NULLIF(t.deck_a_wins + t.draws + t.deck_a_losses, 0), 2) as deck_b_win_rate_percentage
+FROM deck_matchup_totals t
+JOIN deck_archetypes da1 ON t.deck_a_id = da1.id
+JOIN deck_archetypes da2 ON t.deck_b_id = da2.id
+WHERE t.deck_a_id <= t.deck_b_id;
+
+COMMENT ON VIEW deck_matchup_summary IS 'deck_matchups served from deck_matchup_totals';
+
+-- ============================================================================
+-- CONSISTENCY CHECK
+-- ============================================================================
+-- Symmetric difference between the aggregate views and the summary views.
+-- An empty result means the counters are consistent. Entities without
+-- completed matches are skipped (the views report them with a COUNT(*) of 1),
+-- and deck unique_players is not compared because deck_statistics counts
+-- only player 1 of mirror matches.
+CREATE OR REPLACE FUNCTION check_stat_totals()
+RETURNS TABLE (statistic TEXT, source TEXT, row_data JSONB) AS $$
+    WITH view_players AS (
+        SELECT player_id, matches_won, matches_drawn, matches_lost, decks_played, tournaments_played
+        FROM player_statistics WHERE matches_won + matches_drawn + matches_lost > 0
+    ), counter_players AS (
+        SELECT player_id, matches_won, matches_drawn, matches_lost, decks_played, tournaments_played
+        FROM player_stat_summary WHERE total_matches > 0
+    ), view_decks AS (
+        SELECT deck_id, matches_won, matches_drawn, matches_lost, tournaments_played
+        FROM deck_statistics WHERE matches_won + matches_drawn + matches_lost > 0
+    ), counter_decks AS (
+        SELECT deck_id, matches_won, matches_drawn, matches_lost, tournaments_played
+        FROM deck_stat_summary WHERE total_matches > 0
+    ), view_matchups AS (
+        SELECT deck_a_id, deck_b_id, total_matches, deck_a_wins, draws, deck_a_losses
+        FROM deck_matchups
+    ), counter_matchups AS (
+        SELECT deck_a_id, deck_b_id, total_matches, deck_a_wins, draws, deck_a_losses
+        FROM deck_matchup_summary
+    )
+    SELECT 'players', 'view_only', to_jsonb(d) FROM (SELECT * FROM view_players EXCEPT SELECT * FROM counter_players) d
+    UNION ALL
+    SELECT 'players', 'counters_only', to_jsonb(d) FROM (SELECT * FROM counter_players EXCEPT SELECT * FROM view_players) d
+    UNION ALL
+    SELECT 'decks', 'view_only', to_jsonb(d) FROM (SELECT * FROM view_decks EXCEPT SELECT * FROM counter_decks) d
+    UNION ALL
+    SELECT 'decks', 'counters_only', to_jsonb(d) FROM (SELECT * FROM counter_decks EXCEPT SELECT * FROM view_decks) d
+    UNION ALL
+    SELECT 'matchups', 'view_only', to_jsonb(d) FROM (SELECT * FROM view_matchups EXCEPT SELECT * FROM counter_matchups) d
+    UNION ALL
+    SELECT 'matchups', 'counters_only', to_jsonb(d) FROM (SELECT * FROM counter_matchups EXCEPT SELECT * FROM view_matchups) d;
+$$ LANGUAGE sql STABLE;
+
+-- Initial (re)build
+SELECT rebuild_stat_totals();
+
+COMMIT;
+
+-- ============================================================================
+-- END OF STAT TOTALS
+-- ============================================================================
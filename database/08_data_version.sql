@@ -0,0 +1,102 @@
+-- ============================================================================
+-- MTG Tournament Tracking System - Data Version Counter
+-- PostgreSQL Implementation
+-- ============================================================================
+-- Description: A single-row counter incremented once by every transaction
+--              that writes to the tracked tables. The API derives ETags
+--              from it, so clients polling unchanged resources get
+--              304 Not Modified without the query being re-run.
+--
+--              Statement-level triggers on the tracked tables record each
+--              writing transaction once in data_version_pending. That row
+--              fires a DEFERRABLE INITIALLY DEFERRED constraint trigger, so
+--              the counter is bumped once per transaction, at COMMIT:
+--              - the counter row is locked only for the last moment of the
+--                transaction, so writers never deadlock on it;
+--              - a COPY of millions of rows queues one deferred event, not
+--                one per row;
+--              - readers only see the new version once the data is
+--                committed.
+--              Safe to run multiple times.
+--
+-- Usage (from the database directory):
+--   psql -d mtg_tournaments -f 08_data_version.sql
+-- ============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS data_version (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO data_version (id) VALUES (TRUE) ON CONFLICT (id) DO NOTHING;
+
+COMMENT ON TABLE data_version IS 'Global write counter used for HTTP ETags; one row';
+
+-- One row per writing transaction that has not committed yet; the row is
+-- deleted again by the bump, so the table stays empty between transactions
+CREATE UNLOGGED TABLE IF NOT EXISTS data_version_pending (
+    txid BIGINT PRIMARY KEY
+);
+
+COMMENT ON TABLE data_version_pending IS 'Transactions whose data_version bump is deferred to COMMIT';
+
+-- Statement trigger on the tracked tables: queue the bump once per
+-- transaction (the transaction-local setting skips later statements)
+CREATE OR REPLACE FUNCTION mark_data_version_pending()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF current_setting('mtg.data_version_txid', TRUE) = txid_current()::TEXT THEN
+        RETURN NULL;
+    END IF;
+    PERFORM set_config('mtg.data_version_txid', txid_current()::TEXT, TRUE);
+    INSERT INTO data_version_pending (txid) VALUES (txid_current()) ON CONFLICT (txid) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Deferred constraint trigger on data_version_pending: runs at COMMIT
+CREATE OR REPLACE FUNCTION bump_data_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM data_version_pending WHERE txid = NEW.txid;
+    UPDATE data_version SET version = version + 1, updated_at = CURRENT_TIMESTAMP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS data_version_pending_bump ON data_version_pending;
+CREATE CONSTRAINT TRIGGER data_version_pending_bump
+    AFTER INSERT ON data_version_pending
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION bump_data_version();
+
+-- One statement-level trigger per tracked table (derived tables such as
+-- match_outcomes and the stat totals change only through these)
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY[
+        'seasons', 'tournament_types', 'tournaments', 'players',
+        'deck_archetypes', 'matches', 'games'
+    ] LOOP
+        -- Row-level constraint triggers of earlier versions of this script
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_data_version_truncate', tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_data_version', tbl);
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION mark_data_version_pending()',
+            tbl || '_data_version', tbl
+        );
+    END LOOP;
+END;
+$$;
+
+COMMIT;
+
+-- ============================================================================
+-- END OF DATA VERSION
+-- ============================================================================
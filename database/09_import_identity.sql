@@ -0,0 +1,38 @@
+-- ============================================================================
+-- Migration: idempotent tournament imports
+-- ============================================================================
+-- Description: Adds tournaments.source_id (identifier of the imported
+--              export, e.g. the Melee TournamentId) and
+--              tournaments.content_hash (SHA-256 of the imported payload).
+--              POST /tournaments/import-complete uses them to skip a
+--              re-posted file and to diff an updated export against the
+--              stored tournament instead of creating a duplicate.
+--              Fresh installs get the columns from 01_schema.sql and
+--              02_indexes.sql; run this file only on existing databases.
+--              Safe to run multiple times.
+--
+-- Usage (from the database directory):
+--   psql -d mtg_tournaments -f 09_import_identity.sql
+-- ============================================================================
+
+BEGIN;
+
+ALTER TABLE tournaments
+    ADD COLUMN IF NOT EXISTS source_id VARCHAR(100),
+    ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tournaments_source
+    ON tournaments(source_id) WHERE source_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_tournaments_content_hash
+    ON tournaments(content_hash);
+
+COMMENT ON COLUMN tournaments.source_id IS 'Identifier of the imported export (unique when set)';
+COMMENT ON COLUMN tournaments.content_hash IS 'SHA-256 of the last imported payload, used to skip unchanged re-imports';
+COMMENT ON INDEX idx_tournaments_source IS 'One tournament per imported export';
+COMMENT ON INDEX idx_tournaments_content_hash IS 'Find a tournament by imported payload hash';
+
+COMMIT;
+
+-- ============================================================================
+-- END OF IMPORT IDENTITY
+-- ============================================================================
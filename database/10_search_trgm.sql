@@ -0,0 +1,43 @@
+-- ============================================================================
+-- Migration: trigram name search
+-- ============================================================================
+-- Description: Enables the pg_trgm extension and adds trigram GIN indexes on
+--              player, deck, tournament, location and season names.
+--              GET /api/v1/search uses them for substring (ILIKE) and fuzzy
+--              (word similarity) matching without scanning the tables.
+--              Fresh installs get the indexes from 02_indexes.sql; run this
+--              file only on existing databases. Safe to run multiple times.
+--
+--              Creating an extension needs a role allowed to do so (the
+--              database owner on PostgreSQL 13+, pg_trgm being trusted).
+--
+-- Usage (from the database directory):
+--   psql -d mtg_tournaments -f 10_search_trgm.sql
+-- ============================================================================
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_players_name_trgm
+    ON players USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_deck_archetypes_name_trgm
+    ON deck_archetypes USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_tournaments_name_trgm
+    ON tournaments USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_tournaments_location_trgm
+    ON tournaments USING GIN (location gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_seasons_name_trgm
+    ON seasons USING GIN (name gin_trgm_ops);
+
+COMMENT ON INDEX idx_players_name_trgm IS 'Substring and fuzzy player name search';
+COMMENT ON INDEX idx_deck_archetypes_name_trgm IS 'Substring and fuzzy deck name search';
+COMMENT ON INDEX idx_tournaments_name_trgm IS 'Substring and fuzzy tournament name search';
+COMMENT ON INDEX idx_tournaments_location_trgm IS 'Substring and fuzzy tournament location search';
+COMMENT ON INDEX idx_seasons_name_trgm IS 'Substring and fuzzy season name search';
+
+COMMIT;
+
+-- ============================================================================
+-- END OF TRIGRAM SEARCH
+-- ============================================================================
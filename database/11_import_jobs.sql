@@ -0,0 +1,59 @@
+-- ============================================================================
+-- MTG Tournament Tracking System - Background Import Jobs
+-- PostgreSQL Implementation
+-- ============================================================================
+-- Description: State of imports queued with POST /tournaments/import-jobs.
+--              The worker running a job updates its row at every stage, in
+--              short transactions of their own, so any API worker can
+--              answer GET /import-jobs/{id} while the import's own
+--              transaction is still open. The table is not tracked by
+--              data_version, so progress updates never change ETags.
+--              Unfinished jobs whose row has not been updated for
+--              IMPORT_JOB_STALE_SECONDS (their worker died) are marked
+--              failed by the API.
+--              Safe to run multiple times.
+--
+-- Usage (from the database directory):
+--   psql -d mtg_tournaments -f 11_import_jobs.sql
+-- ============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS import_jobs (
+    id CHAR(32) PRIMARY KEY,
+    status VARCHAR(20) NOT NULL,
+    stage VARCHAR(50) NOT NULL,
+    tournament_name VARCHAR(150) NOT NULL,
+    total_matches INTEGER NOT NULL,
+    total_games INTEGER NOT NULL,
+    matches_processed INTEGER NOT NULL DEFAULT 0,
+    games_processed INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL,
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    error TEXT,
+    result JSONB,
+
+    CONSTRAINT valid_import_job_status CHECK (status IN ('queued', 'running', 'completed', 'failed'))
+);
+
+-- Tables created by the first version of this script
+ALTER TABLE import_jobs ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS idx_import_jobs_finished
+    ON import_jobs(finished_at) WHERE finished_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_import_jobs_unfinished
+    ON import_jobs(updated_at) WHERE finished_at IS NULL;
+
+COMMENT ON TABLE import_jobs IS 'Background tournament imports and their progress, readable from any API worker';
+COMMENT ON COLUMN import_jobs.result IS 'TournamentImportResponse of a completed import';
+COMMENT ON COLUMN import_jobs.updated_at IS 'Last save by the worker running the job; stale when that worker died';
+COMMENT ON INDEX idx_import_jobs_finished IS 'Prune the oldest finished jobs';
+COMMENT ON INDEX idx_import_jobs_unfinished IS 'Find abandoned jobs';
+
+COMMIT;
+
+-- ============================================================================
+-- END OF IMPORT JOBS
+-- ============================================================================
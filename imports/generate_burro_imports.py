@@ -1,9 +1,17 @@
 import json
 import argparse
+import os
 import sys
-from datetime import datetime
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 
+# Streaming parser shared with the API (standard library only)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "services"))
+from app.melee import NotAnExportError, convert_export, stream_import
+
 def parse_result_string(result_string):
     """Parse result string to extract game wins for each player."""
     # Examples: "Mao88 won 2-1-0", "1-1-0 Draw", "BlackWaldo won 2-0-0"
@@ -179,7 +187,192 @@ def safe_win_count(competitor):
     
     return output
 
+def convert_file(input_file):
+    """Convert one raw export in a worker process; returns (converter, seconds)."""
+    started = time.perf_counter()
+    with open(input_file, 'rb') as f:
+        converter = convert_export(f)
+    return converter, time.perf_counter() - started
+
+
+def normalize_name(name):
+    """Key under which spellings of the same deck are merged ("BUG  control" == "BUG Control")."""
+    return ' '.join((name or '').split()).casefold()
+
+
+def merge_dictionaries(converters):
+    """
+    Pick one spelling per deck archetype and one name per Melee player ID
+    across all files, and apply them to every converter.
+
+    Spellings are counted once per player using the deck and once per file
+    for decklists no player ended on, so every listed deck (``deck_names``,
+    which becomes the ``decks`` array) gets the same canonical name as the
+    matches. The most common spelling wins; ties go to the first file in
+    name order. Returns (player count, {canonical deck name: [merged spellings]}).
+    """
+    deck_spellings = defaultdict(Counter)
+    player_names = defaultdict(Counter)
+    for converter in converters:
+        for deck in converter.player_decks.values():
+            deck_spellings[normalize_name(deck)][deck] += 1
+        for deck in converter.deck_names - set(converter.player_decks.values()):
+            deck_spellings[normalize_name(deck)][deck] += 1
+        for player_id, player in converter.players.items():
+            player_names[player_id][player['name']] += 1
+
+    canonical_decks = {key: spellings.most_common(1)[0][0] for key, spellings in deck_spellings.items()}
+    canonical_players = {player_id: names.most_common(1)[0][0] for player_id, names in player_names.items()}
+    for converter in converters:
+        for player_id, deck in converter.player_decks.items():
+            converter.player_decks[player_id] = canonical_decks[normalize_name(deck)]
+        converter.deck_names = {canonical_decks[normalize_name(deck)] for deck in converter.deck_names}
+        for player_id, player in converter.players.items():
+            player['name'] = canonical_players[player_id]
+
+    merged = {
+        canonical_decks[key]: sorted(spellings)
+        for key, spellings in sorted(deck_spellings.items())
+    }
+    return len(canonical_players), merged
+
+
+def batch_main(argv):
+    """Convert every raw export in a directory concurrently and write a manifest."""
+    parser = argparse.ArgumentParser(
+        prog='generate_burro_imports.py',
+        description='Convert a directory of MTG Melee exports with a process pool',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Tournament metadata (season, name, location, format, type) is kept from an
+existing <name>_import.json next to each export; otherwise the name comes
+from the file name and the season/location from the options below.
+Output goes to <directory>/build/ by default; existing files there are only
+replaced with --overwrite, so committed import files are never clobbered.
+
+Examples:
+  python generate_burro_imports.py --batch imports/
+  python generate_burro_imports.py --batch imports/ --season-id 2 --workers 4 -o build/ --overwrite
+        '''
+    )
+    parser.add_argument('--batch', dest='directory', required=True, help='Directory of raw exports (*.json)')
+    parser.add_argument('--season-id', type=int, help='Season ID for exports without an existing import file')
+    parser.add_argument('--location', help='Location for exports without an existing import file')
+    parser.add_argument('-f', '--format', default='Premodern', help='Tournament format (default: Premodern)')
+    parser.add_argument('-t', '--tournament-type', default='LGS Tournament', help='Tournament type (default: LGS Tournament)')
+    parser.add_argument('-o', '--output-dir', help='Where to write *_import.json files (default: <directory>/build)')
+    parser.add_argument('--overwrite', action='store_true', help='Replace import files that already exist in the output directory')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(), help='Worker processes (default: CPU count)')
+    parser.add_argument('--manifest', help='Manifest path (default: <output dir>/import_manifest.json)')
+    args = parser.parse_args(argv)
+
+    directory = Path(args.directory)
+    output_dir = Path(args.output_dir) if args.output_dir else directory / 'build'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = Path(args.manifest) if args.manifest else output_dir / 'import_manifest.json'
+    inputs = sorted(p for p in directory.glob('*.json') if not p.name.endswith('_import.json'))
+
+    started = time.perf_counter()
+    converted, errors, not_exports = {}, [], []
+    print(f"\nConverting {len(inputs)} files from {directory} with {args.workers} workers...")
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(convert_file, str(path)): path for path in inputs}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                converted[path] = future.result()
+            except NotAnExportError as e:
+                # Templates and other JSON files that are not Melee exports
+                not_exports.append(path.name)
+                print(f"  - {path.name}: skipped ({e})")
+            except Exception as e:
+                # Unreadable or truncated exports, unexpected records
+                errors.append({'input': path.name, 'error': str(e)})
+                print(f"  ✗ {path.name}: {e}")
+
+    paths = sorted(converted)
+    player_count, decks = merge_dictionaries([converted[path][0] for path in paths])
+
+    files = []
+    for path in paths:
+        converter, seconds = converted[path]
+        output_file = output_dir / f"{path.stem}_import.json"
+        existing_file = path.parent / f"{path.stem}_import.json"
+        tournament = {}
+        season_id = args.season_id
+        if existing_file.exists():
+            with open(existing_file, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+            tournament = existing.get('tournament') or {}
+            season_id = existing.get('season_id', season_id)
+        if season_id is None:
+            errors.append({'input': path.name, 'error': 'no existing import file; pass --season-id'})
+            print(f"  ✗ {path.name}: no existing import file; pass --season-id")
+            continue
+        if output_file.exists() and not args.overwrite:
+            errors.append({'input': path.name, 'error': f'{output_file} exists; pass --overwrite'})
+            print(f"  ✗ {path.name}: {output_file} exists; pass --overwrite")
+            continue
+
+        result = converter.to_import(
+            season_id,
+            tournament.get('name') or path.stem.replace('_', ' '),
+            tournament.get('location') or args.location,
+            tournament.get('format') or args.format,
+            tournament.get('tournament_type_name') or args.tournament_type,
+        )
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+        counts = converter.skip_counts()
+        files.append({
+            'input': path.name,
+            'output': output_file.name,
+            'tournament': result['tournament']['name'],
+            'source_id': result['tournament'].get('source_id'),
+            'seconds': round(seconds, 4),
+            **counts,
+            'matches': len(result['matches']),
+            'players': len(result['players']),
+            'decks': len(result['decks']),
+        })
+        print(
+            f"  ✓ {path.name}: {len(result['matches'])} matches, {counts['skipped_byes']} byes, "
+            f"{counts['skipped_incomplete']} incomplete, {counts['skipped_no_competitors']} without 2 competitors "
+            f"({seconds * 1000:.0f} ms)"
+        )
+
+    elapsed = time.perf_counter() - started
+    manifest = {
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'directory': str(directory),
+        'workers': args.workers,
+        'wall_seconds': round(elapsed, 3),
+        'cpu_seconds': round(sum(f['seconds'] for f in files), 3),
+        'files': files,
+        'not_exports': sorted(not_exports),
+        'errors': errors,
+        'totals': {
+            key: sum(f[key] for f in files)
+            for key in ('records', 'matches', 'skipped_byes', 'skipped_incomplete', 'skipped_no_competitors')
+        },
+        'players': player_count,
+        'decks': decks,
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    print(f"\n{'✓' if not errors else '✗'} Converted {len(files)}/{len(inputs) - len(not_exports)} exports in {elapsed:.2f}s")
+    print(f"  - Players across files: {player_count}")
+    print(f"  - Deck archetypes across files: {len(decks)}")
+    print(f"  - Manifest: {manifest_path}")
+    return 1 if errors else 0
+
+
 def main():
+    if '--batch' in sys.argv[1:]:
+        sys.exit(batch_main(sys.argv[1:]))
+
     parser = argparse.ArgumentParser(
         description='Generate tournament import file from MTG Melee JSON export',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -188,6 +381,9 @@ def main():
   python generate_burro_imports.py tournament.json 2 "OG Monthly Enero 2026" "Only Games"
   python generate_burro_imports.py tournament.json 1 "BurroSingles Monthly" "Burro Singles" -o output.json
   python generate_burro_imports.py tournament.json 2 "Tournament Name" "Location" -f Modern -t "Competitive"
+  python generate_burro_imports.py huge_export.json 2 "Tournament Name" "Location" --stream
+  python generate_burro_imports.py huge_export.json 2 "Tournament Name" "Location" --ndjson -o matches.ndjson
+  python generate_burro_imports.py --batch imports/   (see --batch --help)
         '''
     )
     
@@ -201,6 +397,10 @@ def main():
     parser.add_argument('-o', '--output', help='Output file path (default: auto-generate from input filename)')
     parser.add_argument('-f', '--format', default='Premodern', help='Tournament format (default: Premodern)')
     parser.add_argument('-t', '--tournament-type', default='LGS Tournament', help='Tournament type (default: LGS Tournament)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Read the export incrementally and write matches as they are converted (bounded memory)')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='With streaming, write one match per line instead of the import document')
     
     args = parser.parse_args()
     
@@ -218,6 +418,26 @@ def main():
     print(f"  Format: {args.format}")
     print(f"  Type: {args.tournament_type}")
     
+    if args.stream or args.ndjson:
+        try:
+            with open(output_file, 'w', encoding='utf-8') as out:
+                converter = stream_import(
+                    args.input_file, out, args.season_id, args.tournament_name,
+                    args.location, args.format, args.tournament_type, ndjson=args.ndjson
+                )
+        except (OSError, ValueError) as e:
+            print(f"\n✗ Error processing {args.input_file}: {str(e)}")
+            sys.exit(1)
+        counts = converter.skip_counts()
+        print(f"  Total records in source: {counts['records']}")
+        print(f"  Skipped (not 2 competitors): {counts['skipped_no_competitors']}")
+        print(f"  Skipped byes: {counts['skipped_byes']}")
+        print(f"  Skipped incomplete matches (< 2 games): {counts['skipped_incomplete']}")
+        print(f"\n✓ Created: {output_file}")
+        print(f"  - Players: {len(converter.players)}")
+        print(f"  - Matches: {converter.converted}")
+        return
+
     try:
         result = process_tournament_file(
             args.input_file,
@@ -4,11 +4,18 @@
 with all matches and game information extracted from the raw tournament data.
 
 Usage:
-    python regenerate_matches.py <input_file> [output_file]
+    python regenerate_matches.py <input_file> [output_file] [--stream | --ndjson]
     
 Example:
     python regenerate_matches.py imports/DataImport/ForTheChildrenShowdown.json
     python regenerate_matches.py imports/DataImport/ForTheChildrenShowdown.json imports/DataImport/ForTheChildrenShowdown_import.json
+
+Options:
+    --stream    Read the raw export record by record and write each match as
+                it is converted, so memory stays bounded for very large exports
+                (the file is read twice; the output is the same as without it)
+    --ndjson    Like --stream, but write one match per line (output defaults
+                to <input_name>_matches.ndjson)
 """
 
 import json
@@ -16,51 +23,19 @@
 import sys
 import os
 
-# Parse command line arguments
-if len(sys.argv) < 2:
-    print(__doc__)
-    print("Error: Input file is required")
-    sys.exit(1)
-
-input_file = sys.argv[1]
-
-# Determine output file (defaults to same name with _import suffix)
-if len(sys.argv) >= 3:
-    output_file = sys.argv[2]
-else:
-    base = os.path.splitext(input_file)[0]
-    output_file = f"{base}_import.json"
-
-print(f"Input file:  {input_file}")
-print(f"Output file: {output_file}")
-print()
-
-if not os.path.exists(input_file):
-    print(f"Error: Input file not found: {input_file}")
-    sys.exit(1)
-
-print("Reading raw tournament data...")
-with open(input_file, "r", encoding="utf-8") as f:
-    raw_data = json.load(f)
+# Streaming parser shared with the API (standard library only)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "services"))
+from app.melee import iter_content_records
 
-if os.path.exists(output_file):
-    print(f"Reading existing players and decks from {output_file}...")
-    with open(output_file, "r", encoding="utf-8") as f:
-        current_import = json.load(f)
-else:
-    print(f"Warning: {output_file} not found, will need to create players/decks")
-    current_import = {"season_id": 1, "tournament": {}, "players": [], "decks": []}
-
-print("Extracting matches from tournament data...")
-matches = []
 
-for match_record in raw_data.get("Content", []):
+def build_match(match_record):
+    """Convert one raw match record to the import format (None for byes)."""
     round_num = match_record.get("RoundNumber")
     result_str = match_record.get("ResultString", "")
 
     competitors = match_record.get("Competitors", [])
     if len(competitors) < 2:
-        continue
+        return None
 
     p1_info = competitors[0]
     p2_info = competitors[1]
@@ -127,7 +102,7 @@
         if "duration_minutes" not in game:
             game["duration_minutes"] = 15
 
-    match_obj = {
+    return {
         "round_number": round_num,
         "player1_name": p1_name,
         "player2_name": p2_name,
@@ -136,13 +111,97 @@
         "games": games_list
     }
 
-    matches.append(match_obj)
+
+# Parse command line arguments
+stream = "--stream" in sys.argv
+ndjson = "--ndjson" in sys.argv
+args = [a for a in sys.argv[1:] if a not in ("--stream", "--ndjson")]
+
+if len(args) < 1:
+    print(__doc__)
+    print("Error: Input file is required")
+    sys.exit(1)
+
+input_file = args[0]
+
+# Determine output file (defaults to same name with _import suffix)
+if len(args) >= 2:
+    output_file = args[1]
+else:
+    base = os.path.splitext(input_file)[0]
+    output_file = f"{base}_matches.ndjson" if ndjson else f"{base}_import.json"
+
+print(f"Input file:  {input_file}")
+print(f"Output file: {output_file}")
+print()
+
+if not os.path.exists(input_file):
+    print(f"Error: Input file not found: {input_file}")
+    sys.exit(1)
+
+if ndjson:
+    print("Streaming matches from tournament data...")
+    count = 0
+    with open(input_file, "rb") as f, open(output_file, "w", encoding="utf-8") as out:
+        for match in filter(None, map(build_match, iter_content_records(f))):
+            out.write(json.dumps(match, ensure_ascii=False) + "\n")
+            count += 1
+    print(f"✓ Wrote {count} matches to {output_file}")
+    sys.exit(0)
+
+if os.path.exists(output_file):
+    print(f"Reading existing players and decks from {output_file}...")
+    with open(output_file, "r", encoding="utf-8") as f:
+        current_import = json.load(f)
+else:
+    print(f"Warning: {output_file} not found, will need to create players/decks")
+    current_import = {"season_id": 1, "tournament": {}, "players": [], "decks": []}
+
+# Identify the tournament by its Melee id so re-imports update it instead of duplicating it
+tournament = dict(current_import["tournament"])
+tournament.pop("source_id", None)
+
+if stream:
+    print("Streaming matches from tournament data...")
+    count = 0
+    # First pass: the header needs to know whether every record is from one tournament
+    with open(input_file, "rb") as f:
+        tournament_ids = {r.get("TournamentId") for r in iter_content_records(f) if r.get("TournamentId")}
+    if len(tournament_ids) == 1:
+        tournament["source_id"] = f"melee:{tournament_ids.pop()}"
+    with open(input_file, "rb") as f, open(output_file, "w", encoding="utf-8") as out:
+        header = json.dumps({
+            "season_id": current_import["season_id"],
+            "tournament": tournament,
+            "players": current_import["players"],
+            "decks": current_import["decks"],
+        }, indent=2, ensure_ascii=False)
+        out.write(header[:-2] + ',\n  "matches": [')
+        separator = "\n    "
+        for match in filter(None, map(build_match, iter_content_records(f))):
+            out.write(separator + json.dumps(match, ensure_ascii=False))
+            separator = ",\n    "
+            count += 1
+        out.write("\n  ]\n}\n")
+    print(f"✓ Updated {output_file} with {count} properly formatted matches")
+    sys.exit(0)
+
+print("Reading raw tournament data...")
+with open(input_file, "r", encoding="utf-8") as f:
+    raw_data = json.load(f)
+
+print("Extracting matches from tournament data...")
+matches = [match for match in map(build_match, raw_data.get("Content", [])) if match is not None]
 
 print(f"Extracted {len(matches)} matches")
 
+tournament_ids = {r.get("TournamentId") for r in raw_data.get("Content", []) if r.get("TournamentId")}
+if len(tournament_ids) == 1:
+    tournament["source_id"] = f"melee:{tournament_ids.pop()}"
+
 import_data = {
     "season_id": current_import["season_id"],
-    "tournament": current_import["tournament"],
+    "tournament": tournament,
     "players": current_import["players"],
     "decks": current_import["decks"],
     "matches": matches
@@ -0,0 +1,142 @@
+"""In-process response cache for statistics queries."""
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Tuple
+import inspect
+import threading
+import time
+
+from app.config import get_settings
+from app.etag import DATA_VERSION_KEY
+
+
+class StatsCache:
+    """
+    Thread-safe LRU cache with a TTL and a bounded number of entries.
+
+    Entries are tagged with the generation they were computed in. Any write
+    that can change statistics calls ``invalidate()``, which bumps the
+    generation so older entries are treated as misses. Writes made by other
+    processes (other workers, scripts, SQL) are caught by ``cached`` keying
+    entries on the database's data version; the TTL bounds staleness only
+    for callers that have no version (no ETag guard, unmigrated database).
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return ``(found, value)`` for a key, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                generation, expires_at, value = entry
+                if generation == self.generation and expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        """Store a value computed in ``generation``; dropped if a write happened since."""
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (generation, time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Bump the generation and drop every entry."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "generation": self.generation,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+settings = get_settings()
+
+stats_cache = StatsCache(
+    max_entries=settings.stats_cache_max_entries,
+    ttl_seconds=settings.stats_cache_ttl_seconds,
+)
+
+
+def _cache_key(namespace: str, db: Any, args: tuple, kwargs: dict) -> Hashable:
+    """Namespace, data version of the request (None without an ETag guard) and arguments."""
+    version = db.info.get(DATA_VERSION_KEY)
+    return (namespace, version, args, tuple(sorted(kwargs.items())))
+
+
+def cached(namespace: str) -> Callable:
+    """
+    Cache a ``fn(db, *args, **kwargs)`` query in ``stats_cache``.
+
+    The key is the namespace plus the arguments after the session, so each
+    endpoint/parameter combination is cached separately, plus the data
+    version the route's ETag guard read through the same session (see
+    ``app.etag``). A write from any process bumps that version, so a body is
+    never reused under a newer ETag. Coroutine functions
+    (async CRUD) are supported and share entries with their sync
+    counterparts when they use the same namespace.
+    """
+    def decorator(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(db, *args, **kwargs):
+                if not stats_cache.enabled:
+                    return await fn(db, *args, **kwargs)
+                key = _cache_key(namespace, db, args, kwargs)
+                found, value = stats_cache.get(key)
+                if found:
+                    return value
+                generation = stats_cache.generation
+                value = await fn(db, *args, **kwargs)
+                stats_cache.set(key, value, generation)
+                return value
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(db, *args, **kwargs):
+            if not stats_cache.enabled:
+                return fn(db, *args, **kwargs)
+            key = _cache_key(namespace, db, args, kwargs)
+            found, value = stats_cache.get(key)
+            if found:
+                return value
+            generation = stats_cache.generation
+            value = fn(db, *args, **kwargs)
+            stats_cache.set(key, value, generation)
+            return value
+        return wrapper
+    return decorator
@@ -1,6 +1,7 @@
 """CRUD operations for DeckArchetype model."""
 from sqlalchemy.orm import Session
 from app import models, schemas
+from app.cache import stats_cache
 from typing import Optional, List
 
 
@@ -32,6 +33,7 @@ def create_deck_archetype(db: Session, deck: schemas.DeckArchetypeCreate) -> mod
     db_deck = models.DeckArchetype(**deck.model_dump())
     db.add(db_deck)
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_deck)
     return db_deck
 
@@ -47,6 +49,7 @@ def update_deck_archetype(db: Session, deck_id: int, deck: schemas.DeckArchetype
         setattr(db_deck, field, value)
     
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_deck)
     return db_deck
 
@@ -59,4 +62,5 @@ def delete_deck_archetype(db: Session, deck_id: int) -> bool:
     
     db.delete(db_deck)
     db.commit()
+    stats_cache.invalidate()
     return True
@@ -0,0 +1,131 @@
+"""Streaming export of matches with names, outcomes and games."""
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional
+import csv
+import io
+import json
+
+EXPORT_BATCH_SIZE = 500
+MAX_GAMES_PER_MATCH = 3
+
+MATCH_COLUMNS = [
+    "match_id", "tournament_id", "tournament_name", "tournament_date",
+    "season_id", "round_number", "match_date", "match_status",
+    "player1_id", "player1_name", "player2_id", "player2_name",
+    "player1_deck_id", "player1_deck_name", "player2_deck_id", "player2_deck_name",
+    "player1_game_wins", "player2_game_wins", "match_winner_id", "match_winner_name",
+]
+
+GAME_COLUMNS = ["winner_id", "winner_name", "game_result", "duration_minutes"]
+
+CSV_COLUMNS = MATCH_COLUMNS + [
+    f"game{n}_{column}"
+    for n in range(1, MAX_GAMES_PER_MATCH + 1)
+    for column in GAME_COLUMNS
+]
+
+
+def iter_match_records(
+    db: Session,
+    tournament_id: Optional[int] = None,
+    season_id: Optional[int] = None,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one dict per match, including its games, in match ID order.
+
+    Rows are read through a server-side cursor (yield_per), so memory use
+    does not depend on the number of matches. Games are aggregated per match
+    in the same statement.
+    """
+    filters = []
+    params: Dict[str, Any] = {}
+    if tournament_id:
+        filters.append("m.tournament_id = :tournament_id")
+        params["tournament_id"] = tournament_id
+    if season_id:
+        filters.append("t.season_id = :season_id")
+        params["season_id"] = season_id
+    where = f"WHERE {' AND '.join(filters)}" if filters else ""
+
+    query = text(f"""
+        SELECT
+            m.id as match_id, m.tournament_id, t.name as tournament_name,
+            t.tournament_date, t.season_id, m.round_number, m.match_date,
+            m.match_status,
+            m.player1_id, p1.name as player1_name,
+            m.player2_id, p2.name as player2_name,
+            m.player1_deck_id, d1.name as player1_deck_name,
+            m.player2_deck_id, d2.name as player2_deck_name,
+            COALESCE(mo.player1_game_wins, 0) as player1_game_wins,
+            COALESCE(mo.player2_game_wins, 0) as player2_game_wins,
+            mo.match_winner_id, pw.name as match_winner_name,
+            COALESCE(g.games, '[]'::json) as games
+        FROM matches m
+        JOIN tournaments t ON m.tournament_id = t.id
+        LEFT JOIN players p1 ON m.player1_id = p1.id
+        LEFT JOIN players p2 ON m.player2_id = p2.id
+        LEFT JOIN deck_archetypes d1 ON m.player1_deck_id = d1.id
+        LEFT JOIN deck_archetypes d2 ON m.player2_deck_id = d2.id
+        LEFT JOIN match_outcomes mo ON mo.match_id = m.id
+        LEFT JOIN players pw ON mo.match_winner_id = pw.id
+        LEFT JOIN LATERAL (
+            SELECT json_agg(
+                json_build_object(
+                    'game_number', gm.game_number,
+                    'winner_id', gm.winner_id,
+                    'winner_name', gp.name,
+                    'game_result', gm.game_result,
+                    'duration_minutes', gm.duration_minutes
+                ) ORDER BY gm.game_number
+            ) as games
+            FROM games gm
+            LEFT JOIN players gp ON gm.winner_id = gp.id
+            WHERE gm.match_id = m.id
+        ) g ON TRUE
+        {where}
+        ORDER BY m.id
+    """).execution_options(yield_per=batch_size)
+
+    for row in db.execute(query, params).mappings():
+        yield dict(row)
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def iter_ndjson(records: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize records as newline-delimited JSON, one match per line."""
+    for record in records:
+        yield json.dumps(record, default=_json_default) + "\n"
+
+
+def _csv_row(record: Dict[str, Any]) -> List[Any]:
+    """Flatten a match record into CSV_COLUMNS order (games become game{n}_* columns)."""
+    row = [record[column] for column in MATCH_COLUMNS]
+    games = {game["game_number"]: game for game in record["games"]}
+    for n in range(1, MAX_GAMES_PER_MATCH + 1):
+        game = games.get(n, {})
+        row.extend(game.get(column) for column in GAME_COLUMNS)
+    return row
+
+
+def iter_csv(records: Iterator[Dict[str, Any]], chunk_rows: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """Serialize records as CSV with a header row, yielding chunks of rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+
+    for count, record in enumerate(records, start=1):
+        writer.writerow(_csv_row(record))
+        if count % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    yield buffer.getvalue()
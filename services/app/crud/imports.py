@@ -0,0 +1,589 @@
+"""Set-based operations for complete tournament imports."""
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select, text, update
+from app import models, schemas
+from app.cache import stats_cache
+from app.crud.tournaments import resolve_tournament_type
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import csv
+import hashlib
+import io
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# progress(stage, matches_processed=None, games_processed=None), e.g. ImportJob.advance
+ProgressCallback = Callable[..., None]
+
+
+def _no_progress(stage: str, matches_processed: Optional[int] = None, games_processed: Optional[int] = None) -> None:
+    pass
+
+
+def collect_player_names(data: schemas.TournamentCompleteImport) -> Set[str]:
+    """Collect every player name referenced by the import (roster, pairings and game winners)."""
+    names = {p.name for p in data.players}
+    for match in data.matches:
+        names.add(match.player1_name)
+        names.add(match.player2_name)
+        for game in match.games:
+            names.add(game.winner_name)
+    return names
+
+
+def collect_deck_names(data: schemas.TournamentCompleteImport) -> Set[str]:
+    """Collect every deck archetype name referenced by the import."""
+    names = {d.name for d in data.decks}
+    for match in data.matches:
+        names.add(match.player1_deck_name)
+        names.add(match.player2_deck_name)
+    return names
+
+
+def get_player_ids_by_name(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Resolve player names to IDs in one query (lowest ID wins for duplicate names)."""
+    rows = db.execute(
+        text("""
+            SELECT DISTINCT ON (name) name, id
+            FROM players
+            WHERE name = ANY(:names)
+            ORDER BY name, id
+        """),
+        {"names": list(names)}
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def get_deck_ids_by_name(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Resolve deck archetype names to IDs in one query."""
+    rows = db.execute(
+        text("SELECT name, id FROM deck_archetypes WHERE name = ANY(:names)"),
+        {"names": list(names)}
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def _insert_returning_ids(db: Session, table, rows: List[dict]) -> List[int]:
+    """Multi-row INSERT ... RETURNING id, with IDs returned in parameter order."""
+    if not rows:
+        return []
+    stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+    return [row[0] for row in db.execute(stmt, rows)]
+
+
+def compute_content_hash(data: schemas.TournamentCompleteImport) -> str:
+    """SHA-256 of the import payload serialized as canonical JSON."""
+    canonical = json.dumps(data.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def find_imported_tournament(
+    db: Session,
+    source_id: Optional[str],
+    content_hash: str
+) -> Optional[models.Tournament]:
+    """Find the tournament a payload was imported as: by source id when given, else by content hash."""
+    query = db.query(models.Tournament)
+    if source_id:
+        return query.filter(models.Tournament.source_id == source_id).first()
+    return query.filter(models.Tournament.content_hash == content_hash).order_by(models.Tournament.id).first()
+
+
+def _tournament_fields(db: Session, data: schemas.TournamentCompleteImport, content_hash: str) -> dict:
+    """Column values for the imported tournament row, with the tournament type resolved."""
+    tournament_type = resolve_tournament_type(
+        db,
+        data.tournament.tournament_type_id,
+        data.tournament.tournament_type_name,
+    )
+    fields = data.tournament.model_dump(exclude={"tournament_type_name"}, exclude_none=True)
+    fields["tournament_type_id"] = tournament_type.id
+    fields["season_id"] = data.season_id
+    fields["content_hash"] = content_hash
+    return fields
+
+
+def _resolve_names(
+    db: Session,
+    data: schemas.TournamentCompleteImport
+) -> Tuple[Dict[str, int], Dict[str, int], int, int]:
+    """
+    Map every referenced player and deck name to an ID, creating missing rows.
+
+    Returns (player_map, deck_map, players_created, decks_created).
+
+    Raises:
+        ValueError: If a new deck is referenced but not defined in the decks array.
+    """
+    # Players: resolve existing names in bulk, insert the rest in one statement
+    player_names = collect_player_names(data)
+    player_map = get_player_ids_by_name(db, player_names)
+    player_emails = {p.name: p.email for p in data.players}
+    new_player_names = sorted(player_names - player_map.keys())
+    new_player_ids = _insert_returning_ids(db, models.Player.__table__, [
+        {"name": name, "email": player_emails.get(name), "active": True}
+        for name in new_player_names
+    ])
+    player_map.update(zip(new_player_names, new_player_ids))
+    logger.info(f"Players processed: {len(new_player_names)} created, {len(player_names) - len(new_player_names)} existing")
+
+    # Decks: same pattern, but undefined decks are an error
+    deck_names = collect_deck_names(data)
+    deck_map = get_deck_ids_by_name(db, deck_names)
+    deck_definitions = {d.name: d for d in data.decks}
+    new_deck_names = sorted(deck_names - deck_map.keys())
+    undefined = [name for name in new_deck_names if name not in deck_definitions]
+    if undefined:
+        raise ValueError(
+            f"Deck '{undefined[0]}' referenced in matches but not defined in decks array"
+        )
+    new_deck_ids = _insert_returning_ids(db, models.DeckArchetype.__table__, [
+        {
+            "name": name,
+            "color_identity": deck_definitions[name].color_identity,
+            "archetype_type": deck_definitions[name].archetype_type,
+            "description": deck_definitions[name].description,
+        }
+        for name in new_deck_names
+    ])
+    deck_map.update(zip(new_deck_names, new_deck_ids))
+    logger.info(f"Decks processed: {len(new_deck_names)} created, {len(deck_names) - len(new_deck_names)} existing")
+
+    return player_map, deck_map, len(new_player_names), len(new_deck_names)
+
+
+def _sync_matches(
+    db: Session,
+    tournament_id: int,
+    data: schemas.TournamentCompleteImport,
+    player_map: Dict[str, int],
+    deck_map: Dict[str, int]
+) -> Dict[str, int]:
+    """
+    Bring a tournament's stored matches and games in line with the import.
+
+    Matches are paired by (round, player 1, player 2) and games by game
+    number. Only the differences are written: new matches and games are
+    inserted, changed decks and game results updated, and stored matches
+    or games missing from the import deleted. Returns per-kind row counts.
+    """
+    M, G = models.Match, models.Game
+    stored = defaultdict(list)
+    for row in db.execute(
+        select(M.id, M.round_number, M.player1_id, M.player2_id, M.player1_deck_id, M.player2_deck_id)
+        .where(M.tournament_id == tournament_id)
+        .order_by(M.id)
+    ):
+        stored[(row.round_number, row.player1_id, row.player2_id)].append(row)
+    stored_games = defaultdict(dict)
+    for row in db.execute(
+        select(G.id, G.match_id, G.game_number, G.winner_id, G.game_result, G.duration_minutes)
+        .join(M, M.id == G.match_id)
+        .where(M.tournament_id == tournament_id)
+    ):
+        stored_games[row.match_id][row.game_number] = row
+
+    new_matches = []
+    match_updates, game_updates, game_rows, game_deletes = [], [], [], []
+    changed_match_ids = set()
+    for m in data.matches:
+        key = (m.round_number, player_map[m.player1_name], player_map[m.player2_name])
+        decks = (deck_map[m.player1_deck_name], deck_map[m.player2_deck_name])
+        if not stored.get(key):
+            new_matches.append((key, decks, m))
+            continue
+
+        row = stored[key].pop(0)
+        if (row.player1_deck_id, row.player2_deck_id) != decks:
+            match_updates.append({"id": row.id, "player1_deck_id": decks[0], "player2_deck_id": decks[1]})
+            changed_match_ids.add(row.id)
+
+        old_games = stored_games.get(row.id, {})
+        new_numbers = {g.game_number for g in m.games}
+        for g in m.games:
+            values = {"winner_id": player_map[g.winner_name], "game_result": "WIN", "duration_minutes": g.duration_minutes}
+            old = old_games.get(g.game_number)
+            if old is None:
+                game_rows.append({"match_id": row.id, "game_number": g.game_number, **values})
+            elif (old.winner_id, old.game_result, old.duration_minutes) != tuple(values.values()):
+                game_updates.append({"id": old.id, **values})
+            else:
+                continue
+            changed_match_ids.add(row.id)
+        for number, old in old_games.items():
+            if number not in new_numbers:
+                game_deletes.append(old.id)
+                changed_match_ids.add(row.id)
+
+    # Stored matches the import no longer contains (their games cascade)
+    removed_ids = [row.id for rows in stored.values() for row in rows]
+    if removed_ids:
+        db.execute(delete(M).where(M.id.in_(removed_ids)))
+    if game_deletes:
+        db.execute(delete(G).where(G.id.in_(game_deletes)))
+    if match_updates:
+        db.execute(update(M), match_updates)
+    if game_updates:
+        db.execute(update(G), game_updates)
+
+    new_match_ids = _insert_returning_ids(db, M.__table__, [
+        {
+            "tournament_id": tournament_id,
+            "player1_id": key[1],
+            "player2_id": key[2],
+            "player1_deck_id": decks[0],
+            "player2_deck_id": decks[1],
+            "round_number": key[0],
+            "match_status": "COMPLETED",
+        }
+        for key, decks, _ in new_matches
+    ])
+    game_rows.extend(
+        {
+            "match_id": match_id,
+            "game_number": g.game_number,
+            "winner_id": player_map[g.winner_name],
+            "game_result": "WIN",
+            "duration_minutes": g.duration_minutes,
+        }
+        for match_id, (_, _, m) in zip(new_match_ids, new_matches)
+        for g in m.games
+    )
+    if game_rows:
+        db.execute(insert(G.__table__), game_rows)
+
+    return {
+        "matches_created": len(new_match_ids),
+        "matches_updated": len(changed_match_ids),
+        "matches_deleted": len(removed_ids),
+        "matches_unchanged": len(data.matches) - len(new_match_ids) - len(changed_match_ids),
+        "games_created": len(game_rows),
+        "games_updated": len(game_updates),
+        "games_deleted": len(game_deletes) + sum(len(stored_games.get(i, {})) for i in removed_ids),
+    }
+
+
+def _reimport_tournament(
+    db: Session,
+    tournament: models.Tournament,
+    data: schemas.TournamentCompleteImport,
+    content_hash: str,
+    progress: ProgressCallback = _no_progress
+) -> schemas.TournamentImportResponse:
+    """Re-import into an existing tournament: a no-op if the payload is unchanged, else a diff."""
+    if tournament.content_hash == content_hash:
+        logger.info(f"Tournament {tournament.id} already imported with identical content, skipping")
+        return schemas.TournamentImportResponse(
+            success=True,
+            message=f"Tournament '{tournament.name}' is already up to date",
+            tournament_id=tournament.id,
+            tournament_created=False,
+            status="unchanged",
+            players_created=0,
+            decks_created=0,
+            matches_created=0,
+            games_created=0,
+            matches_unchanged=len(data.matches)
+        )
+
+    for field, value in _tournament_fields(db, data, content_hash).items():
+        setattr(tournament, field, value)
+    db.flush()
+
+    progress("resolving names")
+    player_map, deck_map, players_created, decks_created = _resolve_names(db, data)
+    progress("syncing matches")
+    counts = _sync_matches(db, tournament.id, data, player_map, deck_map)
+
+    progress("committing")
+    db.commit()
+    stats_cache.invalidate()
+    logger.info(f"Re-imported tournament {tournament.id}: {counts}")
+
+    return schemas.TournamentImportResponse(
+        success=True,
+        message=f"Successfully updated tournament '{tournament.name}'",
+        tournament_id=tournament.id,
+        tournament_created=False,
+        status="updated",
+        players_created=players_created,
+        decks_created=decks_created,
+        **counts
+    )
+
+
+def import_complete_tournament(
+    db: Session,
+    data: schemas.TournamentCompleteImport,
+    progress: ProgressCallback = _no_progress
+) -> schemas.TournamentImportResponse:
+    """
+    Import a tournament with its players, decks, matches and games atomically.
+
+    Names are resolved with one ``= ANY(...)`` query per entity, missing rows
+    are created with multi-row inserts, and everything is committed once.
+
+    A payload already imported (same ``source_id``, or same content hash
+    when there is none) is not duplicated: an identical one is skipped and a
+    changed one only rewrites the matches and games that differ.
+
+    ``progress`` is called with the current stage and the number of matches
+    and games written so far, for background jobs to report.
+
+    Raises:
+        ValueError: If the tournament type or a referenced name cannot be resolved.
+    """
+    content_hash = compute_content_hash(data)
+    existing = find_imported_tournament(db, data.tournament.source_id, content_hash)
+    if existing is not None:
+        return _reimport_tournament(db, existing, data, content_hash, progress)
+
+    new_tournament = models.Tournament(**_tournament_fields(db, data, content_hash))
+    db.add(new_tournament)
+    db.flush()
+    logger.info(f"Tournament created with ID: {new_tournament.id}")
+
+    progress("resolving names")
+    player_map, deck_map, players_created, decks_created = _resolve_names(db, data)
+
+    # Matches: one multi-row insert, IDs come back in input order
+    progress("inserting matches")
+    match_ids = _insert_returning_ids(db, models.Match.__table__, [
+        {
+            "tournament_id": new_tournament.id,
+            "player1_id": player_map[m.player1_name],
+            "player2_id": player_map[m.player2_name],
+            "player1_deck_id": deck_map[m.player1_deck_name],
+            "player2_deck_id": deck_map[m.player2_deck_name],
+            "round_number": m.round_number,
+            "match_status": "COMPLETED",
+        }
+        for m in data.matches
+    ])
+    progress("inserting games", matches_processed=len(match_ids))
+
+    # Games: one batched insert for the whole tournament
+    game_rows = [
+        {
+            "match_id": match_id,
+            "game_number": g.game_number,
+            "winner_id": player_map[g.winner_name],
+            "game_result": "WIN",
+            "duration_minutes": g.duration_minutes,
+        }
+        for match_id, m in zip(match_ids, data.matches)
+        for g in m.games
+    ]
+    if game_rows:
+        db.execute(insert(models.Game.__table__), game_rows)
+
+    progress("committing", games_processed=len(game_rows))
+    db.commit()
+    stats_cache.invalidate()
+    logger.info(f"Successfully imported {len(match_ids)} matches and {len(game_rows)} games")
+
+    return schemas.TournamentImportResponse(
+        success=True,
+        message=f"Successfully imported tournament '{new_tournament.name}'",
+        tournament_id=new_tournament.id,
+        tournament_created=True,
+        players_created=players_created,
+        decks_created=decks_created,
+        matches_created=len(match_ids),
+        games_created=len(game_rows)
+    )
+
+
+# ============================================================================
+# COPY-BASED BULK IMPORT
+# ============================================================================
+
+# Dropped first so repeated imports inside one outer transaction (savepoints) work.
+# The DROP is schema-qualified so it can never hit permanent tables of the same name.
+STAGING_TABLES = """
+    DROP TABLE IF EXISTS pg_temp.stage_players, pg_temp.stage_decks, pg_temp.stage_matches, pg_temp.stage_games;
+    CREATE TEMP TABLE stage_players (
+        name TEXT NOT NULL,
+        email TEXT
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE stage_decks (
+        name TEXT NOT NULL,
+        color_identity TEXT,
+        archetype_type TEXT,
+        description TEXT
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE stage_matches (
+        ord INTEGER PRIMARY KEY,
+        round_number INTEGER NOT NULL,
+        player1_name TEXT NOT NULL,
+        player2_name TEXT NOT NULL,
+        player1_deck_name TEXT NOT NULL,
+        player2_deck_name TEXT NOT NULL,
+        match_id INTEGER
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE stage_games (
+        match_ord INTEGER NOT NULL,
+        game_number INTEGER NOT NULL,
+        winner_name TEXT NOT NULL,
+        duration_minutes INTEGER
+    ) ON COMMIT DROP;
+"""
+
+
+def copy_rows(cursor, table: str, columns: List[str], rows: Iterable[tuple]) -> None:
+    """Stream rows into a table with COPY ... FROM STDIN (CSV)."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _stage_import(db: Session, data: schemas.TournamentCompleteImport) -> None:
+    """Create the per-transaction staging tables and COPY the import into them."""
+    db.execute(text(STAGING_TABLES))
+    cursor = db.connection().connection.cursor()
+    try:
+        copy_rows(cursor, "stage_players", ["name", "email"], ((p.name, p.email) for p in data.players))
+        copy_rows(
+            cursor, "stage_decks", ["name", "color_identity", "archetype_type", "description"],
+            ((d.name, d.color_identity, d.archetype_type, d.description) for d in data.decks)
+        )
+        copy_rows(
+            cursor, "stage_matches",
+            ["ord", "round_number", "player1_name", "player2_name", "player1_deck_name", "player2_deck_name"],
+            (
+                (i, m.round_number, m.player1_name, m.player2_name, m.player1_deck_name, m.player2_deck_name)
+                for i, m in enumerate(data.matches)
+            )
+        )
+        copy_rows(
+            cursor, "stage_games", ["match_ord", "game_number", "winner_name", "duration_minutes"],
+            ((i, g.game_number, g.winner_name, g.duration_minutes) for i, m in enumerate(data.matches) for g in m.games)
+        )
+    finally:
+        cursor.close()
+
+
+def bulk_import_tournament(
+    db: Session,
+    data: schemas.TournamentCompleteImport
+) -> schemas.TournamentImportResponse:
+    """
+    Import a tournament through COPY into staging tables and set-based merges.
+
+    Same semantics as ``import_complete_tournament`` (players created by
+    name, decks must be defined when new, all games stored as wins), but the
+    rows are streamed with COPY and merged with a fixed number of
+    INSERT ... SELECT statements regardless of tournament size. Everything
+    happens in the caller's transaction and is committed once.
+
+    Files that were already imported are handed to the endpoint's diff-based
+    re-import instead, so reloading a directory does not duplicate them.
+
+    Raises:
+        ValueError: If the tournament type or a referenced deck cannot be resolved.
+    """
+    content_hash = compute_content_hash(data)
+    existing = find_imported_tournament(db, data.tournament.source_id, content_hash)
+    if existing is not None:
+        return _reimport_tournament(db, existing, data, content_hash)
+
+    new_tournament = models.Tournament(**_tournament_fields(db, data, content_hash))
+    db.add(new_tournament)
+    db.flush()
+
+    _stage_import(db, data)
+
+    # Players: every referenced name, email taken from the roster when present
+    players_created = db.execute(text("""
+        INSERT INTO players (name, email, active)
+        SELECT n.name, (SELECT sp.email FROM stage_players sp WHERE sp.name = n.name LIMIT 1), TRUE
+        FROM (
+            SELECT name FROM stage_players
+            UNION SELECT player1_name FROM stage_matches
+            UNION SELECT player2_name FROM stage_matches
+            UNION SELECT winner_name FROM stage_games
+        ) n
+        WHERE NOT EXISTS (SELECT 1 FROM players p WHERE p.name = n.name)
+        ORDER BY n.name
+    """)).rowcount
+
+    undefined = db.execute(text("""
+        SELECT n.name
+        FROM (
+            SELECT player1_deck_name AS name FROM stage_matches
+            UNION SELECT player2_deck_name FROM stage_matches
+        ) n
+        WHERE NOT EXISTS (SELECT 1 FROM deck_archetypes da WHERE da.name = n.name)
+          AND NOT EXISTS (SELECT 1 FROM stage_decks sd WHERE sd.name = n.name)
+        ORDER BY n.name
+        LIMIT 1
+    """)).scalar()
+    if undefined:
+        raise ValueError(f"Deck '{undefined}' referenced in matches but not defined in decks array")
+
+    decks_created = db.execute(text("""
+        INSERT INTO deck_archetypes (name, color_identity, archetype_type, description)
+        SELECT DISTINCT ON (sd.name) sd.name, sd.color_identity, sd.archetype_type, sd.description
+        FROM stage_decks sd
+        WHERE NOT EXISTS (SELECT 1 FROM deck_archetypes da WHERE da.name = sd.name)
+        ORDER BY sd.name
+    """)).rowcount
+
+    # Reserve match ids so games can reference them without RETURNING order
+    db.execute(text("UPDATE stage_matches SET match_id = nextval(pg_get_serial_sequence('matches', 'id'))"))
+
+    matches_created = db.execute(
+        text("""
+            WITH player_ids AS (
+                SELECT DISTINCT ON (name) name, id FROM players
+                WHERE name IN (SELECT player1_name FROM stage_matches UNION SELECT player2_name FROM stage_matches)
+                ORDER BY name, id
+            )
+            INSERT INTO matches (
+                id, tournament_id, player1_id, player2_id,
+                player1_deck_id, player2_deck_id, round_number, match_status
+            )
+            SELECT sm.match_id, :tournament_id, p1.id, p2.id, d1.id, d2.id, sm.round_number, 'COMPLETED'
+            FROM stage_matches sm
+            JOIN player_ids p1 ON p1.name = sm.player1_name
+            JOIN player_ids p2 ON p2.name = sm.player2_name
+            JOIN deck_archetypes d1 ON d1.name = sm.player1_deck_name
+            JOIN deck_archetypes d2 ON d2.name = sm.player2_deck_name
+            ORDER BY sm.ord
+        """),
+        {"tournament_id": new_tournament.id}
+    ).rowcount
+
+    games_created = db.execute(text("""
+        WITH player_ids AS (
+            SELECT DISTINCT ON (name) name, id FROM players
+            WHERE name IN (SELECT winner_name FROM stage_games)
+            ORDER BY name, id
+        )
+        INSERT INTO games (match_id, game_number, winner_id, game_result, duration_minutes)
+        SELECT sm.match_id, sg.game_number, w.id, 'WIN', sg.duration_minutes
+        FROM stage_games sg
+        JOIN stage_matches sm ON sm.ord = sg.match_ord
+        JOIN player_ids w ON w.name = sg.winner_name
+        ORDER BY sg.match_ord, sg.game_number
+    """)).rowcount
+
+    db.commit()
+    stats_cache.invalidate()
+    logger.info(
+        f"Bulk imported tournament {new_tournament.id}: {matches_created} matches, {games_created} games"
+    )
+
+    return schemas.TournamentImportResponse(
+        success=True,
+        message=f"Successfully imported tournament '{new_tournament.name}'",
+        tournament_id=new_tournament.id,
+        tournament_created=True,
+        players_created=players_created,
+        decks_created=decks_created,
+        matches_created=matches_created,
+        games_created=games_created
+    )
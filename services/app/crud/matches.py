@@ -1,33 +1,99 @@
 """CRUD operations for Match and Game models."""
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy import desc, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from app import models, schemas
+from app.cache import stats_cache
+from datetime import datetime
 from typing import Optional, List, Tuple
 
 
+def _match_with_names_select():
+    """Build a match SELECT that joins player and deck names in the same statement."""
+    player1 = aliased(models.Player)
+    player2 = aliased(models.Player)
+    deck1 = aliased(models.DeckArchetype)
+    deck2 = aliased(models.DeckArchetype)
+    
+    return (
+        select(models.Match, player1.name, player2.name, deck1.name, deck2.name)
+        .outerjoin(player1, player1.id == models.Match.player1_id)
+        .outerjoin(player2, player2.id == models.Match.player2_id)
+        .outerjoin(deck1, deck1.id == models.Match.player1_deck_id)
+        .outerjoin(deck2, deck2.id == models.Match.player2_deck_id)
+        .options(selectinload(models.Match.games))
+    )
+
+
+def _attach_names(row) -> models.Match:
+    """Attach joined player and deck names to the match object for serialization."""
+    match, player1_name, player2_name, deck1_name, deck2_name = row
+    match.player1_name = player1_name or f"Player {match.player1_id}"
+    match.player2_name = player2_name or f"Player {match.player2_id}"
+    match.player1_deck_name = deck1_name or f"Deck {match.player1_deck_id}"
+    match.player2_deck_name = deck2_name or f"Deck {match.player2_deck_id}"
+    return match
+
+
 def get_match(db: Session, match_id: int) -> Optional[models.Match]:
     """Get a match by ID with player and deck names populated."""
-    match = db.query(models.Match).filter(models.Match.id == match_id).first()
+    row = db.execute(_match_with_names_select().where(models.Match.id == match_id)).first()
     
-    if not match:
+    if not row:
         return None
     
-    # Get player names
-    player1 = db.query(models.Player).filter(models.Player.id == match.player1_id).first()
-    player2 = db.query(models.Player).filter(models.Player.id == match.player2_id).first()
+    return _attach_names(row)
+
+
+def _filter_match_list(
+    stmt,
+    tournament_id: Optional[int] = None,
+    player_id: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None
+):
+    """Apply the list filters, keyset position and (match_date, id) descending order."""
+    if tournament_id:
+        stmt = stmt.where(models.Match.tournament_id == tournament_id)
     
-    # Get deck names
-    deck1 = db.query(models.DeckArchetype).filter(models.DeckArchetype.id == match.player1_deck_id).first()
-    deck2 = db.query(models.DeckArchetype).filter(models.DeckArchetype.id == match.player2_deck_id).first()
+    if player_id:
+        stmt = stmt.where(
+            (models.Match.player1_id == player_id) | 
+            (models.Match.player2_id == player_id)
+        )
     
-    # Attach to match object for serialization
-    match.player1_name = player1.name if player1 else f"Player {match.player1_id}"
-    match.player2_name = player2.name if player2 else f"Player {match.player2_id}"
-    match.player1_deck_name = deck1.name if deck1 else f"Deck {match.player1_deck_id}"
-    match.player2_deck_name = deck2.name if deck2 else f"Deck {match.player2_deck_id}"
+    if after:
+        match_date, match_id = after
+        stmt = stmt.where(
+            models.Match.match_date <= match_date,
+            or_(models.Match.match_date < match_date, models.Match.id < match_id)
+        )
     
-    return match
+    return stmt.order_by(desc(models.Match.match_date), desc(models.Match.id))
+
+
+def _match_list_select(
+    skip: int = 0, 
+    limit: int = 100,
+    tournament_id: Optional[int] = None,
+    player_id: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None
+):
+    """Build the SELECT behind get_matches / get_matches_async."""
+    stmt = _filter_match_list(_match_with_names_select(), tournament_id, player_id, after)
+    return stmt.offset(0 if after else skip).limit(limit)
+
+
+def _match_next_key_select(
+    skip: int = 0, 
+    limit: int = 100,
+    tournament_id: Optional[int] = None,
+    player_id: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None
+):
+    """Build the SELECT of the sort key of the last row of the same page."""
+    stmt = _filter_match_list(select(models.Match.match_date, models.Match.id), tournament_id, player_id, after)
+    return stmt.offset((0 if after else skip) + limit - 1).limit(1)
 
 
 def get_matches(
@@ -35,46 +101,118 @@ def get_matches(
     skip: int = 0, 
     limit: int = 100,
     tournament_id: Optional[int] = None,
-    player_id: Optional[int] = None
+    player_id: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None
 ) -> List[models.Match]:
-    """Get list of matches with player and deck names populated."""
-    query = db.query(models.Match)
+    """
+    Get list of matches with player and deck names populated.
     
-    if tournament_id:
-        query = query.filter(models.Match.tournament_id == tournament_id)
+    Names are resolved with aliased joins and games are loaded with a single
+    SELECT ... IN, so the statement count stays constant regardless of limit.
+    Rows are ordered by (match_date, id) descending; ``after`` is a decoded
+    cursor key (match_date, id) that replaces skip, and the page starts right
+    after that row (keyset on idx_matches_date).
+    """
+    stmt = _match_list_select(skip, limit, tournament_id, player_id, after)
+    rows = db.execute(stmt).all()
     
-    if player_id:
-        query = query.filter(
-            (models.Match.player1_id == player_id) | 
-            (models.Match.player2_id == player_id)
-        )
+    return [_attach_names(row) for row in rows]
+
+
+def get_matches_next_key(
+    db: Session, 
+    skip: int = 0, 
+    limit: int = 100,
+    tournament_id: Optional[int] = None,
+    player_id: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None
+) -> Optional[Tuple[datetime, int]]:
+    """
+    Sort key of the last row of the page get_matches would return, if the page is full.
     
-    matches = query.order_by(desc(models.Match.match_date)).offset(skip).limit(limit).all()
+    The next page's cursor, read from the index alone, for answering a 304
+    without loading the page.
+    """
+    if limit <= 0:
+        return None
+    row = db.execute(_match_next_key_select(skip, limit, tournament_id, player_id, after)).first()
+    return tuple(row) if row else None
+
+
+async def get_matches_async(
+    db: AsyncSession, 
+    skip: int = 0, 
+    limit: int = 100,
+    tournament_id: Optional[int] = None,
+    player_id: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None
+) -> List[models.Match]:
+    """Async variant of get_matches (same statements) for the async stack."""
+    stmt = _match_list_select(skip, limit, tournament_id, player_id, after)
+    rows = (await db.execute(stmt)).all()
     
-    # Populate player and deck names
-    for match in matches:
-        # Get player names
-        player1 = db.query(models.Player).filter(models.Player.id == match.player1_id).first()
-        player2 = db.query(models.Player).filter(models.Player.id == match.player2_id).first()
-        
-        # Get deck names
-        deck1 = db.query(models.DeckArchetype).filter(models.DeckArchetype.id == match.player1_deck_id).first()
-        deck2 = db.query(models.DeckArchetype).filter(models.DeckArchetype.id == match.player2_deck_id).first()
-        
-        # Attach to match object for serialization
-        match.player1_name = player1.name if player1 else f"Player {match.player1_id}"
-        match.player2_name = player2.name if player2 else f"Player {match.player2_id}"
-        match.player1_deck_name = deck1.name if deck1 else f"Deck {match.player1_deck_id}"
-        match.player2_deck_name = deck2.name if deck2 else f"Deck {match.player2_deck_id}"
+    return [_attach_names(row) for row in rows]
+
+
+async def get_matches_next_key_async(
+    db: AsyncSession, 
+    skip: int = 0, 
+    limit: int = 100,
+    tournament_id: Optional[int] = None,
+    player_id: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None
+) -> Optional[Tuple[datetime, int]]:
+    """Async variant of get_matches_next_key for the async stack."""
+    if limit <= 0:
+        return None
+    row = (await db.execute(_match_next_key_select(skip, limit, tournament_id, player_id, after))).first()
+    return tuple(row) if row else None
+
+
+def get_tournament_matches(db: Session, tournament_id: int) -> List[models.Match]:
+    """
+    Get every match of a tournament with names, games and derived match outcome.
+    
+    Uses the same two statements as get_matches; match winners are derived in
+    Python with the rules of the match_results view (first to 2 game wins).
+    """
+    rows = db.execute(
+        _match_with_names_select()
+        .where(models.Match.tournament_id == tournament_id)
+        .order_by(models.Match.round_number, models.Match.id)
+    ).all()
     
+    matches = [_attach_names(row) for row in rows]
+    for match in matches:
+        _attach_outcome(match)
     return matches
 
 
+def _attach_outcome(match: models.Match) -> models.Match:
+    """Attach game-win counts and match winner derived from the loaded games."""
+    p1_wins = sum(1 for g in match.games if g.game_result == 'WIN' and g.winner_id == match.player1_id)
+    p2_wins = sum(1 for g in match.games if g.game_result == 'WIN' and g.winner_id == match.player2_id)
+    
+    match.player1_game_wins = p1_wins
+    match.player2_game_wins = p2_wins
+    if p1_wins >= 2:
+        match.match_winner_id = match.player1_id
+        match.match_winner_name = match.player1_name
+    elif p2_wins >= 2:
+        match.match_winner_id = match.player2_id
+        match.match_winner_name = match.player2_name
+    else:
+        match.match_winner_id = None
+        match.match_winner_name = None
+    return match
+
+
 def create_match(db: Session, match: schemas.MatchCreate) -> models.Match:
     """Create a new match."""
     db_match = models.Match(**match.model_dump())
     db.add(db_match)
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_match)
     return db_match
 
@@ -90,6 +228,7 @@ def update_match(db: Session, match_id: int, match: schemas.MatchUpdate) -> Opti
         setattr(db_match, field, value)
     
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_match)
     return db_match
 
@@ -102,6 +241,7 @@ def delete_match(db: Session, match_id: int) -> bool:
     
     db.delete(db_match)
     db.commit()
+    stats_cache.invalidate()
     return True
 
 
@@ -122,6 +262,7 @@ def create_game(db: Session, match_id: int, game: schemas.GameCreate) -> models.
     db_game = models.Game(match_id=match_id, **game.model_dump())
     db.add(db_game)
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_game)
     return db_game
 
@@ -137,6 +278,7 @@ def update_game(db: Session, game_id: int, game: schemas.GameUpdate) -> Optional
         setattr(db_game, field, value)
     
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_game)
     return db_game
 
@@ -149,6 +291,7 @@ def delete_game(db: Session, game_id: int) -> bool:
     
     db.delete(db_game)
     db.commit()
+    stats_cache.invalidate()
     return True
 
 
@@ -183,6 +326,7 @@ def create_match_with_games(
             db.add(db_game)
         
         db.commit()
+        stats_cache.invalidate()
         db.refresh(db_match)
         return db_match, None
         
@@ -1,7 +1,9 @@
 """CRUD operations for Player model."""
 from sqlalchemy.orm import Session
+from sqlalchemy import or_
 from app import models, schemas
-from typing import Optional, List
+from app.cache import stats_cache
+from typing import Optional, List, Tuple
 
 
 def get_player(db: Session, player_id: int) -> Optional[models.Player]:
@@ -19,12 +21,49 @@ def get_player_by_name(db: Session, name: str) -> Optional[models.Player]:
     return db.query(models.Player).filter(models.Player.name == name).first()
 
 
-def get_players(db: Session, skip: int = 0, limit: int = 100, active_only: bool = False) -> List[models.Player]:
-    """Get list of players."""
-    query = db.query(models.Player)
+def _filter_player_list(query, active_only: bool = False, after: Optional[Tuple[str, int]] = None):
+    """Apply the list filters, keyset position and (name, id) order."""
     if active_only:
         query = query.filter(models.Player.active == True)
-    return query.order_by(models.Player.name).offset(skip).limit(limit).all()
+    if after:
+        name, player_id = after
+        query = query.filter(
+            models.Player.name >= name,
+            or_(models.Player.name > name, models.Player.id > player_id)
+        )
+    return query.order_by(models.Player.name, models.Player.id)
+
+
+def get_players(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    active_only: bool = False,
+    after: Optional[Tuple[str, int]] = None
+) -> List[models.Player]:
+    """
+    Get list of players ordered by (name, id).
+    
+    ``after`` is a decoded cursor key (name, id); it replaces skip and the
+    page continues right after that row (keyset on idx_players_name).
+    """
+    query = _filter_player_list(db.query(models.Player), active_only, after)
+    return query.offset(0 if after else skip).limit(limit).all()
+
+
+def get_players_next_key(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    active_only: bool = False,
+    after: Optional[Tuple[str, int]] = None
+) -> Optional[Tuple[str, int]]:
+    """Sort key of the last row of the page get_players would return, if the page is full."""
+    if limit <= 0:
+        return None
+    query = _filter_player_list(db.query(models.Player.name, models.Player.id), active_only, after)
+    row = query.offset((0 if after else skip) + limit - 1).limit(1).first()
+    return tuple(row) if row else None
 
 
 def create_player(db: Session, player: schemas.PlayerCreate) -> models.Player:
@@ -32,6 +71,7 @@ def create_player(db: Session, player: schemas.PlayerCreate) -> models.Player:
     db_player = models.Player(**player.model_dump())
     db.add(db_player)
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_player)
     return db_player
 
@@ -47,6 +87,7 @@ def update_player(db: Session, player_id: int, player: schemas.PlayerUpdate) ->
         setattr(db_player, field, value)
     
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_player)
     return db_player
 
@@ -59,4 +100,5 @@ def delete_player(db: Session, player_id: int) -> bool:
     
     db.delete(db_player)
     db.commit()
+    stats_cache.invalidate()
     return True
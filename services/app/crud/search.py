@@ -0,0 +1,113 @@
+"""Ranked name search over players, decks, tournaments, locations and seasons.
+
+Matching is backed by the pg_trgm GIN indexes from 10_search_trgm.sql: a
+hit contains the query as a substring (ILIKE) or is close to it by trigram
+word similarity (the ``<%`` operator), so typos still find the name.
+"""
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+from app import schemas
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# type -> (table, column matched against the query, tournament location column)
+SEARCH_TYPES = {
+    "player": ("players", "name", None),
+    "deck": ("deck_archetypes", "name", None),
+    "tournament": ("tournaments", "name", "location"),
+    "location": ("tournaments", "location", "location"),
+    "season": ("seasons", "name", None),
+}
+
+# Cleared the first time a query fails because pg_trgm is not installed
+_trigram_available = True
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so the query is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _type_query(search_type: str, trigram: bool) -> str:
+    """SELECT returning (type, id, name, location, score, prefix) for one type's hits."""
+    table, column, location = SEARCH_TYPES[search_type]
+    if trigram:
+        score = f"word_similarity(:q, {column})"
+        condition = f"({column} ILIKE :pattern OR :q <% {column})"
+    else:
+        score = f"CAST(length(:q) AS FLOAT) / GREATEST(length({column}), 1)"
+        condition = f"{column} ILIKE :pattern"
+    return f"""
+        SELECT '{search_type}' AS type, id, name,
+               {location or 'CAST(NULL AS VARCHAR)'} AS location,
+               {score} AS score,
+               {column} ILIKE :prefix AS prefix
+        FROM {table}
+        WHERE {condition}
+    """
+
+
+def search(
+    db: Session,
+    q: str,
+    search_type: Optional[str] = None,
+    limit: int = 10
+) -> List[schemas.SearchHit]:
+    """
+    Search names, best matches first.
+
+    Names starting with the query rank first, then by word similarity, then
+    alphabetically. ``search_type`` limits the search to one of
+    ``SEARCH_TYPES`` (all of them when None). Location hits are the
+    tournaments held at a matching location.
+
+    Without pg_trgm the search falls back to substring matching ranked by
+    how much of the name the query covers (logged once per process).
+    """
+    global _trigram_available
+
+    q = q.strip()
+    if not q:
+        return []
+    types = [search_type] if search_type else list(SEARCH_TYPES)
+    params = {
+        "q": q,
+        "pattern": f"%{_escape_like(q)}%",
+        "prefix": f"{_escape_like(q)}%",
+        "limit": limit,
+    }
+
+    def run(trigram: bool):
+        union = " UNION ALL ".join(_type_query(t, trigram) for t in types)
+        query = text(f"""
+            SELECT type, id, name, location, score
+            FROM ({union}) hits
+            ORDER BY prefix DESC, score DESC, name, id
+            LIMIT :limit
+        """)
+        return db.execute(query, params).fetchall()
+
+    rows = None
+    if _trigram_available:
+        try:
+            rows = run(trigram=True)
+        except ProgrammingError:
+            db.rollback()
+            _trigram_available = False
+            logger.warning("pg_trgm not available; name search falls back to ILIKE (run database/10_search_trgm.sql)")
+    if rows is None:
+        rows = run(trigram=False)
+
+    return [
+        schemas.SearchHit(
+            type=row[0],
+            id=row[1],
+            name=row[2],
+            location=row[3],
+            score=round(float(row[4] or 0), 4)
+        )
+        for row in rows
+    ]
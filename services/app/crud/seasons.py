@@ -2,6 +2,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from app import models, schemas
+from app.cache import stats_cache
 from typing import Optional, List
 
 
@@ -20,6 +21,7 @@ def create_season(db: Session, season: schemas.SeasonCreate) -> models.Season:
     db_season = models.Season(**season.model_dump())
     db.add(db_season)
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_season)
     return db_season
 
@@ -35,6 +37,7 @@ def update_season(db: Session, season_id: int, season: schemas.SeasonUpdate) ->
         setattr(db_season, field, value)
     
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_season)
     return db_season
 
@@ -47,4 +50,5 @@ def delete_season(db: Session, season_id: int) -> bool:
     
     db.delete(db_season)
     db.commit()
+    stats_cache.invalidate()
     return True
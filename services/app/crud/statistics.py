@@ -1,18 +1,26 @@
-"""CRUD operations for statistics queries using database views."""
+"""CRUD operations for statistics queries using database views.
+
+Player, deck and matchup statistics are read from the *_summary views, which
+are backed by the trigger-maintained counter tables in 07_stat_totals.sql.
+Query results are cached in-process (see app.cache) until the next write.
+"""
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from app import schemas
-from typing import List, Optional
+from app.cache import cached, stats_cache
+from typing import Any, Dict, List, Optional
 
 
+@cached("stats:players")
 def get_player_statistics(db: Session) -> List[schemas.PlayerStatistics]:
-    """Get statistics for all players from player_statistics view."""
+    """Get statistics for all players from player_stat_summary view."""
     query = text("""
         SELECT 
             player_id, player_name, total_matches, matches_won, 
             matches_drawn, matches_lost, win_rate_percentage,
             decks_played, tournaments_played
-        FROM player_statistics
+        FROM player_stat_summary
         ORDER BY win_rate_percentage DESC NULLS LAST, matches_won DESC
     """)
     
@@ -35,6 +43,7 @@ def get_player_statistics(db: Session) -> List[schemas.PlayerStatistics]:
     ]
 
 
+@cached("stats:player")
 def get_player_statistics_by_id(db: Session, player_id: int) -> Optional[schemas.PlayerStatistics]:
     """Get statistics for a specific player."""
     query = text("""
@@ -42,7 +51,7 @@ def get_player_statistics_by_id(db: Session, player_id: int) -> Optional[schemas
             player_id, player_name, total_matches, matches_won, 
             matches_drawn, matches_lost, win_rate_percentage,
             decks_played, tournaments_played
-        FROM player_statistics
+        FROM player_stat_summary
         WHERE player_id = :player_id
     """)
     
@@ -65,14 +74,15 @@ def get_player_statistics_by_id(db: Session, player_id: int) -> Optional[schemas
     )
 
 
+@cached("stats:decks")
 def get_deck_statistics(db: Session) -> List[schemas.DeckStatistics]:
-    """Get statistics for all deck archetypes from deck_statistics view."""
+    """Get statistics for all deck archetypes from deck_stat_summary view."""
     query = text("""
         SELECT 
             deck_id, deck_name, color_identity, archetype_type,
             total_matches, matches_won, matches_drawn, matches_lost,
             win_rate_percentage, unique_players, tournaments_played
-        FROM deck_statistics
+        FROM deck_stat_summary
         ORDER BY win_rate_percentage DESC NULLS LAST, matches_won DESC
     """)
     
@@ -97,6 +107,7 @@ def get_deck_statistics(db: Session) -> List[schemas.DeckStatistics]:
     ]
 
 
+@cached("stats:deck")
 def get_deck_statistics_by_id(db: Session, deck_id: int) -> Optional[schemas.DeckStatistics]:
     """Get statistics for a specific deck archetype."""
     query = text("""
@@ -104,7 +115,7 @@ def get_deck_statistics_by_id(db: Session, deck_id: int) -> Optional[schemas.Dec
             deck_id, deck_name, color_identity, archetype_type,
             total_matches, matches_won, matches_drawn, matches_lost,
             win_rate_percentage, unique_players, tournaments_played
-        FROM deck_statistics
+        FROM deck_stat_summary
         WHERE deck_id = :deck_id
     """)
     
@@ -129,6 +140,7 @@ def get_deck_statistics_by_id(db: Session, deck_id: int) -> Optional[schemas.Dec
     )
 
 
+@cached("stats:matchups")
 def get_deck_matchups(db: Session) -> List[schemas.DeckMatchup]:
     """Get matchup statistics for all deck pairings."""
     query = text("""
@@ -136,7 +148,7 @@ def get_deck_matchups(db: Session) -> List[schemas.DeckMatchup]:
             deck_a_id, deck_a_name, deck_b_id, deck_b_name,
             total_matches, deck_a_wins, draws, deck_a_losses,
             deck_a_win_rate_percentage, deck_b_win_rate_percentage
-        FROM deck_matchups
+        FROM deck_matchup_summary
         ORDER BY total_matches DESC, deck_a_win_rate_percentage DESC NULLS LAST
     """)
     
@@ -160,6 +172,7 @@ def get_deck_matchups(db: Session) -> List[schemas.DeckMatchup]:
     ]
 
 
+@cached("stats:matchup")
 def get_deck_matchup(db: Session, deck_a_id: int, deck_b_id: int) -> Optional[schemas.DeckMatchup]:
     """Get matchup statistics for a specific deck pairing."""
     query = text("""
@@ -167,7 +180,7 @@ def get_deck_matchup(db: Session, deck_a_id: int, deck_b_id: int) -> Optional[sc
             deck_a_id, deck_a_name, deck_b_id, deck_b_name,
             total_matches, deck_a_wins, draws, deck_a_losses,
             deck_a_win_rate_percentage, deck_b_win_rate_percentage
-        FROM deck_matchups
+        FROM deck_matchup_summary
         WHERE (deck_a_id = :deck_a_id AND deck_b_id = :deck_b_id)
            OR (deck_a_id = :deck_b_id AND deck_b_id = :deck_a_id)
         LIMIT 1
@@ -193,30 +206,29 @@ def get_deck_matchup(db: Session, deck_a_id: int, deck_b_id: int) -> Optional[sc
     )
 
 
-def get_season_standings(db: Session, season_id: Optional[int] = None) -> List[schemas.SeasonStandings]:
-    """Get season standings for all seasons or a specific season."""
+def _season_standings_query(season_id: Optional[int] = None):
+    """Build the (statement, params) pair behind the season standings queries."""
     if season_id:
         query = text("""
             SELECT 
                 season_id, season_name, player_id, player_name,
                 matches_played, wins, draws, losses, points
-            FROM season_standings
-            WHERE season_id = :season_id
+            FROM season_standings_for(:season_id)
             ORDER BY points DESC, wins DESC, player_name
         """)
-        result = db.execute(query, {"season_id": season_id})
-    else:
-        query = text("""
-            SELECT 
-                season_id, season_name, player_id, player_name,
-                matches_played, wins, draws, losses, points
-            FROM season_standings
-            ORDER BY season_id, points DESC, wins DESC, player_name
-        """)
-        result = db.execute(query)
-    
-    rows = result.fetchall()
+        return query, {"season_id": season_id}
     
+    query = text("""
+        SELECT 
+            season_id, season_name, player_id, player_name,
+            matches_played, wins, draws, losses, points
+        FROM season_standings
+        ORDER BY season_id, points DESC, wins DESC, player_name
+    """)
+    return query, {}
+
+
+def _season_standings_rows(rows) -> List[schemas.SeasonStandings]:
     return [
         schemas.SeasonStandings(
             season_id=row[0],
@@ -231,3 +243,49 @@ def get_season_standings(db: Session, season_id: Optional[int] = None) -> List[s
         )
         for row in rows
     ]
+
+
+@cached("stats:season_standings")
+def get_season_standings(db: Session, season_id: Optional[int] = None) -> List[schemas.SeasonStandings]:
+    """
+    Get season standings for all seasons or a specific season.
+
+    A single season is read through season_standings_for(), which restricts
+    to that season's tournaments before aggregating instead of filtering the
+    all-seasons view.
+    """
+    query, params = _season_standings_query(season_id)
+    return _season_standings_rows(db.execute(query, params).fetchall())
+
+
+@cached("stats:season_standings")
+async def get_season_standings_async(db: AsyncSession, season_id: Optional[int] = None) -> List[schemas.SeasonStandings]:
+    """Async variant of get_season_standings; shares its cache entries."""
+    query, params = _season_standings_query(season_id)
+    result = await db.execute(query, params)
+    return _season_standings_rows(result.fetchall())
+
+
+def rebuild_stat_totals(db: Session) -> None:
+    """Recompute the statistic counter tables from match_outcomes."""
+    db.execute(text("SELECT rebuild_stat_totals()"))
+    db.commit()
+    stats_cache.invalidate()
+
+
+def check_stat_totals(db: Session) -> List[Dict[str, Any]]:
+    """
+    Compare the counter-backed summaries with the aggregate views.
+
+    Returns one entry per differing row; an empty list means they agree.
+    """
+    rows = db.execute(text("""
+        SELECT statistic, source, row_data
+        FROM check_stat_totals()
+        ORDER BY statistic, source
+    """)).fetchall()
+
+    return [
+        {"statistic": row[0], "source": row[1], "row": row[2]}
+        for row in rows
+    ]
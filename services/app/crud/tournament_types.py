@@ -1,6 +1,7 @@
 """CRUD operations for TournamentType model."""
 from sqlalchemy.orm import Session
 from app import models, schemas
+from app.cache import stats_cache
 from typing import Optional, List
 
 
@@ -19,6 +20,7 @@ def create_tournament_type(db: Session, tournament_type: schemas.TournamentTypeC
     db_tournament_type = models.TournamentType(**tournament_type.model_dump())
     db.add(db_tournament_type)
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_tournament_type)
     return db_tournament_type
 
@@ -36,6 +38,7 @@ def update_tournament_type(
         setattr(db_tournament_type, field, value)
     
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_tournament_type)
     return db_tournament_type
 
@@ -48,4 +51,5 @@ def delete_tournament_type(db: Session, tournament_type_id: int) -> bool:
     
     db.delete(db_tournament_type)
     db.commit()
+    stats_cache.invalidate()
     return True
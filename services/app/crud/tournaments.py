@@ -1,8 +1,11 @@
 """CRUD operations for Tournament model."""
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, func, or_
 from app import models, schemas
-from typing import Optional, List
+from app.cache import stats_cache
+from app.crud import matches as matches_crud
+from typing import Optional, List, Tuple
+from datetime import date
 
 DEFAULT_TOURNAMENT_TYPE_NAME = "LGS Tournament"
 
@@ -44,15 +47,84 @@ def resolve_tournament_type(db: Session, type_id: Optional[int], type_name: Opti
 
 def get_tournament(db: Session, tournament_id: int) -> Optional[models.Tournament]:
     """Get a tournament by ID."""
-    return db.query(models.Tournament).filter(models.Tournament.id == tournament_id).first()
+    return db.query(models.Tournament).options(joinedload(models.Tournament.tournament_type)).filter(models.Tournament.id == tournament_id).first()
 
 
-def get_tournaments(db: Session, skip: int = 0, limit: int = 100, season_id: Optional[int] = None) -> List[models.Tournament]:
-    """Get list of tournaments."""
-    query = db.query(models.Tournament)
+def _filter_tournament_list(query, season_id: Optional[int] = None, after: Optional[Tuple[date, int]] = None):
+    """Apply the list filters, keyset position and (tournament_date, id) descending order."""
     if season_id:
         query = query.filter(models.Tournament.season_id == season_id)
-    return query.order_by(desc(models.Tournament.tournament_date)).offset(skip).limit(limit).all()
+    if after:
+        tournament_date, tournament_id = after
+        query = query.filter(
+            models.Tournament.tournament_date <= tournament_date,
+            or_(
+                models.Tournament.tournament_date < tournament_date,
+                models.Tournament.id < tournament_id
+            )
+        )
+    return query.order_by(desc(models.Tournament.tournament_date), desc(models.Tournament.id))
+
+
+def get_tournaments(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    season_id: Optional[int] = None,
+    after: Optional[Tuple[date, int]] = None
+) -> List[models.Tournament]:
+    """
+    Get list of tournaments ordered by (tournament_date, id) descending.
+    
+    ``after`` is a decoded cursor key (tournament_date, id); it replaces skip
+    and the page continues right after that row (keyset on idx_tournaments_date).
+    """
+    # Load the type in the same statement (the schema serializes it per row)
+    query = db.query(models.Tournament).options(joinedload(models.Tournament.tournament_type))
+    query = _filter_tournament_list(query, season_id, after)
+    return query.offset(0 if after else skip).limit(limit).all()
+
+
+def get_tournaments_next_key(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    season_id: Optional[int] = None,
+    after: Optional[Tuple[date, int]] = None
+) -> Optional[Tuple[date, int]]:
+    """Sort key of the last row of the page get_tournaments would return, if the page is full."""
+    if limit <= 0:
+        return None
+    query = _filter_tournament_list(
+        db.query(models.Tournament.tournament_date, models.Tournament.id), season_id, after
+    )
+    row = query.offset((0 if after else skip) + limit - 1).limit(1).first()
+    return tuple(row) if row else None
+
+
+def get_tournament_results(db: Session, tournament_id: int) -> Optional[schemas.TournamentResults]:
+    """Get all rounds, matches and games of a tournament in a constant number of queries."""
+    db_tournament = get_tournament(db, tournament_id)
+    if not db_tournament:
+        return None
+    
+    tournament_matches = matches_crud.get_tournament_matches(db, tournament_id)
+    
+    rounds = {}
+    for match in tournament_matches:
+        rounds.setdefault(match.round_number, []).append(match)
+    
+    return schemas.TournamentResults(
+        tournament=schemas.Tournament.model_validate(db_tournament),
+        total_matches=len(tournament_matches),
+        rounds=[
+            schemas.RoundResults(
+                round_number=round_number,
+                matches=[schemas.MatchResult.model_validate(m) for m in round_matches]
+            )
+            for round_number, round_matches in rounds.items()
+        ]
+    )
 
 
 def create_tournament(db: Session, tournament: schemas.TournamentCreate) -> models.Tournament:
@@ -67,6 +139,7 @@ def create_tournament(db: Session, tournament: schemas.TournamentCreate) -> mode
     db_tournament = models.Tournament(**payload)
     db.add(db_tournament)
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_tournament)
     return db_tournament
 
@@ -88,6 +161,7 @@ def update_tournament(db: Session, tournament_id: int, tournament: schemas.Tourn
         setattr(db_tournament, field, value)
     
     db.commit()
+    stats_cache.invalidate()
     db.refresh(db_tournament)
     return db_tournament
 
@@ -100,4 +174,5 @@ def delete_tournament(db: Session, tournament_id: int) -> bool:
     
     db.delete(db_tournament)
     db.commit()
+    stats_cache.invalidate()
     return True
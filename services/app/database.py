@@ -1,16 +1,24 @@
 """Database connection setup and session management."""
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple
+import logging
+import threading
+import time
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,  # Verify connections before using
     echo=settings.debug  # Log SQL queries in debug mode
 )
@@ -18,6 +26,185 @@
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional read replica (DATABASE_READ_URL); without one, reads use the primary
+if settings.database_read_url:
+    read_engine = create_engine(
+        settings.database_read_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        echo=settings.debug
+    )
+else:
+    read_engine = engine
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Seconds of replay lag on the replica; 0 when fully caught up. An idle
+# primary stops producing WAL, so a replica that has replayed everything it
+# received is treated as current even if the last replayed commit is old.
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+# How long a replica health/lag probe result is reused
+REPLICA_CHECK_INTERVAL_SECONDS = 5.0
+
+_replica_lock = threading.Lock()
+_replica_state = {"checked_at": float("-inf"), "healthy": False, "lag": None}
+_last_primary_commit = float("-inf")
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _record_primary_commit(session):
+    """Remember when this process last wrote, for read-your-writes routing."""
+    global _last_primary_commit
+    _last_primary_commit = time.monotonic()
+
+
+def _probe_replica() -> dict:
+    """Check that the replica answers and measure its lag (cached briefly)."""
+    now = time.monotonic()
+    with _replica_lock:
+        if now - _replica_state["checked_at"] < REPLICA_CHECK_INTERVAL_SECONDS:
+            return dict(_replica_state)
+        # Claim the slot so concurrent requests do not probe at the same time
+        _replica_state["checked_at"] = now
+
+    # Routing overhead, not the request's own queries (see QueryStats)
+    token = current_query_stats.set(None)
+    try:
+        with read_engine.connect() as conn:
+            lag = float(conn.execute(REPLICA_LAG_SQL).scalar() or 0)
+        healthy = True
+    except SQLAlchemyError as exc:
+        logger.warning(f"Read replica unavailable, using primary: {exc}")
+        lag, healthy = None, False
+    finally:
+        current_query_stats.reset(token)
+
+    with _replica_lock:
+        _replica_state.update(checked_at=now, healthy=healthy, lag=lag)
+        return dict(_replica_state)
+
+
+def use_read_replica() -> bool:
+    """
+    Decide whether a read should go to the replica.
+
+    Falls back to the primary when no replica is configured or it is
+    unreachable. Unless READ_REPLICA_TOLERATE_STALE is set, the primary is
+    also used while the replica lags more than READ_REPLICA_MAX_LAG_SECONDS
+    and for that long after this process commits a write, so clients see
+    their own imports immediately.
+    """
+    if read_engine is engine:
+        return False
+    state = _probe_replica()
+    if not state["healthy"]:
+        return False
+    if settings.read_replica_tolerate_stale:
+        return True
+    max_lag = settings.read_replica_max_lag_seconds
+    if time.monotonic() - _last_primary_commit < max_lag:
+        return False
+    return state["lag"] is not None and state["lag"] <= max_lag
+
+
+def to_async_url(url: str) -> str:
+    """Rewrite a postgresql:// (or +psycopg2) URL to use the asyncpg driver."""
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("postgres", "postgresql", "postgresql+psycopg2"):
+        scheme = "postgresql+asyncpg"
+    return f"{scheme}{sep}{rest}"
+
+
+class QueryStats:
+    """SQL statements executed while handling one request."""
+
+    __slots__ = ("count", "duration", "budget", "slow")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        # Maximum statements declared by the route (see app.query_budget)
+        self.budget: Optional[int] = None
+        # (statement, parameters, seconds, engine) for statements over SLOW_QUERY_MS
+        self.slow: List[Tuple[str, Any, float, Any]] = []
+
+    def record(self, statement: str, parameters, duration: float, source_engine=None) -> None:
+        self.count += 1
+        self.duration += duration
+        if duration * 1000 >= settings.slow_query_ms:
+            self.slow.append((statement, parameters, duration, source_engine))
+
+
+# Set by the request middleware; cursor events add to it when present
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect the SQL statements executed in this context.
+
+    Nested uses (e.g. the metrics and query budget middlewares) share the
+    outermost QueryStats.
+    """
+    stats = current_query_stats.get()
+    if stats is not None:
+        yield stats
+        return
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_started_at"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info.pop("query_started_at", None)
+    stats = current_query_stats.get()
+    if stats is not None and started_at is not None:
+        stats.record(statement, parameters, time.perf_counter() - started_at, conn.engine)
+
+
+def instrument_engine(target_engine) -> None:
+    """Attach statement timing listeners to a (sync) engine."""
+    event.listen(target_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+instrument_engine(engine)
+if read_engine is not engine:
+    instrument_engine(read_engine)
+
+# Optional async engine (ASYNC_DATABASE=true); requires asyncpg
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.async_database:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(
+        to_async_url(settings.database_url),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        echo=settings.debug
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    instrument_engine(async_engine.sync_engine)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -34,3 +221,35 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    Dependency function to get a session for read-only endpoints.
+    
+    Uses the read replica when one is configured and fresh enough (see
+    use_read_replica), otherwise the primary.
+    
+    Yields:
+        Session: SQLAlchemy database session
+    """
+    db = ReadSessionLocal() if use_read_replica() else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """
+    Dependency function to get an async database session.
+    
+    Only available when ASYNC_DATABASE is enabled.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database support is disabled (set ASYNC_DATABASE=true)")
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,123 @@
+"""Conditional GET support (ETag / If-None-Match) for read endpoints."""
+from fastapi import HTTPException, Request, Response, Depends, status
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Optional
+import logging
+
+from app.config import get_settings
+from app.database import get_read_db, get_async_db
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Session.info key holding the data version read by the ETag guard
+DATA_VERSION_KEY = "data_version"
+
+
+def get_data_version(db: Session) -> Optional[int]:
+    """
+    Read the global write counter maintained by 08_data_version.sql.
+
+    Returns None when the table is missing so endpoints keep working
+    (without ETags) on databases that have not been migrated.
+    """
+    try:
+        return db.execute(text("SELECT version FROM data_version")).scalar()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("data_version table not available; ETags disabled")
+        return None
+
+
+def make_etag(version: int) -> str:
+    """Strong ETag for a data version (the app version covers format changes)."""
+    return f'"{settings.app_version}-{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str, headers: Optional[Dict[str, str]] = None) -> HTTPException:
+    """The 304 Not Modified answer for ``etag``, with any extra ``headers`` of the full response."""
+    return HTTPException(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache", **(headers or {})}
+    )
+
+
+def _apply_etag(request: Request, response: Response, version: Optional[int], info: dict) -> Optional[str]:
+    """
+    Return the ETag if If-None-Match matches the version's, else set the header.
+
+    The version is also recorded on ``request.state`` and in the session's
+    ``info`` so ``app.cache.cached`` keys entries by it: a cached body is
+    never served under the ETag of a later version.
+    """
+    request.state.data_version = version
+    info[DATA_VERSION_KEY] = version
+    if version is None:
+        return None
+    etag = make_etag(version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return etag
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return None
+
+
+async def _async_data_version(db: AsyncSession) -> Optional[int]:
+    try:
+        return (await db.execute(text("SELECT version FROM data_version"))).scalar()
+    except SQLAlchemyError:
+        await db.rollback()
+        logger.warning("data_version table not available; ETags disabled")
+        return None
+
+
+def etag_guard(request: Request, response: Response, db: Session = Depends(get_read_db)) -> None:
+    """
+    Route dependency that answers 304 Not Modified for unchanged data.
+
+    Runs before the endpoint body, so a matching If-None-Match skips the
+    query and serialization entirely. Otherwise the ETag header is added to
+    the normal response. The version is read through the same session as
+    the endpoint (FastAPI caches the dependency per request), so a replica
+    never hands out an ETag newer than the data it returns.
+    """
+    etag = _apply_etag(request, response, get_data_version(db), db.info)
+    if etag:
+        raise not_modified(etag)
+
+
+async def async_etag_guard(request: Request, response: Response, db: AsyncSession = Depends(get_async_db)) -> None:
+    """etag_guard for routes served by the async stack."""
+    etag = _apply_etag(request, response, await _async_data_version(db), db.info)
+    if etag:
+        raise not_modified(etag)
+
+
+def etag_check(request: Request, response: Response, db: Session = Depends(get_read_db)) -> Optional[str]:
+    """
+    etag_guard for endpoints whose 304 needs more headers than the ETag.
+
+    Returns the matching ETag instead of raising, and the endpoint raises
+    ``not_modified(etag, headers)`` itself (paginated lists add X-Next-Cursor).
+    Returns None when the endpoint must answer normally.
+    """
+    return _apply_etag(request, response, get_data_version(db), db.info)
+
+
+async def async_etag_check(request: Request, response: Response, db: AsyncSession = Depends(get_async_db)) -> Optional[str]:
+    """etag_check for routes served by the async stack."""
+    return _apply_etag(request, response, await _async_data_version(db), db.info)
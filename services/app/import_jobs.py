@@ -0,0 +1,309 @@
+"""Background tournament imports with pollable progress.
+
+Job state is written to the ``import_jobs`` table (database/11_import_jobs.sql)
+at every stage, in short transactions separate from the import's own, so
+any API worker can report a job's progress, not only the one running it.
+"""
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+import logging
+import threading
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _no_store(job: "ImportJob") -> None:
+    pass
+
+
+class ImportJob:
+    """
+    One queued import; ``advance`` is called from the worker thread as it progresses.
+
+    Every change is passed to ``store`` (the queue persists it) after the
+    job's lock is released.
+    """
+
+    def __init__(self, data: schemas.TournamentCompleteImport, store: Callable[["ImportJob"], None] = _no_store):
+        self.id = uuid.uuid4().hex
+        self.data = data
+        self.status = "queued"
+        self.stage = "queued"
+        self.total_matches = len(data.matches)
+        self.total_games = sum(len(m.games) for m in data.matches)
+        self.matches_processed = 0
+        self.games_processed = 0
+        self.created_at = _now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        self.result: Optional[schemas.TournamentImportResponse] = None
+        self._store = store
+        self._lock = threading.Lock()
+
+    def advance(self, stage: str, matches_processed: Optional[int] = None, games_processed: Optional[int] = None) -> None:
+        """Record the current stage and, when known, how many rows have been written."""
+        with self._lock:
+            self.stage = stage
+            if matches_processed is not None:
+                self.matches_processed = matches_processed
+            if games_processed is not None:
+                self.games_processed = games_processed
+        self._store(self)
+
+    def _start(self) -> None:
+        with self._lock:
+            self.status = "running"
+            self.started_at = _now()
+        self._store(self)
+
+    def snapshot(self) -> schemas.ImportJob:
+        """Consistent copy of the job's state for the API."""
+        with self._lock:
+            return schemas.ImportJob(
+                id=self.id,
+                status=self.status,
+                stage=self.stage,
+                tournament_name=self.data.tournament.name,
+                total_matches=self.total_matches,
+                total_games=self.total_games,
+                matches_processed=self.matches_processed,
+                games_processed=self.games_processed,
+                created_at=self.created_at,
+                started_at=self.started_at,
+                finished_at=self.finished_at,
+                error=self.error,
+                result=self.result,
+            )
+
+    def _finish(self, status: str, result=None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.status = status
+            self.stage = status
+            self.result = result
+            self.error = error
+            self.finished_at = _now()
+            if result is not None:
+                self.matches_processed = self.total_matches
+                self.games_processed = self.total_games
+            # The payload is no longer needed once the import has run
+            self.data = self.data.model_copy(update={"matches": [], "players": [], "decks": []})
+        self._store(self)
+
+
+# How long a worker that found no import_jobs table waits before looking again
+TABLE_RECHECK_SECONDS = 60.0
+
+ABANDONED_ERROR = "Abandoned: the API worker running this import stopped"
+
+
+def _is_missing_table(exc: SQLAlchemyError) -> bool:
+    """True when the statement failed with undefined_table (SQLSTATE 42P01)."""
+    orig = getattr(exc, "orig", None)
+    return (getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)) == "42P01"
+
+
+def _job_from_row(row) -> schemas.ImportJob:
+    return schemas.ImportJob(
+        id=row.id,
+        status=row.status,
+        stage=row.stage,
+        tournament_name=row.tournament_name,
+        total_matches=row.total_matches,
+        total_games=row.total_games,
+        matches_processed=row.matches_processed,
+        games_processed=row.games_processed,
+        created_at=row.created_at,
+        started_at=row.started_at,
+        finished_at=row.finished_at,
+        error=row.error,
+        result=row.result,
+    )
+
+
+class ImportJobQueue:
+    """
+    Runs imports on a small thread pool and keeps recent jobs for polling.
+
+    Each change of a job is saved to the ``import_jobs`` table so that with
+    several uvicorn workers any of them can answer a poll. Running jobs are
+    also kept in memory by the worker executing them. Only the newest
+    ``retention`` finished jobs are kept, in memory and in the table.
+
+    Without the table (11_import_jobs.sql not run) jobs are kept in memory
+    only, and can then be polled only on the worker that queued them; the
+    table is looked for again every ``TABLE_RECHECK_SECONDS``. Other
+    database errors are logged and never disable saving.
+
+    A job whose worker died stays unfinished in the table; once its row has
+    not been saved for ``stale_seconds`` it is marked failed, when a job is
+    queued or when it is polled.
+    """
+
+    def __init__(self, max_workers: int = 2, retention: int = 100, stale_seconds: float = 900.0):
+        self.max_workers = max_workers
+        self.retention = retention
+        self.stale_seconds = stale_seconds
+        self._jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Until this monotonic time, jobs are kept in memory only (table missing)
+        self._table_missing_until = float("-inf")
+
+    def submit(self, data: schemas.TournamentCompleteImport) -> ImportJob:
+        """Queue an import and return its job immediately."""
+        job = ImportJob(data, store=self._save)
+        # Saved before the worker can start it, so 'queued' never overwrites 'running'
+        self._save(job, prune=True)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="import-job")
+            self._jobs[job.id] = job
+            self._prune()
+            self._executor.submit(self._run, job)
+        logger.info(f"Queued import job {job.id} for tournament '{data.tournament.name}'")
+        return job
+
+    def get(self, job_id: str, db: Optional[Session] = None) -> Optional[schemas.ImportJob]:
+        """A job's state: from memory if this worker holds it, else from the table through ``db``."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job.snapshot()
+        if db is None or not self._persist:
+            return None
+        from app import models
+
+        try:
+            row = db.get(models.ImportJob, job_id)
+        except SQLAlchemyError as exc:
+            db.rollback()
+            if not _is_missing_table(exc):
+                raise
+            self._table_missing()
+            return None
+        if row is None:
+            return None
+        if row.finished_at is None and row.updated_at < _now() - timedelta(seconds=self.stale_seconds):
+            self._fail_stale(db, job_id)
+            db.commit()
+            row = db.get(models.ImportJob, job_id, populate_existing=True)
+        return _job_from_row(row)
+
+    def _fail_stale(self, db: Session, job_id: Optional[str] = None) -> int:
+        """Mark unfinished jobs of dead workers (not saved for ``stale_seconds``) failed."""
+        with self._lock:
+            # Jobs this worker holds are alive, however long their current stage takes
+            local = list(self._jobs)
+        query = """
+            UPDATE import_jobs
+            SET status = 'failed', stage = 'failed', error = :error,
+                finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+            WHERE finished_at IS NULL
+              AND updated_at < CURRENT_TIMESTAMP - make_interval(secs => :stale)
+              AND NOT (id = ANY(:local))
+        """
+        params = {"error": ABANDONED_ERROR, "stale": self.stale_seconds, "local": local}
+        if job_id is not None:
+            query += " AND id = :job_id"
+            params["job_id"] = job_id
+        failed = db.execute(text(query), params).rowcount
+        if failed:
+            logger.warning(f"Marked {failed} abandoned import job(s) failed")
+        return failed
+
+    def _save(self, job: ImportJob, prune: bool = False) -> None:
+        """Upsert the job's row in its own transaction; failures never affect the import."""
+        if not self._persist:
+            return
+        from app import models
+        from app.database import SessionLocal
+
+        snapshot = job.snapshot()
+        fields = snapshot.model_dump(exclude={"result"})
+        fields["result"] = snapshot.result.model_dump(mode="json") if snapshot.result else None
+        db = SessionLocal()
+        try:
+            db.merge(models.ImportJob(**fields))
+            if prune:
+                self._fail_stale(db)
+                db.execute(text("""
+                    DELETE FROM import_jobs
+                    WHERE finished_at IS NOT NULL
+                      AND id NOT IN (
+                          SELECT id FROM import_jobs
+                          WHERE finished_at IS NOT NULL
+                          ORDER BY finished_at DESC
+                          LIMIT :retention
+                      )
+                """), {"retention": self.retention})
+            db.commit()
+        except SQLAlchemyError as exc:
+            db.rollback()
+            if _is_missing_table(exc):
+                self._table_missing()
+            else:
+                logger.exception(f"Could not save state of import job {job.id}")
+        finally:
+            db.close()
+
+    @property
+    def _persist(self) -> bool:
+        return time.monotonic() >= self._table_missing_until
+
+    def _table_missing(self) -> None:
+        """Keep jobs in memory only for a while; the table is looked for again afterwards."""
+        self._table_missing_until = time.monotonic() + TABLE_RECHECK_SECONDS
+        logger.warning("import_jobs table not available; job status is per worker (run database/11_import_jobs.sql)")
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None]
+        for job_id in finished[:max(len(self._jobs) - self.retention, 0)]:
+            del self._jobs[job_id]
+
+    def _run(self, job: ImportJob) -> None:
+        # Imported here so the module can be loaded without a database configured
+        from app.crud import imports
+        from app.database import SessionLocal
+
+        job._start()
+        db = SessionLocal()
+        try:
+            result = imports.import_complete_tournament(db, job.data, progress=job.advance)
+        except ValueError as exc:
+            db.rollback()
+            logger.error(f"Import job {job.id} rejected: {exc}")
+            job._finish("failed", error=str(exc))
+        except Exception as exc:
+            db.rollback()
+            logger.exception(f"Import job {job.id} failed")
+            job._finish("failed", error=f"{type(exc).__name__}: {exc}")
+        else:
+            logger.info(f"Import job {job.id} completed: tournament {result.tournament_id} {result.status}")
+            job._finish("completed", result=result)
+        finally:
+            db.close()
+
+
+settings = get_settings()
+
+import_jobs = ImportJobQueue(
+    max_workers=settings.import_job_workers,
+    retention=settings.import_job_retention,
+    stale_seconds=settings.import_job_stale_seconds,
+)
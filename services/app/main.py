@@ -1,11 +1,14 @@
 """Main FastAPI application."""
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
 from app.config import get_settings
-from app.routers import seasons, tournaments, players, decks, matches, statistics, tournament_types
+from app.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, metrics_middleware, render_metrics
+from app.query_budget import query_budget_middleware
+from app.routers import seasons, tournaments, players, decks, matches, statistics, tournament_types, export, async_reads, import_jobs, search
 
 settings = get_settings()
 
@@ -47,9 +50,25 @@
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Query-Count", "Server-Timing"],
 )
 
+# Compress responses for clients that send Accept-Encoding: gzip
+if settings.gzip_minimum_size > 0:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
+
+# SQL statement count/time headers, slow-query log and query budgets
+app.middleware("http")(query_budget_middleware)
+
+# Request / SQL metrics for /metrics (registered last so it wraps the above)
+if settings.metrics_enabled:
+    app.middleware("http")(metrics_middleware)
+
 # Include routers
+# Async read handlers shadow their sync counterparts when enabled
+if settings.async_database:
+    app.include_router(async_reads.router, prefix="/api/v1")
+
 app.include_router(seasons.router, prefix="/api/v1")
 app.include_router(tournaments.router, prefix="/api/v1")
 app.include_router(tournament_types.router, prefix="/api/v1")
@@ -57,6 +76,9 @@
 app.include_router(decks.router, prefix="/api/v1")
 app.include_router(matches.router, prefix="/api/v1")
 app.include_router(statistics.router, prefix="/api/v1")
+app.include_router(export.router, prefix="/api/v1")
+app.include_router(import_jobs.router, prefix="/api/v1")
+app.include_router(search.router, prefix="/api/v1")
 
 
 # Exception handlers
@@ -148,6 +170,20 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["Health"], include_in_schema=settings.metrics_enabled)
+async def metrics():
+    """
+    Prometheus metrics endpoint.
+    
+    Exposes per-route request counts and latency histograms, SQL statements
+    and time per request, connection pool gauges and statistics cache
+    counters in the Prometheus text format.
+    """
+    if not settings.metrics_enabled:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": "Not Found"})
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """
@@ -158,7 +194,8 @@ async def root():
         "version": settings.app_version,
         "docs": "/docs",
         "redoc": "/redoc",
-        "health": "/health"
+        "health": "/health",
+        "metrics": "/metrics"
     }
 
 
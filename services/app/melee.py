@@ -0,0 +1,327 @@
+"""Streaming conversion of raw MTG Melee match exports into the import format.
+
+Only the standard library is used so the repository's conversion scripts can
+share this module without the API's dependencies.
+"""
+from datetime import datetime
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+import io
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+class NotAnExportError(ValueError):
+    """The file is JSON but has no top-level ``Content`` array (not a Melee export)."""
+
+
+def _text_stream(fp: IO) -> IO[str]:
+    """Wrap binary streams (uploads, ``open(..., "rb")``) as UTF-8 text."""
+    if isinstance(fp, io.TextIOBase):
+        return fp
+    return io.TextIOWrapper(fp, encoding="utf-8-sig")
+
+
+def iter_content_records(fp: IO, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Yield the records of the export's top-level ``Content`` array one at a time.
+
+    The file is read in chunks and each record is decoded as soon as it is
+    complete, so memory stays bounded by the largest record rather than the
+    size of the export.
+
+    Raises:
+        NotAnExportError: If the stream has no ``Content`` array.
+        ValueError: If the export is truncated.
+    """
+    stream = _text_stream(fp)
+    buffer = ""
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, eof
+        if eof:
+            return False
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer += chunk
+        return True
+
+    # Find the opening bracket of "Content": [
+    start = None
+    while start is None:
+        match = re.search(r'"Content"\s*:\s*\[', buffer)
+        if match:
+            start = match.end()
+        elif not fill():
+            raise NotAnExportError("Export has no 'Content' array")
+        elif len(buffer) > chunk_size * 4:
+            # Keep only a tail long enough to hold a split key
+            buffer = buffer[-64:]
+    buffer = buffer[start:]
+    pos = 0
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE + ",":
+            pos += 1
+        if pos == len(buffer):
+            buffer, pos = "", 0
+            if not fill():
+                raise ValueError("Export ended inside the 'Content' array")
+            continue
+        if buffer[pos] == "]":
+            return
+        try:
+            record, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Record not fully read yet
+            buffer, pos = buffer[pos:], 0
+            if not fill():
+                raise ValueError("Export ended inside a 'Content' record")
+            continue
+        yield record
+        pos = end
+        if pos > chunk_size:
+            buffer, pos = buffer[pos:], 0
+
+
+def parse_result_string(result_string: str) -> Tuple[int, int]:
+    """Game wins (first, second) from strings like "Mao88 won 2-1-0" or "1-1-0 Draw"."""
+    scores = re.search(r"(\d+)-(\d+)-(\d+)", result_string or "")
+    if not scores:
+        return 0, 0
+    return int(scores.group(1)), int(scores.group(2))
+
+
+def _game_wins(competitor: dict) -> int:
+    """Game wins recorded for a competitor, preferring the export's explicit counts."""
+    wins = competitor.get("GameWinsAndGameByes")
+    if wins is None:
+        wins = competitor.get("GameWins")
+    return int(wins) if wins is not None else 0
+
+
+def _first_player(competitor: dict) -> dict:
+    players = (competitor.get("Team") or {}).get("Players") or [{}]
+    return players[0]
+
+
+class MeleeExportConverter:
+    """
+    Accumulates export records into an import payload.
+
+    Records are fed one at a time with ``add``; only the players, decks and
+    converted matches are kept. Byes, records without two competitors and
+    matches with fewer than two decided games are skipped and counted.
+    ``add_roster`` and ``convert`` do the two halves of ``add`` separately,
+    for ``stream_import``'s two passes.
+    """
+
+    def __init__(self):
+        self.players: Dict[int, dict] = {}
+        self.player_decks: Dict[int, str] = {}
+        self.deck_names = set()
+        self.pairings: List[tuple] = []
+        self.tournament_ids = set()
+        self.first_date: Optional[str] = None
+        self.records = 0
+        self.converted = 0
+        self.skipped_byes = 0
+        self.skipped_incomplete = 0
+        self.skipped_no_competitors = 0
+
+    def add(self, record: dict) -> None:
+        """Register the players and decks of a record and convert its match."""
+        self.add_roster(record)
+        pairing = self.convert(record)
+        if pairing is not None:
+            self.pairings.append(pairing)
+
+    def add_all(self, records: Iterable[dict]) -> "MeleeExportConverter":
+        for record in records:
+            self.add(record)
+        return self
+
+    def add_roster(self, record: dict) -> None:
+        """Register the tournament, players and decks a record refers to."""
+        if record.get("TournamentId"):
+            self.tournament_ids.add(record["TournamentId"])
+        if self.first_date is None and record.get("DateCreated"):
+            self.first_date = record["DateCreated"]
+        for competitor in record.get("Competitors") or []:
+            for player in (competitor.get("Team") or {}).get("Players") or []:
+                if player.get("ID") not in self.players:
+                    self.players[player.get("ID")] = {
+                        "name": player.get("Name"),
+                        "email": f"{(player.get('Username') or '').lower()}@email.com" if player.get("Username") else None,
+                    }
+                for decklist in competitor.get("Decklists") or []:
+                    if decklist.get("DecklistName"):
+                        # Matches use a player's last decklist, but every listed deck is imported
+                        self.deck_names.add(decklist["DecklistName"])
+                        self.player_decks[player.get("ID")] = decklist["DecklistName"]
+
+    def convert(self, record: dict) -> Optional[tuple]:
+        """
+        Count a record and return its pairing ``(round, player1 id, player2 id,
+        player1 wins, player2 wins)``, or None when it is skipped.
+        """
+        self.records += 1
+        competitors = record.get("Competitors") or []
+        result_string = record.get("ResultString") or ""
+        if len(competitors) != 2:
+            # Byes are single-competitor records
+            if "bye" in result_string.lower():
+                self.skipped_byes += 1
+            else:
+                self.skipped_no_competitors += 1
+            return None
+        if not result_string or "bye" in result_string.lower():
+            self.skipped_byes += 1
+            return None
+
+        player1, player2 = _first_player(competitors[0]), _first_player(competitors[1])
+        wins1, wins2 = _game_wins(competitors[0]), _game_wins(competitors[1])
+        if wins1 + wins2 == 0:
+            # "A won 2-1-0" lists the winner's wins first
+            first, second = parse_result_string(result_string)
+            if player2.get("Name") and result_string.startswith(f"{player2['Name']} won"):
+                wins1, wins2 = second, first
+            else:
+                wins1, wins2 = first, second
+        if wins1 + wins2 < 2 or wins1 + wins2 > 3:
+            self.skipped_incomplete += 1
+            return None
+
+        self.converted += 1
+        return (record.get("RoundNumber"), player1.get("ID"), player2.get("ID"), wins1, wins2)
+
+    def match(self, pairing: tuple) -> dict:
+        """The import-format match for a pairing returned by ``convert``."""
+        round_number, id1, id2, wins1, wins2 = pairing
+        name1, name2 = self.players[id1]["name"], self.players[id2]["name"]
+        games = [{"game_number": i + 1, "winner_name": name1} for i in range(wins1)]
+        games += [{"game_number": wins1 + i + 1, "winner_name": name2} for i in range(wins2)]
+        return {
+            "round_number": round_number,
+            "player1_name": name1,
+            "player2_name": name2,
+            "player1_deck_name": self.player_decks.get(id1, "Unknown"),
+            "player2_deck_name": self.player_decks.get(id2, "Unknown"),
+            "games": games,
+        }
+
+    @property
+    def source_id(self) -> Optional[str]:
+        """``melee:<TournamentId>`` when every record belongs to one tournament."""
+        if len(self.tournament_ids) == 1:
+            return f"melee:{next(iter(self.tournament_ids))}"
+        return None
+
+    @property
+    def tournament_date(self) -> Optional[str]:
+        if not self.first_date:
+            return None
+        return datetime.fromisoformat(self.first_date.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+
+    def skip_counts(self) -> Dict[str, int]:
+        return {
+            "records": self.records,
+            "skipped_byes": self.skipped_byes,
+            "skipped_incomplete": self.skipped_incomplete,
+            "skipped_no_competitors": self.skipped_no_competitors,
+        }
+
+    def header(
+        self,
+        season_id: int,
+        name: str,
+        location: Optional[str] = None,
+        format: str = "Premodern",
+        tournament_type_name: str = "LGS Tournament",
+        tournament_date: Optional[str] = None,
+    ) -> dict:
+        """Everything in the import payload except the matches."""
+        deck_names = set(self.deck_names)
+        if any(player_id not in self.player_decks for player_id in self.players):
+            deck_names.add("Unknown")
+
+        tournament = {
+            "name": name,
+            "tournament_date": tournament_date or self.tournament_date,
+            "location": location,
+            "format": format,
+            "tournament_type_name": tournament_type_name,
+            "description": f"{name} - {format} Tournament",
+        }
+        if self.source_id:
+            tournament["source_id"] = self.source_id
+
+        return {
+            "season_id": season_id,
+            "tournament": tournament,
+            "players": list(self.players.values()),
+            "decks": [
+                {"name": deck, "color_identity": "Unknown", "archetype_type": "Other"}
+                for deck in sorted(deck_names)
+            ],
+        }
+
+    def to_import(self, season_id: int, name: str, *args, **kwargs) -> dict:
+        """Build a payload in the ``TournamentCompleteImport`` format (see ``header``)."""
+        payload = self.header(season_id, name, *args, **kwargs)
+        payload["matches"] = [self.match(pairing) for pairing in self.pairings]
+        return payload
+
+
+def convert_export(fp: IO, chunk_size: int = CHUNK_SIZE) -> MeleeExportConverter:
+    """Stream an export file into a converter."""
+    return MeleeExportConverter().add_all(iter_content_records(fp, chunk_size))
+
+
+def stream_import(
+    path: str,
+    out: IO[str],
+    season_id: int,
+    name: str,
+    *args,
+    ndjson: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    **kwargs,
+) -> MeleeExportConverter:
+    """
+    Convert an export file, writing each match as soon as it is converted.
+
+    The file is read twice: the first pass collects players and decks, the
+    second converts and writes the matches. Memory is bounded by the roster
+    and one record, whatever the number of matches. The output is the
+    ``TournamentCompleteImport`` document, or with ``ndjson`` one match per
+    line. Extra arguments are passed to ``MeleeExportConverter.header``.
+    """
+    converter = MeleeExportConverter()
+    with open(path, "rb") as f:
+        for record in iter_content_records(f, chunk_size):
+            converter.add_roster(record)
+
+    with open(path, "rb") as f:
+        pairings = (converter.convert(record) for record in iter_content_records(f, chunk_size))
+        matches = (converter.match(pairing) for pairing in pairings if pairing is not None)
+        if ndjson:
+            for match in matches:
+                out.write(json.dumps(match, ensure_ascii=False) + "\n")
+            return converter
+
+        header = json.dumps(converter.header(season_id, name, *args, **kwargs), indent=2, ensure_ascii=False)
+        out.write(header[:-2] + ',\n  "matches": [')
+        separator = "\n    "
+        for match in matches:
+            out.write(separator + json.dumps(match, ensure_ascii=False))
+            separator = ",\n    "
+        out.write("\n  ]\n}\n")
+    return converter
@@ -0,0 +1,183 @@
+"""Prometheus text-format metrics for requests, SQL, the DB pools and the stats cache."""
+from typing import Dict, List, Sequence, Tuple
+import threading
+import time
+
+from fastapi import Request
+
+from app import database
+from app.cache import stats_cache
+from app.database import track_queries
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter keyed by label values."""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_number(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values."""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets) + (float("inf"),)
+        # labels -> [per-bucket counts, sum, count]
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (counts, total, count) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    le = f'le="{_format_number(bound)}"'
+                    lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}")
+                label_text = _format_labels(self.label_names, labels)
+                lines.append(f"{self.name}_sum{label_text} {_format_number(total)}")
+                lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+http_requests_total = Counter(
+    "http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status")
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route"), LATENCY_BUCKETS
+)
+db_statements_per_request = Histogram(
+    "db_statements_per_request", "SQL statements executed per request.", ("method", "route"), STATEMENT_BUCKETS
+)
+db_time_per_request_seconds = Histogram(
+    "db_time_per_request_seconds", "Time spent in SQL per request.", ("method", "route"), LATENCY_BUCKETS
+)
+
+
+def route_template(request: Request) -> str:
+    """Matched route path (e.g. /api/v1/matches/{match_id}); keeps label cardinality bounded."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+async def metrics_middleware(request: Request, call_next):
+    """Time each request and collect its SQL statement count/time."""
+    with track_queries() as query_stats:
+        started = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            labels = (request.method, route_template(request))
+            http_requests_total.inc(labels + (str(status_code),))
+            http_request_duration_seconds.observe(labels, time.perf_counter() - started)
+            db_statements_per_request.observe(labels, query_stats.count)
+            db_time_per_request_seconds.observe(labels, query_stats.duration)
+
+
+def _gauge(name: str, documentation: str, samples: List[Tuple[str, float]]) -> List[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+    for label_text, value in samples:
+        lines.append(f"{name}{label_text} {_format_number(value)}")
+    return lines
+
+
+def _pool_lines() -> List[str]:
+    engines = [("primary", database.engine)]
+    if database.read_engine is not database.engine:
+        engines.append(("replica", database.read_engine))
+    if database.async_engine is not None:
+        engines.append(("async", database.async_engine))
+
+    checked_out, overflow, size = [], [], []
+    for name, target in engines:
+        pool = target.pool
+        label_text = _format_labels(("pool",), (name,))
+        checked_out.append((label_text, pool.checkedout()))
+        overflow.append((label_text, pool.overflow()))
+        size.append((label_text, pool.size()))
+    return (
+        _gauge("db_pool_checked_out", "Connections currently checked out of the pool.", checked_out)
+        + _gauge("db_pool_overflow", "Overflow connections currently open (negative while below pool size).", overflow)
+        + _gauge("db_pool_size", "Configured pool size.", size)
+    )
+
+
+def _cache_lines() -> List[str]:
+    stats = stats_cache.stats()
+    lines = []
+    for key, documentation in (
+        ("hits", "Statistics cache hits."),
+        ("misses", "Statistics cache misses."),
+        ("evictions", "Statistics cache LRU evictions."),
+    ):
+        name = f"stats_cache_{key}_total"
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} counter", f"{name} {stats[key]}"]
+    lines += _gauge("stats_cache_entries", "Entries currently held in the statistics cache.", [("", stats["entries"])])
+    lines += _gauge("stats_cache_hit_ratio", "Statistics cache hits / lookups since start.", [("", stats["hit_ratio"] or 0.0)])
+    return lines
+
+
+def render_metrics() -> str:
+    """Current metrics in the Prometheus text exposition format."""
+    lines = []
+    for metric in (http_requests_total, http_request_duration_seconds, db_statements_per_request, db_time_per_request_seconds):
+        lines += metric.render()
+    lines += _pool_lines()
+    lines += _cache_lines()
+    return "\n".join(lines) + "\n"
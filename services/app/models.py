@@ -3,6 +3,7 @@
     Column, Integer, String, Date, DateTime, Boolean, Text,
     ForeignKey, CheckConstraint, UniqueConstraint, func, text
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -62,6 +63,8 @@ class Tournament(Base):
     location = Column(String(200))
     format = Column(String(50))
     description = Column(Text)
+    source_id = Column(String(100))
+    content_hash = Column(String(64))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
@@ -166,3 +169,27 @@ class Game(Base):
         CheckConstraint('duration_minutes IS NULL OR duration_minutes > 0', name='valid_duration'),
         UniqueConstraint('match_id', 'game_number', name='unique_game_per_match'),
     )
+
+
+class ImportJob(Base):
+    """State of a background tournament import (see app.import_jobs)."""
+    __tablename__ = "import_jobs"
+    
+    id = Column(String(32), primary_key=True)
+    status = Column(String(20), nullable=False)
+    stage = Column(String(50), nullable=False)
+    tournament_name = Column(String(150), nullable=False)
+    total_matches = Column(Integer, nullable=False)
+    total_games = Column(Integer, nullable=False)
+    matches_processed = Column(Integer, nullable=False, default=0)
+    games_processed = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    error = Column(Text)
+    result = Column(JSONB)
+    
+    __table_args__ = (
+        CheckConstraint("status IN ('queued', 'running', 'completed', 'failed')", name='valid_import_job_status'),
+    )
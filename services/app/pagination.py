@@ -0,0 +1,71 @@
+"""Opaque cursors for keyset pagination of list endpoints."""
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence
+import base64
+import json
+
+from fastapi import Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last returned row as an opaque cursor."""
+    payload = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _parse_value(value: Any, kind: type) -> Any:
+    """Check one decoded value against its expected type (dates arrive as ISO strings)."""
+    if kind in (date, datetime):
+        if not isinstance(value, str):
+            raise ValueError("Invalid cursor")
+        return kind.fromisoformat(value)
+    if isinstance(value, bool) or not isinstance(value, kind):
+        raise ValueError("Invalid cursor")
+    return value
+
+
+def decode_cursor(cursor: str, *types: type) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor into values of ``types``.
+
+    Each value must have the matching type (``int``, ``str``, ``date`` or
+    ``datetime``; dates are parsed from ISO strings), so a tampered cursor
+    is rejected here instead of reaching the database.
+
+    Raises:
+        ValueError: If the cursor is malformed, has the wrong number of values
+            or a value of the wrong type.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+    try:
+        return [_parse_value(value, kind) for value, kind in zip(values, types)]
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def set_next_cursor(response: Response, rows: Sequence, limit: int, *key_attrs: str) -> Optional[str]:
+    """
+    Put the cursor for the page after ``rows`` in the X-Next-Cursor header.
+
+    No header is set when the page is shorter than ``limit`` (last page).
+    """
+    if limit <= 0 or len(rows) < limit:
+        return None
+    last = rows[-1]
+    cursor = encode_cursor(*(getattr(last, attr) for attr in key_attrs))
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
+
+
+def next_cursor_headers(key: Optional[Sequence]) -> Dict[str, str]:
+    """X-Next-Cursor header for a page whose last row has sort key ``key`` (None: last page)."""
+    return {NEXT_CURSOR_HEADER: encode_cursor(*key)} if key else {}
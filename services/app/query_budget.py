@@ -0,0 +1,95 @@
+"""Per-request SQL query budgets, Server-Timing headers and slow-query logging."""
+import logging
+import time
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.database import current_query_stats, track_queries
+from app.metrics import route_template
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class QueryBudget:
+    """
+    Route dependency declaring the most SQL statements a request may run.
+
+    Usage: ``dependencies=[Depends(QueryBudget(3))]``. Budgets are checked by
+    ``query_budget_middleware``: exceeding one is logged, and with
+    QUERY_BUDGET_ENFORCE=true the response becomes a 500 so N+1 regressions
+    fail tests instead of slipping through.
+    """
+
+    def __init__(self, max_statements: int):
+        self.max_statements = max_statements
+
+    async def __call__(self) -> None:
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.budget = self.max_statements
+
+
+def explain(source_engine, statement: str, parameters) -> str:
+    """EXPLAIN plan of a recorded statement, or a note when it cannot be explained."""
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return "(not explained: not a SELECT)"
+    if source_engine is None or source_engine.dialect.is_async:
+        return "(not explained: async engine)"
+    try:
+        with source_engine.connect() as conn:
+            rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).fetchall()
+        return "\n".join(row[0] for row in rows)
+    except Exception as e:
+        return f"(EXPLAIN failed: {e})"
+
+
+def _log_slow_queries(request: Request, slow) -> None:
+    # Runs in a copied context; keep the EXPLAINs out of the request's counts
+    current_query_stats.set(None)
+    for statement, parameters, duration, source_engine in slow:
+        message = f"Slow query ({duration * 1000:.1f} ms) in {request.method} {request.url.path}: {statement}"
+        if settings.debug:
+            message += f"\nParameters: {parameters!r}\n{explain(source_engine, statement, parameters)}"
+        logger.warning(message)
+
+
+async def query_budget_middleware(request: Request, call_next):
+    """
+    Count SQL statements and DB time per request.
+
+    Adds ``X-Query-Count`` and ``Server-Timing`` (``db`` and ``app``) headers,
+    logs statements slower than SLOW_QUERY_MS (with their EXPLAIN plan in
+    debug mode) and checks the route's QueryBudget.
+    """
+    with track_queries() as query_stats:
+        started = time.perf_counter()
+        response = await call_next(request)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        count, db_ms = query_stats.count, query_stats.duration * 1000
+        budget = query_stats.budget
+        if budget is not None and count > budget:
+            detail = (
+                f"{request.method} {route_template(request)} ran {count} SQL statements "
+                f"(budget {budget})"
+            )
+            logger.warning(f"Query budget exceeded: {detail}")
+            if settings.query_budget_enforce:
+                response = JSONResponse(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    content={"error": "Query Budget Exceeded", "detail": detail}
+                )
+
+        response.headers["X-Query-Count"] = str(count)
+        response.headers["Server-Timing"] = (
+            f'db;dur={db_ms:.2f};desc="{count} queries", app;dur={max(elapsed_ms - db_ms, 0):.2f}'
+        )
+
+        if query_stats.slow:
+            # EXPLAIN opens its own connection; keep it off the event loop
+            await run_in_threadpool(_log_slow_queries, request, list(query_stats.slow))
+        return response
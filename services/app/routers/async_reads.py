@@ -0,0 +1,77 @@
+"""
+Async variants of the hottest read endpoints.
+
+Included ahead of the regular routers only when ASYNC_DATABASE is enabled,
+so these handlers take over the same paths and run on the event loop with an
+asyncpg-backed AsyncSession instead of the threadpool. Request and response
+contracts are identical to the sync endpoints documented in the schema.
+"""
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
+from app import schemas
+from app.database import get_async_db
+from app.etag import async_etag_check, async_etag_guard, not_modified
+from app.query_budget import QueryBudget
+from app.pagination import decode_cursor, next_cursor_headers, set_next_cursor
+from app.crud import matches, statistics
+
+router = APIRouter()
+
+
+@router.get(
+    "/matches/",
+    response_model=List[schemas.MatchWithGames],
+    dependencies=[Depends(QueryBudget(3))],
+    include_in_schema=False
+)
+async def list_matches_async(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    tournament_id: Optional[int] = Query(None),
+    player_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None),
+    etag: Optional[str] = Depends(async_etag_check),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Async GET /matches (see the Matches & Games endpoints)."""
+    try:
+        after = decode_cursor(cursor, datetime, int) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    page = dict(skip=skip, limit=limit, tournament_id=tournament_id, player_id=player_id, after=after)
+    if etag:
+        raise not_modified(etag, next_cursor_headers(await matches.get_matches_next_key_async(db, **page)))
+    rows = await matches.get_matches_async(db, **page)
+    set_next_cursor(response, rows, limit, "match_date", "id")
+    return rows
+
+
+@router.get(
+    "/stats/season-standings",
+    response_model=List[schemas.SeasonStandings],
+    dependencies=[Depends(async_etag_guard), Depends(QueryBudget(2))],
+    include_in_schema=False
+)
+async def get_season_standings_async(season_id: Optional[int] = None, db: AsyncSession = Depends(get_async_db)):
+    """Async GET /stats/season-standings (see the Statistics endpoints)."""
+    return await statistics.get_season_standings_async(db, season_id=season_id)
+
+
+@router.get(
+    "/stats/season-standings/{season_id}",
+    response_model=List[schemas.SeasonStandings],
+    dependencies=[Depends(async_etag_guard), Depends(QueryBudget(2))],
+    include_in_schema=False
+)
+async def get_season_standings_by_id_async(season_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Async GET /stats/season-standings/{season_id} (see the Statistics endpoints)."""
+    standings = await statistics.get_season_standings_async(db, season_id=season_id)
+    if not standings:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No standings found for season {season_id}"
+        )
+    return standings
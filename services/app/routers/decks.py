@@ -3,18 +3,20 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app import schemas
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.etag import etag_guard
+from app.query_budget import QueryBudget
 from app.crud import decks
 
 router = APIRouter(prefix="/decks", tags=["Deck Archetypes"])
 
 
-@router.get("/", response_model=List[schemas.DeckArchetype])
+@router.get("/", response_model=List[schemas.DeckArchetype], dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
 def list_deck_archetypes(
     skip: int = 0,
     limit: int = 100,
     archetype_type: Optional[str] = Query(None, description="Filter by archetype type"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get list of all deck archetypes.
@@ -27,7 +29,7 @@ def list_deck_archetypes(
 
 
 @router.get("/{deck_id}", response_model=schemas.DeckArchetype)
-def get_deck_archetype(deck_id: int, db: Session = Depends(get_db)):
+def get_deck_archetype(deck_id: int, db: Session = Depends(get_read_db)):
     """Get a specific deck archetype by ID."""
     db_deck = decks.get_deck_archetype(db, deck_id=deck_id)
     if not db_deck:
@@ -0,0 +1,55 @@
+"""Router for bulk export endpoints."""
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from typing import Iterator, Optional
+from app.database import SessionLocal, ReadSessionLocal, use_read_replica
+from app.crud import export
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _stream_matches(export_format: str, tournament_id: Optional[int], season_id: Optional[int]) -> Iterator[str]:
+    """
+    Produce the export body.
+
+    The session is opened here rather than through get_read_db so that it
+    stays open for as long as the response is being streamed.
+    """
+    db = ReadSessionLocal() if use_read_replica() else SessionLocal()
+    try:
+        records = export.iter_match_records(db, tournament_id=tournament_id, season_id=season_id)
+        if export_format == "csv":
+            yield from export.iter_csv(records)
+        else:
+            yield from export.iter_ndjson(records)
+    finally:
+        db.close()
+
+
+@router.get("/matches")
+def export_matches(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    tournament_id: Optional[int] = Query(None, description="Filter by tournament ID"),
+    season_id: Optional[int] = Query(None, description="Filter by season ID"),
+):
+    """
+    Stream every match with player/deck names, outcome and games.
+
+    Rows are read with a server-side cursor and written as they arrive, so
+    memory use is constant regardless of table size.
+
+    - **format**: `ndjson` (one match per line, games as a nested array) or
+      `csv` (one match per row, games flattened into `game1_*`..`game3_*` columns)
+    - **tournament_id**: Optional filter by tournament
+    - **season_id**: Optional filter by season
+    """
+    return StreamingResponse(
+        _stream_matches(export_format, tournament_id, season_id),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="matches.{export_format}"'}
+    )
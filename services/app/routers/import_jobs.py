@@ -0,0 +1,31 @@
+"""Router for background import job status."""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app import schemas
+from app.database import get_db
+from app.import_jobs import import_jobs
+
+router = APIRouter(prefix="/import-jobs", tags=["Tournaments"])
+
+
+@router.get("/{job_id}", response_model=schemas.ImportJob)
+def get_import_job(job_id: str, db: Session = Depends(get_db)):
+    """
+    Get the progress of an import queued with `POST /tournaments/import-jobs`.
+    
+    - **status**: queued, running, completed or failed
+    - **stage**: current step (resolving names, inserting matches, ...)
+    - **matches_processed / games_processed**: rows written so far
+    - **result**: the import response once completed
+    - **error**: why the import failed
+    
+    Answered by any API worker from the `import_jobs` table (read from the
+    primary, so progress is never behind a replica).
+    """
+    job = import_jobs.get(job_id, db)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import job {job_id} not found"
+        )
+    return job
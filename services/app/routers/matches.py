@@ -1,41 +1,55 @@
 """Router for Match and Game endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import datetime
 from app import schemas
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.etag import etag_check, not_modified
+from app.query_budget import QueryBudget
+from app.pagination import decode_cursor, next_cursor_headers, set_next_cursor
 from app.crud import matches
 
 router = APIRouter(prefix="/matches", tags=["Matches & Games"])
 
 
-@router.get("/", response_model=List[schemas.Match])
+@router.get("/", response_model=List[schemas.MatchWithGames], dependencies=[Depends(QueryBudget(3))])
 def list_matches(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     tournament_id: Optional[int] = Query(None, description="Filter by tournament ID"),
     player_id: Optional[int] = Query(None, description="Filter by player ID"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Keyset cursor from X-Next-Cursor"),
+    etag: Optional[str] = Depends(etag_check),
+    db: Session = Depends(get_read_db)
 ):
     """
-    Get list of all matches.
+    Get list of all matches with their games.
+    
+    Player/deck names and games are resolved in two queries, independent of `limit`.
     
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return
     - **tournament_id**: Optional filter by tournament
     - **player_id**: Optional filter by player (either player1 or player2)
+    - **cursor**: Opaque cursor from the previous page's `X-Next-Cursor` header
+      (keyset pagination; replaces `skip`)
     """
-    return matches.get_matches(
-        db, 
-        skip=skip, 
-        limit=limit, 
-        tournament_id=tournament_id,
-        player_id=player_id
-    )
+    try:
+        after = decode_cursor(cursor, datetime, int) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    page = dict(skip=skip, limit=limit, tournament_id=tournament_id, player_id=player_id, after=after)
+    if etag:
+        raise not_modified(etag, next_cursor_headers(matches.get_matches_next_key(db, **page)))
+    rows = matches.get_matches(db, **page)
+    set_next_cursor(response, rows, limit, "match_date", "id")
+    return rows
 
 
 @router.get("/{match_id}", response_model=schemas.MatchWithGames)
-def get_match(match_id: int, db: Session = Depends(get_db)):
+def get_match(match_id: int, db: Session = Depends(get_read_db)):
     """Get a specific match by ID with all its games."""
     db_match = matches.get_match(db, match_id=match_id)
     if not db_match:
@@ -95,7 +109,7 @@ def delete_match(match_id: int, db: Session = Depends(get_db)):
 # Game endpoints
 
 @router.get("/{match_id}/games", response_model=List[schemas.Game])
-def list_games_for_match(match_id: int, db: Session = Depends(get_db)):
+def list_games_for_match(match_id: int, db: Session = Depends(get_read_db)):
     """Get all games for a specific match."""
     # Check if match exists
     if not matches.get_match(db, match_id=match_id):
@@ -1,20 +1,26 @@
 """Router for Player endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app import schemas
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.etag import etag_check, not_modified
+from app.query_budget import QueryBudget
+from app.pagination import decode_cursor, next_cursor_headers, set_next_cursor
 from app.crud import players
 
 router = APIRouter(prefix="/players", tags=["Players"])
 
 
-@router.get("/", response_model=List[schemas.Player])
+@router.get("/", response_model=List[schemas.Player], dependencies=[Depends(QueryBudget(2))])
 def list_players(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     active_only: bool = Query(False, description="Show only active players"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Keyset cursor from X-Next-Cursor"),
+    etag: Optional[str] = Depends(etag_check),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get list of all players.
@@ -22,12 +28,23 @@ def list_players(
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return
     - **active_only**: Filter to show only active players
+    - **cursor**: Opaque cursor from the previous page's `X-Next-Cursor` header
+      (keyset pagination; replaces `skip`)
     """
-    return players.get_players(db, skip=skip, limit=limit, active_only=active_only)
+    try:
+        after = decode_cursor(cursor, str, int) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    page = dict(skip=skip, limit=limit, active_only=active_only, after=after)
+    if etag:
+        raise not_modified(etag, next_cursor_headers(players.get_players_next_key(db, **page)))
+    rows = players.get_players(db, **page)
+    set_next_cursor(response, rows, limit, "name", "id")
+    return rows
 
 
 @router.get("/{player_id}", response_model=schemas.Player)
-def get_player(player_id: int, db: Session = Depends(get_db)):
+def get_player(player_id: int, db: Session = Depends(get_read_db)):
     """Get a specific player by ID."""
     db_player = players.get_player(db, player_id=player_id)
     if not db_player:
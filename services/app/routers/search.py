@@ -0,0 +1,39 @@
+"""Router for name search (typeahead) endpoints."""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app import schemas
+from app.database import get_read_db
+from app.etag import etag_guard
+from app.query_budget import QueryBudget
+from app.crud import search as search_crud
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+# Budget covers the fallback query when pg_trgm is missing
+@router.get("/", response_model=List[schemas.SearchHit], dependencies=[Depends(etag_guard), Depends(QueryBudget(3))])
+def search(
+    q: str = Query(..., min_length=1, max_length=100, description="Text to search for"),
+    search_type: Optional[str] = Query(
+        None,
+        alias="type",
+        pattern="^(player|deck|tournament|location|season)$",
+        description="Only search this kind of name (default: all)"
+    ),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of hits"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Search player, deck, tournament, season and location names.
+
+    Returns the top hits ranked by relevance: names starting with the query
+    first, then by trigram word similarity, so partial words and small typos
+    still match. Backed by the pg_trgm indexes in `database/10_search_trgm.sql`.
+
+    - **q**: Text to search for (case-insensitive)
+    - **type**: `player`, `deck`, `tournament`, `location` (tournaments held
+      at a matching location) or `season`; all types when omitted
+    - **limit**: Maximum number of hits (1-50, default 10)
+    """
+    return search_crud.search(db, q=q, search_type=search_type, limit=limit)
@@ -3,17 +3,19 @@
 from sqlalchemy.orm import Session
 from typing import List
 from app import schemas
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.etag import etag_guard
+from app.query_budget import QueryBudget
 from app.crud import seasons
 
 router = APIRouter(prefix="/seasons", tags=["Seasons"])
 
 
-@router.get("/", response_model=List[schemas.Season])
+@router.get("/", response_model=List[schemas.Season], dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
 def list_seasons(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get list of all seasons.
@@ -25,7 +27,7 @@ def list_seasons(
 
 
 @router.get("/{season_id}", response_model=schemas.Season)
-def get_season(season_id: int, db: Session = Depends(get_db)):
+def get_season(season_id: int, db: Session = Depends(get_read_db)):
     """Get a specific season by ID."""
     db_season = seasons.get_season(db, season_id=season_id)
     if not db_season:
@@ -3,25 +3,29 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app import schemas
-from app.database import get_db
+from app.database import get_read_db
+from app.etag import etag_guard
+from app.query_budget import QueryBudget
+from app.cache import stats_cache
 from app.crud import statistics
 
 router = APIRouter(prefix="/stats", tags=["Statistics"])
 
 
-@router.get("/players", response_model=List[schemas.PlayerStatistics])
-def get_player_statistics(db: Session = Depends(get_db)):
+@router.get("/players", response_model=List[schemas.PlayerStatistics], dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
+def get_player_statistics(db: Session = Depends(get_read_db)):
     """
     Get statistics for all players.
     
     Returns wins, draws, losses, win rate, and other metrics for each player.
-    Data is sourced from the `player_statistics` database view.
+    Data is sourced from the `player_stat_summary` database view (incrementally
+    maintained counters with the same columns as `player_statistics`).
     """
     return statistics.get_player_statistics(db)
 
 
-@router.get("/players/{player_id}", response_model=schemas.PlayerStatistics)
-def get_player_statistics_by_id(player_id: int, db: Session = Depends(get_db)):
+@router.get("/players/{player_id}", response_model=schemas.PlayerStatistics, dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
+def get_player_statistics_by_id(player_id: int, db: Session = Depends(get_read_db)):
     """
     Get statistics for a specific player.
     
@@ -36,19 +40,20 @@ def get_player_statistics_by_id(player_id: int, db: Session = Depends(get_db)):
     return stats
 
 
-@router.get("/decks", response_model=List[schemas.DeckStatistics])
-def get_deck_statistics(db: Session = Depends(get_db)):
+@router.get("/decks", response_model=List[schemas.DeckStatistics], dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
+def get_deck_statistics(db: Session = Depends(get_read_db)):
     """
     Get statistics for all deck archetypes.
     
     Returns wins, draws, losses, win rate, and other metrics for each deck.
-    Data is sourced from the `deck_statistics` database view.
+    Data is sourced from the `deck_stat_summary` database view (incrementally
+    maintained counters with the same columns as `deck_statistics`).
     """
     return statistics.get_deck_statistics(db)
 
 
-@router.get("/decks/{deck_id}", response_model=schemas.DeckStatistics)
-def get_deck_statistics_by_id(deck_id: int, db: Session = Depends(get_db)):
+@router.get("/decks/{deck_id}", response_model=schemas.DeckStatistics, dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
+def get_deck_statistics_by_id(deck_id: int, db: Session = Depends(get_read_db)):
     """
     Get statistics for a specific deck archetype.
     
@@ -63,20 +68,21 @@ def get_deck_statistics_by_id(deck_id: int, db: Session = Depends(get_db)):
     return stats
 
 
-@router.get("/matchups", response_model=List[schemas.DeckMatchup])
-def get_deck_matchups(db: Session = Depends(get_db)):
+@router.get("/matchups", response_model=List[schemas.DeckMatchup], dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
+def get_deck_matchups(db: Session = Depends(get_read_db)):
     """
     Get matchup statistics for all deck pairings.
     
     Returns head-to-head performance data for deck archetypes.
     Shows total matches, wins for each deck, and win rates.
-    Data is sourced from the `deck_matchups` database view.
+    Data is sourced from the `deck_matchup_summary` database view (incrementally
+    maintained counters with the same columns as `deck_matchups`).
     """
     return statistics.get_deck_matchups(db)
 
 
-@router.get("/matchups/{deck_a_id}/{deck_b_id}", response_model=schemas.DeckMatchup)
-def get_deck_matchup(deck_a_id: int, deck_b_id: int, db: Session = Depends(get_db)):
+@router.get("/matchups/{deck_a_id}/{deck_b_id}", response_model=schemas.DeckMatchup, dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
+def get_deck_matchup(deck_a_id: int, deck_b_id: int, db: Session = Depends(get_read_db)):
     """
     Get matchup statistics for a specific deck pairing.
     
@@ -95,8 +101,8 @@ def get_deck_matchup(deck_a_id: int, deck_b_id: int, db: Session = Depends(get_d
     return matchup
 
 
-@router.get("/season-standings", response_model=List[schemas.SeasonStandings])
-def get_season_standings(season_id: Optional[int] = None, db: Session = Depends(get_db)):
+@router.get("/season-standings", response_model=List[schemas.SeasonStandings], dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
+def get_season_standings(season_id: Optional[int] = None, db: Session = Depends(get_read_db)):
     """
     Get player standings by season with points.
     
@@ -111,8 +117,8 @@ def get_season_standings(season_id: Optional[int] = None, db: Session = Depends(
     return statistics.get_season_standings(db, season_id=season_id)
 
 
-@router.get("/season-standings/{season_id}", response_model=List[schemas.SeasonStandings])
-def get_season_standings_by_id(season_id: int, db: Session = Depends(get_db)):
+@router.get("/season-standings/{season_id}", response_model=List[schemas.SeasonStandings], dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
+def get_season_standings_by_id(season_id: int, db: Session = Depends(get_read_db)):
     """
     Get player standings for a specific season.
     
@@ -126,3 +132,15 @@ def get_season_standings_by_id(season_id: int, db: Session = Depends(get_db)):
             detail=f"No standings found for season {season_id}"
         )
     return standings
+
+
+@router.get("/cache", response_model=schemas.StatsCacheInfo)
+def get_stats_cache_info():
+    """
+    Get statistics cache counters for monitoring.
+    
+    Statistics responses are cached in-process and invalidated whenever
+    matches, games, tournaments or other tracked entities are written.
+    Counters are per worker process.
+    """
+    return stats_cache.stats()
@@ -5,7 +5,9 @@
 import logging
 
 from app import schemas
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.etag import etag_guard
+from app.query_budget import QueryBudget
 from app.crud import tournament_types
 
 logger = logging.getLogger(__name__)
@@ -13,11 +15,11 @@
 router = APIRouter(prefix="/tournament-types", tags=["Tournament Types"])
 
 
-@router.get("/", response_model=List[schemas.TournamentType])
+@router.get("/", response_model=List[schemas.TournamentType], dependencies=[Depends(etag_guard), Depends(QueryBudget(2))])
 def list_tournament_types(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get list of all tournament types.
@@ -29,7 +31,7 @@ def list_tournament_types(
 
 
 @router.get("/{tournament_type_id}", response_model=schemas.TournamentType)
-def get_tournament_type(tournament_type_id: int, db: Session = Depends(get_db)):
+def get_tournament_type(tournament_type_id: int, db: Session = Depends(get_read_db)):
     """Get a specific tournament type by ID."""
     db_tournament_type = tournament_types.get_tournament_type(db, tournament_type_id=tournament_type_id)
     if not db_tournament_type:
@@ -315,6 +315,30 @@ class Config:
         from_attributes = True
 
 
+class MatchResult(MatchWithGames):
+    """Schema for a match with games and its derived outcome."""
+    player1_game_wins: int = Field(0, description="Games won by player 1")
+    player2_game_wins: int = Field(0, description="Games won by player 2")
+    match_winner_id: Optional[int] = Field(None, description="Match winner player ID (null for draws/incomplete)")
+    match_winner_name: Optional[str] = Field(None, description="Match winner name")
+    
+    class Config:
+        from_attributes = True
+
+
+class RoundResults(BaseModel):
+    """Schema for all matches played in a tournament round."""
+    round_number: Optional[int]
+    matches: List[MatchResult] = []
+
+
+class TournamentResults(BaseModel):
+    """Schema for complete tournament results grouped by round."""
+    tournament: Tournament
+    total_matches: int
+    rounds: List[RoundResults] = []
+
+
 # ============================================================================
 # BATCH INSERT SCHEMAS
 # ============================================================================
@@ -408,6 +432,19 @@ class Config:
         from_attributes = True
 
 
+class StatsCacheInfo(BaseModel):
+    """Schema for statistics cache counters."""
+    enabled: bool
+    generation: int
+    entries: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: Optional[float] = None
+
+
 # ============================================================================
 # TOURNAMENT IMPORT SCHEMAS (Complete Tournament Upload)
 # ============================================================================
@@ -452,6 +489,10 @@ class TournamentImportData(BaseModel):
     description: Optional[str] = Field(None, description="Tournament description")
     tournament_type_id: Optional[int] = Field(None, description="Tournament type ID")
     tournament_type_name: Optional[str] = Field(None, max_length=100, description="Tournament type name (unique)")
+    source_id: Optional[str] = Field(
+        None, max_length=100,
+        description="Identifier of the source export (e.g. 'melee:396052'); re-imports with the same id update that tournament"
+    )
 
 
 class TournamentCompleteImport(BaseModel):
@@ -478,10 +519,54 @@ class TournamentImportResponse(BaseModel):
     message: str
     tournament_id: int
     tournament_created: bool
+    status: str = Field("created", description="created, updated or unchanged")
     players_created: int
     decks_created: int
     matches_created: int
     games_created: int
+    matches_updated: int = 0
+    matches_deleted: int = 0
+    matches_unchanged: int = 0
+    games_updated: int = 0
+    games_deleted: int = 0
+
+
+class RawImportResponse(TournamentImportResponse):
+    """Response schema for a raw export import, with the export records that were not imported."""
+    records: int
+    skipped_byes: int
+    skipped_incomplete: int
+    skipped_no_competitors: int
+
+
+class ImportJob(BaseModel):
+    """Status of a background tournament import."""
+    id: str
+    status: str = Field(..., description="queued, running, completed or failed")
+    stage: str = Field(..., description="Current step of the import")
+    tournament_name: str
+    total_matches: int
+    total_games: int
+    matches_processed: int = 0
+    games_processed: int = 0
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    result: Optional[TournamentImportResponse] = None
+
+
+# ============================================================================
+# SEARCH SCHEMAS
+# ============================================================================
+
+class SearchHit(BaseModel):
+    """One ranked result of a name search."""
+    type: str = Field(..., description="player, deck, tournament, location or season")
+    id: int = Field(..., description="ID of the player, deck, season or tournament (for location hits)")
+    name: str
+    location: Optional[str] = Field(None, description="Tournament location (tournament and location hits)")
+    score: float = Field(..., description="Trigram word similarity between the query and the matched text (0-1)")
 
 
 # ============================================================================
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Cold-load time of the dashboard's Tournament Results tab: bare requests vs pooled session.
+
+A cold load (empty st.cache_data) of the tab makes these calls in order:
+
+    GET /seasons
+    GET /tournaments?season_id=<first season>
+    GET /tournaments/<id>/results        (first --tournaments tournaments)
+
+They are replayed two ways:
+
+    bare     requests.get per call: new TCP connection each time, no timeout
+             (what UI/streamlit_app.py did before the shared session)
+    pooled   one keep-alive session from UI/http_client.create_session,
+             built once like the st.cache_resource in the app
+
+Each mode runs --runs times; the pooled session is reused across runs, as it
+is across reruns of the app. Reports median/p95 per-load time and bytes read.
+
+Requires requests (pip install -r ../UI/requirements.txt).
+
+Usage (from the services directory, API running):
+    python benchmarks/dashboard_benchmark.py
+    python benchmarks/dashboard_benchmark.py --base-url https://your-api.railway.app/api/v1 --runs 20
+    python benchmarks/dashboard_benchmark.py --no-gzip --json dashboard.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "UI"))
+
+from http_client import create_session
+
+
+def cold_load(get, base_url: str, tournaments: int) -> int:
+    """Replay one cold load of the Tournament Results tab; returns body bytes received."""
+    received = 0
+
+    def fetch(path, **params):
+        nonlocal received
+        response = get(f"{base_url}{path}", params=params or None)
+        response.raise_for_status()
+        received += len(response.content)
+        return response.json()
+
+    seasons = fetch("/seasons")
+    if not seasons:
+        return received
+    for tournament in fetch("/tournaments", season_id=seasons[0]["id"])[:tournaments]:
+        fetch(f"/tournaments/{tournament['id']}/results")
+    return received
+
+
+def measure(get, base_url: str, tournaments: int, runs: int) -> dict:
+    timings = []
+    received = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        received = cold_load(get, base_url, tournaments)
+        timings.append((time.perf_counter() - started) * 1000)
+    ordered = sorted(timings)
+    return {
+        "median_ms": round(statistics.median(timings), 1),
+        "p95_ms": round(ordered[max(0, int(round(0.95 * len(ordered))) - 1)], 1),
+        "bytes": received,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time cold loads of the dashboard's Tournament Results tab")
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1", help="API base URL")
+    parser.add_argument("--runs", type=int, default=10, help="Cold loads per mode (default: 10)")
+    parser.add_argument("--tournaments", type=int, default=1,
+                        help="Tournament results fetched per load (default: 1, the preselected one)")
+    parser.add_argument("--no-gzip", action="store_true", help="Request uncompressed responses in both modes")
+    parser.add_argument("--json", dest="json_output", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    encoding = {"Accept-Encoding": "identity"} if args.no_gzip else {}
+    session = create_session(gzip=not args.no_gzip)
+    modes = {
+        "bare": lambda url, params=None: requests.get(url, params=params, headers=encoding),
+        "pooled": session.get,
+    }
+
+    results = {"base_url": args.base_url, "runs": args.runs, "tournaments": args.tournaments, "modes": {}}
+    print(f"Tournament Results cold load against {args.base_url} ({args.runs} runs)\n")
+    print(f"{'Mode':<8} {'Median ms':>10} {'p95 ms':>9} {'Bytes':>10}")
+    for name, get in modes.items():
+        result = measure(get, args.base_url, args.tournaments, args.runs)
+        results["modes"][name] = result
+        print(f"{name:<8} {result['median_ms']:>10.1f} {result['p95_ms']:>9.1f} {result['bytes']:>10,}")
+
+    bare, pooled = results["modes"]["bare"]["median_ms"], results["modes"]["pooled"]["median_ms"]
+    if pooled:
+        print(f"\nPooled session: {bare / pooled:.2f}x faster median cold load")
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Results written to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
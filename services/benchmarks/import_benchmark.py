@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark the complete tournament import against the files in imports/.
+
+Each file is imported inside an outer transaction that is rolled back at the
+end, so the database is left untouched. The import's own commit only releases
+a savepoint.
+
+Usage (from the services directory, DATABASE_URL pointing at a database
+with the schema loaded and the referenced seasons present):
+    python benchmarks/import_benchmark.py
+    python benchmarks/import_benchmark.py ../imports/ForTheChildrenShowdown_import.json --repeat 5
+    python benchmarks/import_benchmark.py --bulk   # COPY-based bulk import
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.crud import imports
+from app.database import engine
+
+DEFAULT_GLOB = str(Path(__file__).resolve().parents[2] / "imports" / "*_import.json")
+
+
+def run_once(data: schemas.TournamentCompleteImport, import_fn=imports.import_complete_tournament) -> tuple[float, int]:
+    """Import once inside a rolled-back transaction; return (seconds, statement count)."""
+    statements = 0
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += 1
+
+    with engine.connect() as connection:
+        outer = connection.begin()
+        event.listen(connection, "before_cursor_execute", count)
+        try:
+            db = Session(bind=connection, join_transaction_mode="create_savepoint")
+            started = time.perf_counter()
+            import_fn(db, data)
+            elapsed = time.perf_counter() - started
+            db.close()
+        finally:
+            event.remove(connection, "before_cursor_execute", count)
+            outer.rollback()
+    return elapsed, statements
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark POST /tournaments/import-complete logic")
+    parser.add_argument("files", nargs="*", help=f"Import JSON files (default: {DEFAULT_GLOB})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per file (default: 3)")
+    parser.add_argument("--bulk", action="store_true", help="Benchmark the COPY-based bulk import instead")
+    parser.add_argument("--json", dest="json_output", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    files = [Path(f) for f in args.files] or sorted(Path(DEFAULT_GLOB).parent.glob(Path(DEFAULT_GLOB).name))
+    results = []
+    import_fn = imports.bulk_import_tournament if args.bulk else imports.import_complete_tournament
+
+    print(f"{'File':<55} {'Matches':>7} {'Stmts':>6} {'Median ms':>10} {'Matches/s':>10}")
+    for path in files:
+        with open(path, "r", encoding="utf-8") as f:
+            data = schemas.TournamentCompleteImport(**json.load(f))
+
+        timings = []
+        statement_count = 0
+        for _ in range(args.repeat):
+            elapsed, statement_count = run_once(data, import_fn)
+            timings.append(elapsed)
+
+        median = statistics.median(timings)
+        throughput = len(data.matches) / median if median else 0
+        results.append({
+            "file": path.name,
+            "matches": len(data.matches),
+            "statements": statement_count,
+            "median_ms": round(median * 1000, 2),
+            "matches_per_second": round(throughput, 1),
+        })
+        print(f"{path.name:<55} {len(data.matches):>7} {statement_count:>6} {median * 1000:>10.1f} {throughput:>10.1f}")
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Results written to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
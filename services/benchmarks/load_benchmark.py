@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for the hot read endpoints under many concurrent clients.
+
+Fires requests at GET /stats/season-standings and GET /matches from N
+concurrent clients and reports p50/p99 latency and throughput per endpoint.
+Run it once against a server started with ASYNC_DATABASE=false and once with
+ASYNC_DATABASE=true, save both with --json, then compare them with --compare.
+Start the server with STATS_CACHE_MAX_ENTRIES=0 to measure the database path
+rather than the in-process cache.
+
+Requires httpx (pip install httpx).
+
+Usage (from the services directory, API running):
+    python benchmarks/load_benchmark.py --label sync --json sync.json
+    python benchmarks/load_benchmark.py --label async --json async.json
+    python benchmarks/load_benchmark.py --compare sync.json async.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+DEFAULT_ENDPOINTS = ["/stats/season-standings", "/matches/?limit=100"]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_endpoint(base_url: str, path: str, concurrency: int, total: int, timeout: float) -> dict:
+    """Send `total` requests to one endpoint from `concurrency` clients."""
+    latencies = []
+    errors = 0
+    remaining = total
+    lock = asyncio.Lock()
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+
+        async def worker():
+            nonlocal remaining, errors
+            while True:
+                async with lock:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "endpoint": path,
+        "requests": total,
+        "errors": errors,
+        "concurrency": concurrency,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2) if latencies else 0.0,
+        "requests_per_second": round(total / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def print_results(label: str, results: list):
+    print(f"\n[{label}]")
+    print(f"{'Endpoint':<30} {'Reqs':>6} {'Errs':>5} {'p50 ms':>9} {'p99 ms':>9} {'Req/s':>9}")
+    for r in results:
+        print(
+            f"{r['endpoint']:<30} {r['requests']:>6} {r['errors']:>5} "
+            f"{r['p50_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['requests_per_second']:>9.1f}"
+        )
+
+
+def compare(baseline_path: str, candidate_path: str):
+    """Print two saved runs side by side."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(candidate_path, "r", encoding="utf-8") as f:
+        candidate = json.load(f)
+
+    by_endpoint = {r["endpoint"]: r for r in baseline["results"]}
+    print(f"{'Endpoint':<30} {'Metric':<8} {baseline['label']:>10} {candidate['label']:>10} {'Change':>9}")
+    for r in candidate["results"]:
+        base = by_endpoint.get(r["endpoint"])
+        if not base:
+            continue
+        for metric, key in (("p50 ms", "p50_ms"), ("p99 ms", "p99_ms"), ("req/s", "requests_per_second")):
+            before, after = base[key], r[key]
+            change = f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+            print(f"{r['endpoint']:<30} {metric:<8} {before:>10.1f} {after:>10.1f} {change:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load benchmark for read endpoints")
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1", help="API base URL")
+    parser.add_argument("--endpoint", action="append", dest="endpoints", help=f"Path to hit (default: {DEFAULT_ENDPOINTS})")
+    parser.add_argument("--concurrency", type=int, default=200, help="Concurrent clients (default: 200)")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint (default: 2000)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--label", default="run", help="Name for this run (e.g. sync / async)")
+    parser.add_argument("--json", dest="json_output", help="Optional path to write results as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"), help="Compare two saved runs")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = []
+    for path in args.endpoints or DEFAULT_ENDPOINTS:
+        results.append(asyncio.run(run_endpoint(args.base_url, path, args.concurrency, args.requests, args.timeout)))
+    print_results(args.label, results)
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump({"label": args.label, "results": results}, f, indent=2)
+        print(f"\n✓ Results written to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark converting a large raw MTG Melee export: json.load vs streaming.
+
+A synthetic export is built by repeating the Content[] records of a real
+export --scale times (each copy gets its own round numbers and Guids), then
+converted to the import format two ways:
+
+    load    json.load the whole export, convert, json.dump(indent=2)
+            (what generate_burro_imports.py does by default)
+    stream  app.melee.stream_import: two incremental passes, matches written
+            as they are converted (--stream)
+
+Each mode is timed once untraced, then run again under tracemalloc for its
+peak Python memory. Both outputs are checked to contain the same matches.
+
+Usage (from the services directory; no database needed):
+    python benchmarks/raw_export_benchmark.py
+    python benchmarks/raw_export_benchmark.py --scale 1000 --json raw_export.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import melee
+
+DEFAULT_SOURCE = Path(__file__).resolve().parents[2] / "imports" / "BurroSingles_Monthly_Noviembre_2025.json"
+
+
+def build_synthetic_export(source: Path, scale: int, path: str) -> int:
+    """Write ``scale`` copies of the source's records to ``path``; returns the record count."""
+    with open(source, "r", encoding="utf-8") as f:
+        records = json.load(f)["Content"]
+    rounds = max((r.get("RoundNumber") or 0) for r in records) or 1
+
+    count = 0
+    with open(path, "w", encoding="utf-8") as out:
+        out.write('{"StatusCode":200,"Page":1,"Content":[')
+        for copy in range(scale):
+            for record in records:
+                record = dict(record, Guid=f"{copy:08x}-{record.get('Guid', '')[9:]}")
+                if record.get("RoundNumber"):
+                    record["RoundNumber"] += copy * rounds
+                out.write(("," if count else "") + json.dumps(record, ensure_ascii=False))
+                count += 1
+        out.write(f'],"RecordsTotal":{count},"HasMore":false}}')
+    return count
+
+
+def convert_with_load(path: str, output: str) -> None:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    payload = melee.MeleeExportConverter().add_all(data["Content"]).to_import(1, "Benchmark", "Benchmark")
+    with open(output, "w", encoding="utf-8") as out:
+        json.dump(payload, out, indent=2, ensure_ascii=False)
+
+
+def convert_with_stream(path: str, output: str) -> None:
+    with open(output, "w", encoding="utf-8") as out:
+        melee.stream_import(path, out, 1, "Benchmark", "Benchmark")
+
+
+MODES = {"load": convert_with_load, "stream": convert_with_stream}
+
+
+def measure(fn, path: str, output: str) -> dict:
+    """Seconds for one untraced run and peak traced memory for a second run."""
+    started = time.perf_counter()
+    fn(path, output)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        fn(path, output)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": round(elapsed, 3), "peak_mb": round(peak / 2 ** 20, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark json.load vs streaming raw export conversion")
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE, help="Raw export to scale up")
+    parser.add_argument("--scale", type=int, default=500, help="Copies of the source records (default: 500)")
+    parser.add_argument("--json", dest="json_output", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export_path = os.path.join(tmp, "export.json")
+        records = build_synthetic_export(args.source, args.scale, export_path)
+        size_mb = os.path.getsize(export_path) / 2 ** 20
+        print(f"Synthetic export: {records:,} records, {size_mb:,.1f} MB ({args.scale}x {args.source.name})\n")
+
+        results = {"records": records, "size_mb": round(size_mb, 1), "modes": {}}
+        outputs = {}
+        print(f"{'Mode':<8} {'Seconds':>9} {'Records/s':>11} {'Peak MB':>9}")
+        for name, fn in MODES.items():
+            outputs[name] = os.path.join(tmp, f"{name}.json")
+            result = measure(fn, export_path, outputs[name])
+            result["records_per_second"] = round(records / result["seconds"]) if result["seconds"] else 0
+            results["modes"][name] = result
+            print(f"{name:<8} {result['seconds']:>9.2f} {result['records_per_second']:>11,} {result['peak_mb']:>9.1f}")
+
+        with open(outputs["load"], "r", encoding="utf-8") as a, open(outputs["stream"], "r", encoding="utf-8") as b:
+            same = json.load(a)["matches"] == json.load(b)["matches"]
+        print(f"\n{'✓' if same else '✗'} Outputs {'match' if same else 'differ'}")
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Results written to {args.json_output}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
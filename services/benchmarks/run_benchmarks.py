@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmark suite for the statistics views and API endpoints.
+
+Times, against whatever dataset DATABASE_URL points at (normally one built
+with scripts/generate_dataset.py):
+
+    view:*      SELECT * from each view in 03_views.sql and the counter-backed
+                summary views, with one EXPLAIN (ANALYZE, BUFFERS) plan each
+    endpoint:*  every /stats/* endpoint and GET /matches, called in-process
+                through FastAPI's TestClient (no server needed)
+    import:*    POST /tournaments/import-complete with an import JSON, inside
+                a transaction that is rolled back after every run
+
+The statistics cache is disabled so every request reaches the database.
+Results are written as JSON and can be compared against a saved baseline:
+any benchmark whose median is slower than the baseline by more than
+--tolerance (and by more than --noise-ms) is flagged, and the run exits 1.
+
+Requires httpx for TestClient (pip install httpx).
+
+Usage (from the services directory):
+    python scripts/generate_dataset.py --matches 100k --truncate
+    python benchmarks/run_benchmarks.py --json baseline.json
+    python benchmarks/run_benchmarks.py --json current.json --baseline baseline.json
+    python benchmarks/run_benchmarks.py --compare baseline.json current.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Measure the database, not the in-process cache
+os.environ["STATS_CACHE_MAX_ENTRIES"] = "0"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import engine, get_db
+from app.main import app
+
+VIEWS = [
+    "match_results",
+    "player_statistics",
+    "deck_statistics",
+    "deck_matchups",
+    "player_deck_performance",
+    "tournament_summary",
+    "season_standings",
+    "player_stat_summary",
+    "deck_stat_summary",
+    "deck_matchup_summary",
+]
+
+DEFAULT_IMPORT = Path(__file__).resolve().parents[2] / "imports" / "ForTheChildrenShowdown_import.json"
+
+
+def summarize(timings: list) -> dict:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * len(ordered))) - 1)]
+    return {
+        "runs": len(timings),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "min_ms": round(ordered[0] * 1000, 3),
+    }
+
+
+def time_runs(fn, repeat: int, warmup: int) -> list:
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def dataset_info() -> dict:
+    """Row counts and identifiers the endpoint benchmarks use as parameters."""
+    with engine.connect() as conn:
+        info = {
+            table: conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+            for table in ("seasons", "tournaments", "players", "deck_archetypes", "matches", "games")
+        }
+        info["postgres"] = conn.execute(text("SHOW server_version")).scalar()
+        info["season_id"] = conn.execute(text("SELECT id FROM seasons ORDER BY start_date DESC LIMIT 1")).scalar()
+        info["tournament_id"] = conn.execute(
+            text("SELECT tournament_id FROM matches GROUP BY tournament_id ORDER BY COUNT(*) DESC LIMIT 1")
+        ).scalar()
+        info["player_id"] = conn.execute(
+            text("SELECT player_id FROM player_stat_summary ORDER BY total_matches DESC LIMIT 1")
+        ).scalar()
+        decks = conn.execute(
+            text("SELECT deck_id FROM deck_stat_summary ORDER BY total_matches DESC LIMIT 2")
+        ).scalars().all()
+        info["deck_ids"] = decks
+    return info
+
+
+def plan_summary(plan: dict) -> dict:
+    """Headline numbers from an EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) plan."""
+    root = plan["Plan"]
+    return {
+        "execution_ms": plan.get("Execution Time"),
+        "planning_ms": plan.get("Planning Time"),
+        "rows": root.get("Actual Rows"),
+        "shared_hit_blocks": root.get("Shared Hit Blocks"),
+        "shared_read_blocks": root.get("Shared Read Blocks"),
+    }
+
+
+def bench_views(repeat: int, warmup: int, keep_plans: bool) -> dict:
+    results = {}
+    with engine.connect() as conn:
+        for view in VIEWS:
+            query = text(f"SELECT * FROM {view}")
+            timings = time_runs(lambda: conn.execute(query).fetchall(), repeat, warmup)
+            plan = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT * FROM {view}")).scalar()[0]
+            result = summarize(timings)
+            result["explain"] = plan_summary(plan)
+            if keep_plans:
+                result["plan"] = plan
+            results[f"view:{view}"] = result
+            print(f"  view:{view:<38} {result['median_ms']:>10.2f} ms")
+    return results
+
+
+def endpoint_paths(info: dict) -> list:
+    paths = [
+        "/api/v1/stats/players",
+        "/api/v1/stats/decks",
+        "/api/v1/stats/matchups",
+        "/api/v1/stats/season-standings",
+        "/api/v1/matches/?limit=100",
+    ]
+    if info["season_id"]:
+        paths.append(f"/api/v1/stats/season-standings/{info['season_id']}")
+    if info["player_id"]:
+        paths.append(f"/api/v1/stats/players/{info['player_id']}")
+    if info["deck_ids"]:
+        paths.append(f"/api/v1/stats/decks/{info['deck_ids'][0]}")
+    if len(info["deck_ids"]) == 2:
+        paths.append(f"/api/v1/stats/matchups/{info['deck_ids'][0]}/{info['deck_ids'][1]}")
+    if info["tournament_id"]:
+        paths.append(f"/api/v1/matches/?limit=100&tournament_id={info['tournament_id']}")
+        paths.append(f"/api/v1/tournaments/{info['tournament_id']}/results")
+    return paths
+
+
+def bench_endpoints(client: TestClient, paths: list, repeat: int, warmup: int) -> dict:
+    results = {}
+    for path in paths:
+        responses = []
+
+        def call():
+            response = client.get(path)
+            response.raise_for_status()
+            responses.append(response)
+
+        result = summarize(time_runs(call, repeat, warmup))
+        result["queries"] = int(responses[-1].headers.get("X-Query-Count", 0))
+        result["bytes"] = len(responses[-1].content)
+        results[f"endpoint:GET {path}"] = result
+        print(f"  endpoint:GET {path:<34} {result['median_ms']:>10.2f} ms  {result['queries']:>3} queries")
+    return results
+
+
+def bench_import(client: TestClient, import_path: Path, season_id: int, repeat: int, warmup: int) -> dict:
+    """Time POST /tournaments/import-complete; each run is rolled back."""
+    with open(import_path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    payload["season_id"] = season_id
+
+    def call():
+        with engine.connect() as connection:
+            outer = connection.begin()
+            db = Session(bind=connection, join_transaction_mode="create_savepoint")
+            app.dependency_overrides[get_db] = lambda: db
+            try:
+                response = client.post("/api/v1/tournaments/import-complete", json=payload)
+                response.raise_for_status()
+            finally:
+                app.dependency_overrides.pop(get_db, None)
+                db.close()
+                outer.rollback()
+
+    result = summarize(time_runs(call, repeat, warmup))
+    result["matches"] = len(payload["matches"])
+    results = {f"import:POST import-complete ({import_path.name})": result}
+    print(f"  import:{import_path.name:<39} {result['median_ms']:>10.2f} ms")
+    return results
+
+
+def compare(baseline: dict, current: dict, tolerance: float, noise_ms: float) -> list:
+    """Print a comparison table and return the names of regressed benchmarks."""
+    regressions = []
+    if baseline.get("dataset", {}).get("matches") != current.get("dataset", {}).get("matches"):
+        print(
+            f"! Dataset differs: baseline has {baseline.get('dataset', {}).get('matches')} matches, "
+            f"current has {current.get('dataset', {}).get('matches')}"
+        )
+    print(f"\n{'Benchmark':<70} {'Baseline':>10} {'Current':>10} {'Change':>8}")
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            print(f"{name:<70} {'-':>10} {result['median_ms']:>10.2f} {'new':>8}")
+            continue
+        before, after = base["median_ms"], result["median_ms"]
+        change = (after - before) / before if before else 0.0
+        regressed = change > tolerance and after - before > noise_ms
+        marker = "  ✗ REGRESSION" if regressed else ""
+        print(f"{name:<70} {before:>10.2f} {after:>10.2f} {change * 100:>+7.1f}%{marker}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark statistics views and API endpoints")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs first (default: 1)")
+    parser.add_argument("--only", choices=["views", "endpoints", "import"], action="append",
+                        help="Run only these sections (repeatable)")
+    parser.add_argument("--import-file", type=Path, default=DEFAULT_IMPORT,
+                        help=f"Import JSON for the import benchmark (default: {DEFAULT_IMPORT.name})")
+    parser.add_argument("--no-plans", action="store_true", help="Omit full EXPLAIN plans from the JSON output")
+    parser.add_argument("--json", dest="json_output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Compare this run against a saved JSON result")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="Compare two saved results and exit")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown as a fraction of the baseline median (default: 0.2)")
+    parser.add_argument("--noise-ms", type=float, default=1.0,
+                        help="Ignore slowdowns smaller than this many ms (default: 1.0)")
+    args = parser.parse_args()
+
+    if args.compare:
+        regressions = compare(load_results(args.compare[0]), load_results(args.compare[1]), args.tolerance, args.noise_ms)
+        return 1 if regressions else 0
+
+    sections = set(args.only or ["views", "endpoints", "import"])
+    info = dataset_info()
+    print(
+        f"Dataset: {info['matches']:,} matches, {info['games']:,} games, {info['players']:,} players, "
+        f"{info['tournaments']:,} tournaments (PostgreSQL {info['postgres']})"
+    )
+
+    results = {}
+    if "views" in sections:
+        results.update(bench_views(args.repeat, args.warmup, keep_plans=not args.no_plans))
+    if sections & {"endpoints", "import"}:
+        with TestClient(app) as client:
+            if "endpoints" in sections:
+                results.update(bench_endpoints(client, endpoint_paths(info), args.repeat, args.warmup))
+            if "import" in sections and info["season_id"]:
+                results.update(bench_import(client, args.import_file, info["season_id"], args.repeat, args.warmup))
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "repeat": args.repeat,
+        "dataset": info,
+        "results": results,
+    }
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2, default=str)
+        print(f"\n✓ Results written to {args.json_output}")
+
+    if args.baseline:
+        regressions = compare(load_results(args.baseline), run, args.tolerance, args.noise_ms)
+        if regressions:
+            print(f"\n✗ {len(regressions)} benchmark(s) slower than baseline by more than {args.tolerance:.0%}")
+            return 1
+        print("\n✓ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Bulk-load tournament import files with COPY.
+
+Loads any number of TournamentCompleteImport JSON files (the format accepted
+by POST /tournaments/import-complete) directly into the database, without
+one HTTP request per file. For each file, the rows are COPYed into temporary
+staging tables and merged into players, deck_archetypes, tournaments,
+matches and games with set-based statements, in one transaction.
+A failing file is rolled back and reported; the others still load.
+Files that were already imported are skipped, or updated in place when
+their content changed, instead of being loaded twice.
+
+With --raw the files are raw MTG Melee exports, converted while they are
+streamed (no intermediate *_import.json). The tournament name is taken from
+the file name ("OG_Monthly_Enero_2026.json" -> "OG Monthly Enero 2026").
+
+Usage (from the services directory, DATABASE_URL pointing at the target
+database):
+    python scripts/bulk_import.py ../imports/*_import.json
+    python scripts/bulk_import.py ../imports/OG_*_import.json --season-id 3
+    python scripts/bulk_import.py ../imports/*_import.json --dry-run
+    python scripts/bulk_import.py --raw ../imports/OG_Monthly_Enero_2026.json --season-id 2 --location "Only Games"
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import melee, schemas
+from app.crud import imports
+from app.database import SessionLocal, engine
+
+
+def read_import(path: Path, season_id) -> schemas.TournamentCompleteImport:
+    """Read a TournamentCompleteImport JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    if season_id is not None:
+        raw["season_id"] = season_id
+    return schemas.TournamentCompleteImport(**raw)
+
+
+def read_raw_export(path: Path, args) -> schemas.TournamentCompleteImport:
+    """Stream a raw Melee export and convert it to the import format."""
+    with open(path, "rb") as f:
+        converter = melee.convert_export(f)
+    counts = converter.skip_counts()
+    print(
+        f"  {path.name}: {counts['records']} records, {counts['skipped_byes']} byes, "
+        f"{counts['skipped_incomplete']} incomplete, {counts['skipped_no_competitors']} without 2 competitors skipped"
+    )
+    name = path.stem.replace("_", " ")
+    return schemas.TournamentCompleteImport(**converter.to_import(
+        args.season_id, name, args.location, args.format, args.tournament_type
+    ))
+
+
+def load_file(data: schemas.TournamentCompleteImport, dry_run: bool):
+    """Import one file's data; returns (response, seconds)."""
+    started = time.perf_counter()
+    if dry_run:
+        # The import's commit only releases a savepoint; the outer transaction is rolled back
+        with engine.connect() as connection:
+            outer = connection.begin()
+            db = Session(bind=connection, join_transaction_mode="create_savepoint")
+            try:
+                response = imports.bulk_import_tournament(db, data)
+            finally:
+                db.close()
+                outer.rollback()
+    else:
+        db = SessionLocal()
+        try:
+            response = imports.bulk_import_tournament(db, data)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    return response, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load tournament import JSON files with COPY")
+    parser.add_argument("files", nargs="+", type=Path, help="TournamentCompleteImport JSON files (raw exports with --raw)")
+    parser.add_argument("--season-id", type=int, help="Override season_id in every file")
+    parser.add_argument("--dry-run", action="store_true", help="Load each file and roll it back")
+    parser.add_argument("--raw", action="store_true", help="Files are raw MTG Melee exports (requires --season-id)")
+    parser.add_argument("--location", help="Tournament location for --raw files")
+    parser.add_argument("--format", default="Premodern", help="Tournament format for --raw files (default: Premodern)")
+    parser.add_argument("--tournament-type", default="LGS Tournament", help="Tournament type for --raw files")
+    args = parser.parse_args()
+    if args.raw and args.season_id is None:
+        parser.error("--raw requires --season-id")
+
+    total_matches = total_games = failures = 0
+    started = time.perf_counter()
+    print(f"{'File':<55} {'Tourn.':>7} {'Status':>9} {'Matches':>8} {'Games':>7} {'New pl.':>8} {'ms':>9}")
+    for path in args.files:
+        try:
+            data = read_raw_export(path, args) if args.raw else read_import(path, args.season_id)
+            response, elapsed = load_file(data, args.dry_run)
+        except (OSError, json.JSONDecodeError, ValidationError, ValueError, SQLAlchemyError) as e:
+            failures += 1
+            print(f"{path.name:<55} ✗ {str(e).splitlines()[0]}")
+            continue
+        total_matches += response.matches_created
+        total_games += response.games_created
+        print(
+            f"{path.name:<55} {response.tournament_id:>7} {response.status:>9} {response.matches_created:>8} "
+            f"{response.games_created:>7} {response.players_created:>8} {elapsed * 1000:>9.1f}"
+        )
+
+    elapsed = time.perf_counter() - started
+    rate = total_matches / elapsed if elapsed else 0
+    verb = "Rolled back" if args.dry_run else "Loaded"
+    print(
+        f"\n{'✓' if not failures else '✗'} {verb} {total_matches:,} matches and {total_games:,} games from "
+        f"{len(args.files) - failures}/{len(args.files)} files in {elapsed:.2f}s ({rate:,.0f} matches/s)"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
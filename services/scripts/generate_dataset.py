@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic tournament dataset at benchmark scale.
+
+Produces seasons covering --start-date to --end-date (today by default),
+tournaments of every tournament type spread over that range, a player pool where
+regulars attend far more often than casuals, deck archetypes with a skewed
+(Zipf) metagame share, Swiss rounds paired by points, and best-of-3 games
+whose results follow player skill, deck strength and deck-vs-deck matchups.
+The same --seed and --end-date always produce the same data.
+
+Rows are loaded with COPY. Matches and games go in batches, one transaction
+each. The per-statement match outcome triggers are disabled for the batch's
+COPYs and match_outcomes is refreshed once per batch instead, so the
+statistic counters (07_stat_totals.sql) and data_version stay consistent.
+
+Usage (from the services directory, DATABASE_URL pointing at a database
+with the schema, views and 07/08 scripts applied):
+    python scripts/generate_dataset.py --matches 10k
+    python scripts/generate_dataset.py --matches 1m --seed 7 --truncate
+    python scripts/generate_dataset.py --matches 10m --batch-size 200000
+
+--truncate removes ALL seasons, tournaments, players, decks, matches and
+games first (tournament types are kept).
+"""
+
+import argparse
+import csv
+import io
+import math
+import random
+import sys
+import time
+from datetime import date, timedelta
+from itertools import accumulate
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.database import engine
+
+TOURNAMENT_TYPE_WEIGHTS = {
+    "LGS Tournament": 70,
+    "Online Tournament": 20,
+    "Special Event": 8,
+    "Nationals": 2,
+}
+
+# (min players, max players, weight) per tournament size band
+TOURNAMENT_SIZES = [(8, 16, 30), (17, 32, 40), (33, 64, 20), (65, 256, 10)]
+
+FORMATS = ["Standard", "Pioneer", "Modern", "Legacy", "Pauper", "Premodern"]
+LOCATIONS = [
+    "Local Game Store - Downtown", "Game Haven", "Convention Center", "Card Kingdom Annex",
+    "The Dragon's Lair", "Comic Corner", "Online - MTGO", "Online - Arena", "Community Hall",
+]
+FIRST_NAMES = [
+    "Alice", "Bruno", "Carla", "Diego", "Elena", "Felipe", "Gabriela", "Hugo", "Irene", "Javier",
+    "Karla", "Luis", "Mariana", "Nicolas", "Olga", "Pablo", "Quinn", "Rosa", "Sergio", "Tania",
+    "Ulises", "Valeria", "Walter", "Ximena", "Yolanda", "Zoe",
+]
+LAST_NAMES = [
+    "Alvarez", "Brenes", "Castro", "Duarte", "Espinoza", "Fonseca", "Gomez", "Herrera", "Jimenez",
+    "Lopez", "Mora", "Navarro", "Ortiz", "Perez", "Quesada", "Rojas", "Solano", "Torres", "Vargas",
+    "Zuniga",
+]
+COLORS = [
+    ("W", "Mono White"), ("U", "Mono Blue"), ("B", "Mono Black"), ("R", "Mono Red"), ("G", "Mono Green"),
+    ("WU", "Azorius"), ("UB", "Dimir"), ("BR", "Rakdos"), ("RG", "Gruul"), ("GW", "Selesnya"),
+    ("WB", "Orzhov"), ("UR", "Izzet"), ("BG", "Golgari"), ("RW", "Boros"), ("GU", "Simic"),
+    ("WUB", "Esper"), ("UBR", "Grixis"), ("BRG", "Jund"), ("RGW", "Naya"), ("GWU", "Bant"),
+    ("WBG", "Abzan"), ("URW", "Jeskai"), ("BGU", "Sultai"), ("RWB", "Mardu"), ("GUR", "Temur"),
+]
+STRATEGIES = ["Aggro", "Control", "Midrange", "Combo", "Tempo", "Ramp"]
+
+DRAW_GAME_RATE = 0.02
+
+
+def parse_count(value: str) -> int:
+    """Parse 10k / 1m / 2.5M style counts."""
+    value = value.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    if multiplier != 1:
+        value = value[:-1]
+    return int(float(value) * multiplier)
+
+
+def zipf_cum_weights(n: int, exponent: float):
+    return list(accumulate(1 / (rank ** exponent) for rank in range(1, n + 1)))
+
+
+def sigmoid(x: float) -> float:
+    return 1 / (1 + math.exp(-x))
+
+
+class CopyBuffer:
+    """Accumulate rows for one table and COPY them in CSV format."""
+
+    def __init__(self, table: str, columns):
+        self.table = table
+        self.columns = columns
+        self.rows = 0
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def add(self, row) -> None:
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def flush(self, cursor) -> int:
+        rows = self.rows
+        if rows:
+            self._buffer.seek(0)
+            cursor.copy_expert(
+                f"COPY {self.table} ({', '.join(self.columns)}) FROM STDIN WITH (FORMAT csv)",
+                self._buffer
+            )
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self.rows = 0
+        return rows
+
+
+def reserve_ids(cursor, table: str, count: int) -> int:
+    """Advance the table's id sequence by `count` and return the first reserved id."""
+    cursor.execute(
+        "SELECT setval(pg_get_serial_sequence(%s, 'id'), nextval(pg_get_serial_sequence(%s, 'id')) + %s - 1)",
+        (table, table, count)
+    )
+    return cursor.fetchone()[0] - count + 1
+
+
+def plan_tournaments(rng: random.Random, target_matches: int):
+    """Tournament sizes until the Swiss match count reaches the target."""
+    bands = [(low, high) for low, high, _ in TOURNAMENT_SIZES]
+    weights = [weight for _, _, weight in TOURNAMENT_SIZES]
+    planned, total = [], 0
+    while total < target_matches:
+        low, high = rng.choices(bands, weights=weights)[0]
+        size = rng.randint(low, high)
+        rounds = max(3, math.ceil(math.log2(size)))
+        planned.append((size, rounds))
+        total += rounds * (size // 2)
+    return planned, total
+
+
+class Generator:
+    def __init__(self, args, type_ids):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.type_names = list(TOURNAMENT_TYPE_WEIGHTS)
+        self.type_ids = type_ids
+        self.planned, self.planned_matches = plan_tournaments(self.rng, args.matches)
+        self.player_count = args.players or max(256, args.matches // 40)
+        self.deck_count = args.decks
+        # Consecutive seasons covering [start_date, end_date]; the last one may end later
+        self.span_days = (args.end_date - args.start_date).days
+        self.season_count = self.span_days // args.season_days + 1
+
+    def load_reference_data(self, cursor) -> dict:
+        """COPY seasons, tournaments, players and decks; keep what match generation needs."""
+        rng, args = self.rng, self.args
+        counts = {}
+
+        seasons = CopyBuffer("seasons", ["id", "name", "start_date", "end_date", "description"])
+        self.first_season_id = reserve_ids(cursor, "seasons", self.season_count)
+        self.season_starts = []
+        for n in range(self.season_count):
+            start = args.start_date + timedelta(days=args.season_days * n)
+            self.season_starts.append(start)
+            seasons.add([
+                self.first_season_id + n, f"{args.tag} Season {n + 1}", start,
+                start + timedelta(days=args.season_days - 1), f"Synthetic season (seed {args.seed})"
+            ])
+        counts["seasons"] = seasons.flush(cursor)
+
+        decks = CopyBuffer("deck_archetypes", ["id", "name", "color_identity", "archetype_type", "description"])
+        self.first_deck_id = reserve_ids(cursor, "deck_archetypes", self.deck_count)
+        names = set()
+        for n in range(self.deck_count):
+            colors, guild = rng.choice(COLORS)
+            strategy = rng.choice(STRATEGIES)
+            name = f"{args.tag} {guild} {strategy}"
+            suffix = 2
+            while name in names:
+                name = f"{args.tag} {guild} {strategy} {suffix}"
+                suffix += 1
+            names.add(name)
+            decks.add([self.first_deck_id + n, name, colors, strategy, None])
+        counts["deck_archetypes"] = decks.flush(cursor)
+        # Meta share follows deck rank; strength and matchups are independent noise
+        self.deck_cum_weights = zipf_cum_weights(self.deck_count, args.meta_skew)
+        self.deck_power = [rng.gauss(0, 0.25) for _ in range(self.deck_count)]
+        self.matchup = [[0.0] * self.deck_count for _ in range(self.deck_count)]
+        for a in range(self.deck_count):
+            for b in range(a + 1, self.deck_count):
+                edge = rng.gauss(0, 0.3)
+                self.matchup[a][b], self.matchup[b][a] = edge, -edge
+
+        players = CopyBuffer("players", ["id", "name", "registration_date", "active"])
+        self.first_player_id = reserve_ids(cursor, "players", self.player_count)
+        for n in range(self.player_count):
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {n + 1}"
+            registered = args.start_date - timedelta(days=rng.randint(0, 365))
+            players.add([self.first_player_id + n, name, registered, rng.random() > 0.05])
+        counts["players"] = players.flush(cursor)
+        # Attendance follows player rank (regulars vs. casuals)
+        self.player_cum_weights = zipf_cum_weights(self.player_count, args.attendance_skew)
+        self.player_skill = [rng.gauss(0, 0.6) for _ in range(self.player_count)]
+        self.player_main_deck = rng.choices(range(self.deck_count), cum_weights=self.deck_cum_weights, k=self.player_count)
+
+        tournaments = CopyBuffer(
+            "tournaments",
+            ["id", "season_id", "tournament_type_id", "name", "tournament_date", "location", "format", "description"]
+        )
+        self.first_tournament_id = reserve_ids(cursor, "tournaments", len(self.planned))
+        # Spread over the whole range, never after end_date (tournament_date <= CURRENT_DATE)
+        self.tournament_dates = sorted(
+            args.start_date + timedelta(days=rng.randint(0, self.span_days)) for _ in self.planned
+        )
+        type_weights = list(TOURNAMENT_TYPE_WEIGHTS.values())
+        for n, tournament_date in enumerate(self.tournament_dates):
+            season = (tournament_date - args.start_date).days // args.season_days
+            type_name = rng.choices(self.type_names, weights=type_weights)[0]
+            tournament_format = rng.choice(FORMATS)
+            tournaments.add([
+                self.first_tournament_id + n, self.first_season_id + season, self.type_ids[type_name],
+                f"{tournament_format} {type_name} #{n + 1}", tournament_date,
+                rng.choice(LOCATIONS), tournament_format, None
+            ])
+        counts["tournaments"] = tournaments.flush(cursor)
+        return counts
+
+    def entrants(self, size: int):
+        """Distinct player indexes for one tournament, weighted by attendance."""
+        size = min(size, self.player_count)
+        chosen = dict.fromkeys(
+            self.rng.choices(range(self.player_count), cum_weights=self.player_cum_weights, k=size * 2)
+        )
+        entrants = list(chosen)[:size]
+        while len(entrants) < size:
+            candidate = self.rng.randrange(self.player_count)
+            if candidate not in chosen:
+                chosen[candidate] = None
+                entrants.append(candidate)
+        return entrants
+
+    def pick_deck(self, player: int) -> int:
+        if self.rng.random() < 0.6:
+            return self.player_main_deck[player]
+        return self.rng.choices(range(self.deck_count), cum_weights=self.deck_cum_weights)[0]
+
+    def play_match(self, p1: int, p2: int, d1: int, d2: int):
+        """Best-of-3 games as (game_number, winner index, result); returns (games, p1 wins, p2 wins)."""
+        edge = self.player_skill[p1] - self.player_skill[p2] + self.deck_power[d1] - self.deck_power[d2]
+        p1_game_win = sigmoid(edge + self.matchup[d1][d2])
+        games, wins = [], [0, 0]
+        for game_number in range(1, 4):
+            if 2 in wins:
+                break
+            if self.rng.random() < DRAW_GAME_RATE:
+                games.append((game_number, p1, "DRAW"))
+                continue
+            if self.rng.random() < p1_game_win:
+                wins[0] += 1
+                games.append((game_number, p1, "WIN"))
+            else:
+                wins[1] += 1
+                games.append((game_number, p2, "WIN"))
+        return games, wins[0], wins[1]
+
+    def swiss(self, tournament_index: int, size: int, rounds: int, matches: CopyBuffer, games: CopyBuffer, next_match_id: int) -> int:
+        """Pair and play every round of one tournament; returns the next free match id."""
+        rng = self.rng
+        tournament_id = self.first_tournament_id + tournament_index
+        tournament_date = self.tournament_dates[tournament_index]
+        players = self.entrants(size)
+        decks = {p: self.pick_deck(p) for p in players}
+        points = dict.fromkeys(players, 0)
+        played = set()
+
+        for round_number in range(1, rounds + 1):
+            order = players[:]
+            rng.shuffle(order)
+            order.sort(key=points.__getitem__, reverse=True)
+            if len(order) % 2:
+                # Byes are not stored as matches; the lowest-ranked player gets the points
+                points[order.pop()] += 3
+            match_date = f"{tournament_date} {9 + round_number:02d}:00:00"
+            while order:
+                a = order.pop(0)
+                opponent = next((i for i, b in enumerate(order) if (a, b) not in played), 0)
+                b = order.pop(opponent)
+                played.update(((a, b), (b, a)))
+
+                match_games, a_wins, b_wins = self.play_match(a, b, decks[a], decks[b])
+                points[a] += 3 if a_wins >= 2 else 1 if b_wins < 2 else 0
+                points[b] += 3 if b_wins >= 2 else 1 if a_wins < 2 else 0
+
+                a_id, b_id = self.first_player_id + a, self.first_player_id + b
+                matches.add([
+                    next_match_id, tournament_id, a_id, b_id,
+                    self.first_deck_id + decks[a], self.first_deck_id + decks[b],
+                    round_number, match_date, "COMPLETED"
+                ])
+                for game_number, winner, result in match_games:
+                    games.add([next_match_id, game_number, self.first_player_id + winner, result, rng.randint(15, 60)])
+                next_match_id += 1
+        return next_match_id
+
+
+MATCH_COLUMNS = [
+    "id", "tournament_id", "player1_id", "player2_id", "player1_deck_id", "player2_deck_id",
+    "round_number", "match_date", "match_status",
+]
+GAME_COLUMNS = ["match_id", "game_number", "winner_id", "game_result", "duration_minutes"]
+DEFERRED_TRIGGERS = [("matches", "matches_outcome_insert"), ("games", "games_outcome_insert")]
+
+
+def load_batch(connection, matches: CopyBuffer, games: CopyBuffer, first_id: int, last_id: int):
+    """COPY one batch of matches/games and refresh their outcomes in one transaction."""
+    with connection.cursor() as cursor:
+        for table, trigger in DEFERRED_TRIGGERS:
+            cursor.execute(f"ALTER TABLE {table} DISABLE TRIGGER {trigger}")
+        match_rows = matches.flush(cursor)
+        game_rows = games.flush(cursor)
+        cursor.execute(
+            "SELECT refresh_match_outcomes(ARRAY(SELECT generate_series(%s, %s)))",
+            (first_id, last_id)
+        )
+        for table, trigger in DEFERRED_TRIGGERS:
+            cursor.execute(f"ALTER TABLE {table} ENABLE TRIGGER {trigger}")
+    connection.commit()
+    return match_rows, game_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic tournament dataset via COPY")
+    parser.add_argument("--matches", type=parse_count, default=parse_count("10k"),
+                        help="Approximate number of matches, e.g. 10k, 100k, 1m, 10m (default: 10k)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--players", type=parse_count, help="Player pool size (default: matches / 40, min 256)")
+    parser.add_argument("--decks", type=int, default=60, help="Deck archetypes (default: 60)")
+    parser.add_argument("--season-days", type=int, default=91, help="Season length in days (default: 91)")
+    parser.add_argument("--start-date", type=date.fromisoformat, default=date(2020, 1, 1),
+                        help="First season start date (default: 2020-01-01)")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(),
+                        help="Latest tournament date, at most today (default: today)")
+    parser.add_argument("--meta-skew", type=float, default=1.1, help="Zipf exponent of deck meta share (default: 1.1)")
+    parser.add_argument("--attendance-skew", type=float, default=0.8,
+                        help="Zipf exponent of player attendance (default: 0.8)")
+    parser.add_argument("--batch-size", type=parse_count, default=parse_count("50k"),
+                        help="Matches per COPY transaction (default: 50k)")
+    parser.add_argument("--tag", default="Synthetic", help="Prefix for season and deck names (default: Synthetic)")
+    parser.add_argument("--truncate", action="store_true", help="Delete all existing tournament data first")
+    args = parser.parse_args()
+    if not args.start_date <= args.end_date <= date.today():
+        parser.error("--end-date must be between --start-date and today")
+
+    started = time.perf_counter()
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            if args.truncate:
+                cursor.execute(
+                    "TRUNCATE seasons, tournaments, players, deck_archetypes, matches, games, match_outcomes "
+                    "RESTART IDENTITY CASCADE"
+                )
+                cursor.execute("SELECT rebuild_stat_totals()")
+                print("✓ Existing tournament data truncated")
+            cursor.execute("SELECT name, id FROM tournament_types WHERE name = ANY(%s)", (list(TOURNAMENT_TYPE_WEIGHTS),))
+            type_ids = dict(cursor.fetchall())
+        missing = set(TOURNAMENT_TYPE_WEIGHTS) - set(type_ids)
+        if missing:
+            print(f"✗ Missing tournament types: {', '.join(sorted(missing))}")
+            return 1
+
+        generator = Generator(args, type_ids)
+        with connection.cursor() as cursor:
+            counts = generator.load_reference_data(cursor)
+            # Exact unless a tournament is larger than the player pool (unused ids are skipped)
+            first_match_id = reserve_ids(cursor, "matches", generator.planned_matches)
+        connection.commit()
+        print(
+            f"✓ {counts['seasons']} seasons, {counts['tournaments']} tournaments, {counts['players']} players, "
+            f"{counts['deck_archetypes']} decks ({time.perf_counter() - started:.1f}s)"
+        )
+
+        matches = CopyBuffer("matches", MATCH_COLUMNS)
+        games = CopyBuffer("games", GAME_COLUMNS)
+        next_match_id = batch_first_id = first_match_id
+        total_matches = total_games = 0
+        for index, (size, rounds) in enumerate(generator.planned):
+            next_match_id = generator.swiss(index, size, rounds, matches, games, next_match_id)
+            if matches.rows >= args.batch_size or index == len(generator.planned) - 1:
+                match_rows, game_rows = load_batch(connection, matches, games, batch_first_id, next_match_id - 1)
+                total_matches += match_rows
+                total_games += game_rows
+                batch_first_id = next_match_id
+                elapsed = time.perf_counter() - started
+                print(f"  {total_matches:>10,} matches  {total_games:>11,} games  {total_matches / elapsed:>9,.0f} matches/s")
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✓ Loaded {total_matches:,} matches and {total_games:,} games in {elapsed:.1f}s (seed {args.seed})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Rebuild or verify the incrementally maintained statistic counters.
+
+    rebuild  Recompute every counter table from match_outcomes
+    check    Diff the counter-backed summaries against player_statistics,
+             deck_statistics and deck_matchups; exits 1 on any difference
+
+Usage (from the services directory, DATABASE_URL pointing at a database
+with 07_stat_totals.sql applied):
+    python scripts/stat_totals.py check
+    python scripts/stat_totals.py rebuild
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.crud import statistics
+from app.database import SessionLocal
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the statistic counter tables")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        if args.command == "rebuild":
+            statistics.rebuild_stat_totals(db)
+            print(f"✓ Statistic totals rebuilt in {(time.perf_counter() - started) * 1000:.1f} ms")
+            return 0
+
+        differences = statistics.check_stat_totals(db)
+        elapsed = (time.perf_counter() - started) * 1000
+        if not differences:
+            print(f"✓ Statistic totals match the views ({elapsed:.1f} ms)")
+            return 0
+
+        print(f"✗ {len(differences)} differing rows ({elapsed:.1f} ms)")
+        for diff in differences:
+            print(f"  [{diff['statistic']}] {diff['source']}: {json.dumps(diff['row'], default=str)}")
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
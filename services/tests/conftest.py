@@ -0,0 +1,77 @@
+"""
+Shared test fixtures.
+
+Tests that need PostgreSQL use the ``db`` fixture and are skipped when the
+database configured by DATABASE_URL cannot be reached.
+"""
+from datetime import date
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import models
+from app.database import SessionLocal, engine
+
+
+@pytest.fixture(scope="session")
+def database_available() -> None:
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except SQLAlchemyError as exc:
+        pytest.skip(f"PostgreSQL not available: {exc.__class__.__name__}")
+
+
+@pytest.fixture
+def db(database_available):
+    """A session whose changes are rolled back after the test."""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture
+def make_tournament(db):
+    """
+    Factory seeding a tournament in a new season, flushed but never committed.
+
+    ``make_tournament(match_count)`` returns a tournament whose two players
+    played ``match_count`` completed two-game matches.
+    """
+    def make(match_count: int = 3) -> models.Tournament:
+        tag = uuid.uuid4().hex[:8]
+        season = models.Season(name=f"Test Season {tag}", start_date=date(2025, 1, 1))
+        tournament_type = models.TournamentType(name=f"Test Type {tag}", points_win=3, points_draw=1)
+        deck = models.DeckArchetype(name=f"Test Deck {tag}")
+        alice, bob = models.Player(name=f"Alice {tag}"), models.Player(name=f"Bob {tag}")
+        db.add_all([season, tournament_type, deck, alice, bob])
+        db.flush()
+
+        tournament = models.Tournament(
+            season_id=season.id, tournament_type_id=tournament_type.id,
+            name=f"Test Tournament {tag}", tournament_date=date(2025, 1, 4)
+        )
+        db.add(tournament)
+        db.flush()
+
+        for round_number in range(1, match_count + 1):
+            match = models.Match(
+                tournament_id=tournament.id, player1_id=alice.id, player2_id=bob.id,
+                player1_deck_id=deck.id, player2_deck_id=deck.id, round_number=round_number
+            )
+            db.add(match)
+            db.flush()
+            db.add_all([
+                models.Game(match_id=match.id, game_number=n, winner_id=alice.id, game_result="WIN")
+                for n in (1, 2)
+            ])
+        db.flush()
+        db.expire_all()
+        return tournament
+
+    return make
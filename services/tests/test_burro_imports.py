@@ -0,0 +1,44 @@
+"""Deck and player name merging in imports/generate_burro_imports.py batch mode."""
+from pathlib import Path
+import sys
+
+from app.melee import MeleeExportConverter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "imports"))
+
+from generate_burro_imports import merge_dictionaries
+
+
+def competitor(player_id: int, name: str, decks, wins: int) -> dict:
+    return {
+        "Team": {"Players": [{"ID": player_id, "Name": name, "Username": name.lower()}]},
+        "Decklists": [{"DecklistName": deck} for deck in decks],
+        "GameWins": wins,
+    }
+
+
+def converter(*records) -> MeleeExportConverter:
+    return MeleeExportConverter().add_all(
+        {"TournamentId": 1, "RoundNumber": 1, "ResultString": "won 2-0-0", "Competitors": list(pair)}
+        for pair in records
+    )
+
+
+def test_merged_deck_names_match_the_matches():
+    # Player 1 registered two lists; the first is spelled differently than elsewhere
+    first = converter((competitor(1, "Ana", ["BUG  control", "Elves"], 2), competitor(2, "Ben", ["Elves"], 0)))
+    second = converter((competitor(1, "Ana", ["BUG Control"], 2), competitor(3, "Cy", ["BUG Control"], 1)))
+    third = converter((competitor(2, "Ben", ["bug control"], 2), competitor(3, "Cy", ["BUG Control"], 0)))
+
+    merge_dictionaries([first, second, third])
+
+    for conv in (first, second, third):
+        payload = conv.to_import(season_id=1, name="Test")
+        deck_names = {deck["name"] for deck in payload["decks"]}
+        match_decks = {
+            name for match in payload["matches"]
+            for name in (match["player1_deck_name"], match["player2_deck_name"])
+        }
+        assert match_decks <= deck_names
+        assert "BUG  control" not in deck_names and "bug control" not in deck_names
+    assert {deck["name"] for deck in first.to_import(1, "Test")["decks"]} == {"BUG Control", "Elves"}
@@ -0,0 +1,22 @@
+"""Statement counts of the match list queries."""
+from app.crud import matches
+from app.database import track_queries
+
+
+def count_get_matches(db, **kwargs):
+    db.expire_all()
+    with track_queries() as stats:
+        rows = matches.get_matches(db, **kwargs)
+    return stats.count, rows
+
+
+def test_get_matches_statement_count_does_not_grow_with_limit(db, make_tournament):
+    tournament = make_tournament(match_count=3)
+
+    one_count, one = count_get_matches(db, limit=1, tournament_id=tournament.id)
+    all_count, everything = count_get_matches(db, limit=100, tournament_id=tournament.id)
+
+    assert len(one) == 1
+    assert len(everything) == 3
+    assert all(len(match.games) == 2 for match in everything)
+    assert one_count == all_count
@@ -0,0 +1,49 @@
+"""
+season_standings_for() must only read the requested season's matches.
+
+Sequential scans are disabled for the test's transaction: on the few rows
+seeded here the planner would otherwise scan whole tables regardless, and
+the point is that an index-driven plan restricted to the season exists.
+"""
+import json
+
+from sqlalchemy import text
+
+CHECKED_RELATIONS = {"matches", "match_outcomes"}
+
+
+def iter_nodes(node):
+    """Yield every node of an EXPLAIN JSON plan tree."""
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_nodes(child)
+
+
+def season_plan(db, season_id: int) -> dict:
+    plan = db.execute(
+        text("EXPLAIN (ANALYZE, FORMAT JSON) SELECT * FROM season_standings_for(:season_id)"),
+        {"season_id": season_id}
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def test_season_standings_scan_only_that_season(db, make_tournament):
+    season_id = make_tournament(match_count=2).season_id
+    # Other seasons' matches that must not be read
+    make_tournament(match_count=5)
+    make_tournament(match_count=5)
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+
+    root = season_plan(db, season_id)
+
+    scans = [node for node in iter_nodes(root) if node.get("Relation Name") in CHECKED_RELATIONS]
+    assert scans, json.dumps(root, indent=2)
+    for node in scans:
+        rows_read = node.get("Actual Rows", 0) * node.get("Actual Loops", 1)
+        removed = node.get("Rows Removed by Filter", 0) + node.get("Rows Removed by Index Recheck", 0)
+        # Each of the two player perspectives reads the season's 2 matches once
+        assert rows_read + removed <= 2 * 2, (
+            f"{node['Node Type']} on {node['Relation Name']} read {rows_read} rows, removed {removed}"
+        )
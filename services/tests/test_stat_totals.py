@@ -0,0 +1,50 @@
+"""The trigger-maintained statistic counters (07_stat_totals.sql) stay equal to the views."""
+import uuid
+
+from sqlalchemy import select
+
+from app import models
+from app.crud import statistics
+
+
+def test_counters_follow_match_and_game_writes(db, make_tournament):
+    tournament = make_tournament(match_count=4)
+    first, second, third, fourth = db.scalars(
+        select(models.Match).where(models.Match.tournament_id == tournament.id).order_by(models.Match.round_number)
+    ).all()
+    alice_id, bob_id = first.player1_id, first.player2_id
+    assert statistics.check_stat_totals(db) == []
+
+    # Insert: a match on a new deck, so a new matchup and player/deck pair appear
+    other_deck = models.DeckArchetype(name=f"Test Deck {uuid.uuid4().hex[:8]}")
+    db.add(other_deck)
+    db.flush()
+    extra = models.Match(
+        tournament_id=tournament.id, player1_id=bob_id, player2_id=alice_id,
+        player1_deck_id=other_deck.id, player2_deck_id=first.player1_deck_id, round_number=5
+    )
+    db.add(extra)
+    db.flush()
+    db.add_all([
+        models.Game(match_id=extra.id, game_number=1, winner_id=bob_id, game_result="WIN"),
+        models.Game(match_id=extra.id, game_number=2, winner_id=alice_id, game_result="WIN"),
+        models.Game(match_id=extra.id, game_number=3, winner_id=bob_id, game_result="WIN"),
+    ])
+    db.flush()
+    assert statistics.check_stat_totals(db) == []
+
+    # Update: flip a match's winner, turn one into a draw, cancel another
+    for game in first.games:
+        game.winner_id = bob_id
+    second.games[1].game_result = "DRAW"
+    third.match_status = "CANCELLED"
+    db.flush()
+    assert statistics.check_stat_totals(db) == []
+
+    # Delete: a single game, then whole matches (games cascade)
+    db.delete(fourth.games[1])
+    db.flush()
+    db.delete(second)
+    db.delete(extra)
+    db.flush()
+    assert statistics.check_stat_totals(db) == []
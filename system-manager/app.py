@@ -11,11 +11,15 @@
 from typing import List, Dict, Optional
 from datetime import datetime
 import json
+import time
 
 # ============================================================================
 # Configuration - Works in both local and Railway environments
 # ============================================================================
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
+IMPORT_POLL_SECONDS = 0.5
+SEARCH_LIMIT = 20
+IMPORT_TIMEOUT_SECONDS = 600
 
 # Initialize session state
 if 'language' not in st.session_state:
@@ -89,13 +93,20 @@ def make_request(method: str, endpoint: str, data: Optional[Dict] = None, use_ap
         else:
             return False, {"error": f"Unknown method: {method}"}
         
-        if response.status_code in [200, 201]:
+        if response.status_code in [200, 201, 202]:
             return True, response.json()
         else:
             return False, {"error": response.text, "status_code": response.status_code}
     except Exception as e:
         return False, {"error": str(e)}
 
+
+def search_names(query: str, search_type: str, limit: int = SEARCH_LIMIT) -> tuple[bool, List[Dict]]:
+    """Ranked name hits from the API's trigram search (GET /search) for one type"""
+    if not query.strip():
+        return True, []
+    return make_request("GET", "search/", {"q": query.strip(), "type": search_type, "limit": limit})
+
 # ============================================================================
 # SEASON TAB
 # ============================================================================
@@ -110,17 +121,17 @@ def render_season_tab():
         season_search = st.text_input("Search by season name (partial match):", key="season_search")
         
         if season_search:
-            success, data = make_request("GET", "seasons")
+            success, filtered = search_names(season_search, "season")
             if success:
-                seasons = data if isinstance(data, list) else data.get('data', [])
-                filtered = [s for s in seasons if season_search.lower() in str(s.get('name', '')).lower()]
-                
                 if filtered:
-                    season_options = {f"{s['id']}: {s['name']}": s for s in filtered}
+                    season_options = {f"{s['id']}: {s['name']}": s['id'] for s in filtered}
                     selected = st.selectbox("Select season:", options=list(season_options.keys()))
                     
                     if selected:
-                        season = season_options[selected]
+                        success, season = make_request("GET", f"seasons/{season_options[selected]}")
+                        if not success:
+                            st.markdown(f"<div class='error-box'>❌ Error fetching season: {season.get('error')}</div>", unsafe_allow_html=True)
+                            return
                         st.write("**Current Details:**")
                         st.json(season)
                         
@@ -145,6 +156,8 @@ def render_season_tab():
                                     st.markdown(f"<div class='error-box'>❌ Error: {response.get('error')}</div>", unsafe_allow_html=True)
                 else:
                     st.info("No seasons found matching that name.")
+            else:
+                st.markdown(f"<div class='error-box'>❌ Search failed: {filtered.get('error')}</div>", unsafe_allow_html=True)
         else:
             st.info("Enter a season name to search.")
     
@@ -182,31 +195,33 @@ def render_tournament_tab():
         st.subheader("Search & Update Existing Tournament")
         search_col1, search_col2 = st.columns(2)
         with search_col1:
-            # Fetch tournaments once for dropdown search
-            all_tournaments_success, all_tournaments_data = make_request("GET", "tournaments")
-            all_tournaments = all_tournaments_data if all_tournaments_success and isinstance(all_tournaments_data, list) else all_tournaments_data.get('data', []) if all_tournaments_success else []
-            tournament_name_options = ["(Any)"] + [f"{t['id']}: {t['name']}" for t in all_tournaments]
-            tournament_name_selected = st.selectbox("Search by tournament name:", options=tournament_name_options, key="tournament_name_search_select")
-            tournament_name_search = None if tournament_name_selected == "(Any)" else tournament_name_selected.split(": ",1)[1]
+            tournament_name_search = st.text_input("Search by tournament name (partial):", key="tournament_name_search")
         with search_col2:
             tournament_location_search = st.text_input("Search by location (partial):", key="tournament_location_search")
         
         if tournament_name_search or tournament_location_search:
-            tournaments = all_tournaments
-            if tournaments:
-                filtered = tournaments
-                
-                if tournament_name_search:
-                    filtered = [t for t in filtered if tournament_name_search.lower() in str(t.get('name', '')).lower()]
-                if tournament_location_search:
-                    filtered = [t for t in filtered if tournament_location_search.lower() in str(t.get('location', '')).lower()]
-                
+            # Name and location hits are both tournaments; with both filters keep the overlap
+            if tournament_name_search:
+                success, filtered = search_names(tournament_name_search, "tournament")
+                if success and tournament_location_search:
+                    success, location_hits = search_names(tournament_location_search, "location")
+                    if success:
+                        location_ids = {t['id'] for t in location_hits}
+                        filtered = [t for t in filtered if t['id'] in location_ids]
+                    else:
+                        filtered = location_hits
+            else:
+                success, filtered = search_names(tournament_location_search, "location")
+            if success:
                 if filtered:
-                    tournament_options = {f"{t['id']}: {t['name']} ({t.get('location', 'N/A')})": t for t in filtered}
+                    tournament_options = {f"{t['id']}: {t['name']} ({t.get('location') or 'N/A'})": t['id'] for t in filtered}
                     selected = st.selectbox("Select tournament:", options=list(tournament_options.keys()))
                     
                     if selected:
-                        tournament = tournament_options[selected]
+                        success, tournament = make_request("GET", f"tournaments/{tournament_options[selected]}")
+                        if not success:
+                            st.markdown(f"<div class='error-box'>❌ Error fetching tournament: {tournament.get('error')}</div>", unsafe_allow_html=True)
+                            return
                         st.write("**Current Details:**")
                         st.json(tournament)
                         
@@ -258,6 +273,8 @@ def render_tournament_tab():
                                     st.markdown(f"<div class='error-box'>❌ Error: {response.get('error')}</div>", unsafe_allow_html=True)
                 else:
                     st.info("No tournaments found matching those criteria.")
+            else:
+                st.markdown(f"<div class='error-box'>❌ Search failed: {filtered.get('error')}</div>", unsafe_allow_html=True)
         else:
             st.info("Enter a tournament name or location to search.")
     
@@ -328,30 +345,39 @@ def render_match_tab():
     with col1:
         st.subheader("Search & Update Existing Match")
         search_col1, search_col2 = st.columns(2)
+        # Resolve the typed names to IDs with the search endpoint, then let the API filter matches
+        match_params = {}
+        unmatched_filter = False
         with search_col1:
-            # Fetch tournaments for dropdown filter
-            t_success, t_data = make_request("GET", "tournaments")
-            tournaments_for_filter = t_data if t_success and isinstance(t_data, list) else t_data.get('data', []) if t_success else []
-            t_options = ["(Any)"] + [f"{t['id']}: {t['name']}" for t in tournaments_for_filter]
-            tournament_filter_selected = st.selectbox("Filter by tournament name:", options=t_options, key="match_tournament_filter_select")
-            tournament_filter = None if tournament_filter_selected == "(Any)" else tournament_filter_selected.split(": ",1)[1]
+            tournament_filter = st.text_input("Filter by tournament name:", key="match_tournament_filter")
+            if tournament_filter:
+                t_success, t_hits = search_names(tournament_filter, "tournament")
+                if t_success and t_hits:
+                    t_options = {f"{t['id']}: {t['name']}": t['id'] for t in t_hits}
+                    tournament_selected = st.selectbox("Tournament:", options=list(t_options.keys()), key="match_tournament_filter_select")
+                    match_params["tournament_id"] = t_options[tournament_selected]
+                else:
+                    unmatched_filter = True
+                    st.info("No tournaments found matching that name.")
         with search_col2:
             player_filter = st.text_input("Filter by player name:", key="match_player_filter")
+            if player_filter:
+                p_success, p_hits = search_names(player_filter, "player")
+                if p_success and p_hits:
+                    p_options = {f"{p['id']}: {p['name']}": p['id'] for p in p_hits}
+                    player_selected = st.selectbox("Player:", options=list(p_options.keys()), key="match_player_filter_select")
+                    match_params["player_id"] = p_options[player_selected]
+                else:
+                    unmatched_filter = True
+                    st.info("No players found matching that name.")
         
-        if tournament_filter or player_filter:
-            success, data = make_request("GET", "matches")
+        if match_params and not unmatched_filter:
+            success, data = make_request("GET", "matches", match_params)
             if success:
-                matches = data if isinstance(data, list) else data.get('data', [])
-                filtered = matches
-                
-                if tournament_filter:
-                    # Need to get tournament names - simplified for now
-                    filtered = [m for m in filtered if tournament_filter.lower() in str(m).lower()]
-                if player_filter:
-                    filtered = [m for m in filtered if player_filter.lower() in str(m.get('player1_name', '')).lower() or player_filter.lower() in str(m.get('player2_name', '')).lower()]
+                filtered = data if isinstance(data, list) else data.get('data', [])
                 
                 if filtered:
-                    match_options = {f"{m['id']}: {m.get('player1_name', 'P1')} vs {m.get('player2_name', 'P2')} (R{m.get('round_number', '?')})": m for m in filtered[:20]}
+                    match_options = {f"{m['id']}: {m.get('player1_name', 'P1')} vs {m.get('player2_name', 'P2')} (R{m.get('round_number', '?')})": m for m in filtered}
                     selected = st.selectbox("Select match:", options=list(match_options.keys()))
                     
                     if selected:
@@ -456,7 +482,7 @@ def render_match_tab():
                             st.info("All 3 games already exist for this match.")
                 else:
                     st.info("No matches found matching those criteria.")
-        else:
+        elif not (tournament_filter or player_filter):
             st.info("Enter a tournament name or player name to search.")
     
     with col2:
@@ -510,6 +536,43 @@ def render_match_tab():
 # IMPORT TAB
 # ============================================================================
 
+def wait_for_import_job(job: Dict) -> tuple[bool, Dict]:
+    """
+    Poll a background import job, showing its progress, until it finishes.
+
+    A failed poll (e.g. a 404 from an API worker that cannot see the job)
+    does not end the wait; polling continues until the timeout and the last
+    error is reported only then.
+    """
+    progress_bar = st.progress(0.0, text="Import queued...")
+    deadline = time.monotonic() + IMPORT_TIMEOUT_SECONDS
+    poll_error = None
+    while job.get("status") in ("queued", "running"):
+        total = (job.get("total_matches") or 0) + (job.get("total_games") or 0)
+        done = (job.get("matches_processed") or 0) + (job.get("games_processed") or 0)
+        progress_bar.progress(
+            min(done / total, 1.0) if total else 0.0,
+            text=f"{job.get('stage', '').capitalize()}: {job.get('matches_processed', 0)}/{job.get('total_matches', 0)} matches, "
+                 f"{job.get('games_processed', 0)}/{job.get('total_games', 0)} games"
+        )
+        if time.monotonic() > deadline:
+            message = f"Import job {job['id']} still {job.get('stage')} after {IMPORT_TIMEOUT_SECONDS}s"
+            if poll_error:
+                message += f" (last poll failed: {poll_error})"
+            return False, {"error": message}
+        time.sleep(IMPORT_POLL_SECONDS)
+        success, polled = make_request("GET", f"import-jobs/{job['id']}")
+        if not success:
+            poll_error = polled.get("error")
+            continue
+        poll_error = None
+        job = polled
+    progress_bar.empty()
+    if job.get("status") == "failed":
+        return False, {"error": job.get("error")}
+    return True, job.get("result") or {}
+
+
 def render_import_tab():
     st.header("📤 Tournament Import")
     st.markdown("Upload a JSON file to import a full tournament (tournament, players, decks, matches, games) through the API in one step.")
@@ -550,25 +613,26 @@ def render_import_tab():
                     st.metric("Games", total_games)
 
             if st.button("🚀 Import Tournament", type="primary", use_container_width=True):
-                with st.spinner("Importing tournament..."):
-                    success, response = make_request("POST", "tournaments/import-complete", tournament_data)
-                    if success:
-                        st.markdown(f"<div class='success-box'>✅ Tournament imported successfully!</div>", unsafe_allow_html=True)
-                        col1, col2, col3, col4, col5 = st.columns(5)
-                        with col1:
-                            st.metric("Tournament", "Created" if response.get("tournament_created") else "Exists")
-                        with col2:
-                            st.metric("Players", response.get("players_created", 0))
-                        with col3:
-                            st.metric("Decks", response.get("decks_created", 0))
-                        with col4:
-                            st.metric("Matches", response.get("matches_created", 0))
-                        with col5:
-                            st.metric("Games", response.get("games_created", 0))
-                        if response.get("message"):
-                            st.info(response["message"])
-                    else:
-                        st.markdown(f"<div class='error-box'>❌ Error: {response.get('error')}</div>", unsafe_allow_html=True)
+                success, response = make_request("POST", "tournaments/import-jobs", tournament_data)
+                if success:
+                    success, response = wait_for_import_job(response)
+                if success:
+                    st.markdown(f"<div class='success-box'>✅ Tournament imported successfully!</div>", unsafe_allow_html=True)
+                    col1, col2, col3, col4, col5 = st.columns(5)
+                    with col1:
+                        st.metric("Tournament", "Created" if response.get("tournament_created") else "Exists")
+                    with col2:
+                        st.metric("Players", response.get("players_created", 0))
+                    with col3:
+                        st.metric("Decks", response.get("decks_created", 0))
+                    with col4:
+                        st.metric("Matches", response.get("matches_created", 0))
+                    with col5:
+                        st.metric("Games", response.get("games_created", 0))
+                    if response.get("message"):
+                        st.info(response["message"])
+                else:
+                    st.markdown(f"<div class='error-box'>❌ Error: {response.get('error')}</div>", unsafe_allow_html=True)
         except json.JSONDecodeError as e:
             st.markdown(f"<div class='error-box'>❌ Invalid JSON: {str(e)}</div>", unsafe_allow_html=True)
         except Exception as e: